@@ -0,0 +1,84 @@
+import argparse
+import os
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'pages')
+
+
+def base_slug(slug):
+    """Fixture slug without the '--<n>' repeat suffix"""
+    name, sep, suffix = slug.rpartition('--')
+    return name if sep and suffix.isdigit() else slug
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Serve /listing/<slug> from fixtures/pages/<slug>.html with optional added latency"""
+
+    latency_ms = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=PAGES_DIR, **kwargs)
+
+    def do_GET(self):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        if self.path.startswith('/listing/'):
+            slug = self.path[len('/listing/'):].split('?')[0].strip('/')
+            # "<slug>--<n>" serves the same fixture under a distinct URL for repeated runs
+            self.path = f"/{base_slug(slug)}.html"
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """Local HTTP server for the fixture corpus, run on a background thread"""
+
+    def __init__(self, host='127.0.0.1', port=0, latency_ms=0):
+        handler = type('Handler', (FixtureHandler,), {'latency_ms': latency_ms})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def listing_url(self, slug):
+        return f"{self.base_url}/listing/{slug}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def fixture_slugs():
+    return sorted(name[:-len('.html')] for name in os.listdir(PAGES_DIR) if name.endswith('.html'))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve the benchmark fixture pages')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=int, default=0)
+    args = parser.parse_args()
+
+    server = FixtureServer(port=args.port, latency_ms=args.latency_ms)
+    print(f"Serving {len(fixture_slugs())} fixture pages at {server.base_url}/listing/<slug>")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
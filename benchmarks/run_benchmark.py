@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Offline scraping benchmark
+
+Serves the fixture corpus in benchmarks/fixtures/pages from a local HTTP
+server and runs ImprovedSuperteamBountyScraper (description + prizes in one
+visit) and PrizeExtractor on its own against it at several concurrency
+levels. Reports pages/sec, p50/p95 per-page latency, peak RSS of the whole
+process tree (Python + Chromium) and extraction accuracy against
+fixtures/expected.json, plus the startup cost of the main.py entry point.
+
+    python benchmarks/run_benchmark.py --concurrency 1 2 4 8 --repeat 5
+    python benchmarks/run_benchmark.py --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.append(os.path.join(ROOT_DIR, 'src'))
+
+from bounty_scraper import ImprovedSuperteamBountyScraper
+from browser_manager import BrowserManager, process_tree_rss
+from fixture_server import FixtureServer, base_slug, fixture_slugs
+from page_pool import AdaptiveRateLimiter, PagePool
+from prize_extractor import PrizeExtractor
+from run_metrics import RunMetrics
+from snapshot_archive import SnapshotArchive
+from state_store import BountyStateStore
+from strategy_ranker import StrategyRanker
+
+EXPECTED_FILE = os.path.join(BENCH_DIR, 'fixtures', 'expected.json')
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+with open(EXPECTED_FILE, 'r', encoding='utf-8') as f:
+    EXPECTED = json.load(f)
+
+
+class PeakRssSampler:
+    """Sample process-tree RSS on a background thread and keep the peak"""
+
+    def __init__(self, interval=0.1):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._use_proc = os.path.isdir('/proc')
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, process_tree_rss(os.getpid()))
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        if self._use_proc:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+        else:
+            # Without /proc, fall back to the largest single process (KB on Linux)
+            usage = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+            self.peak = usage * 1024
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def score(expected, description=None, country=None, total_reward=None, prizes=None, fields=None):
+    """Return {field: bool} for the fields that were extracted"""
+    checks = {
+        'description': lambda: expected['description_contains'] in (description or ''),
+        'country': lambda: country == expected['country'],
+        'total_reward': lambda: total_reward == expected['total_reward'],
+        'prizes': lambda: [[p['position'], p['amount']] for p in (prizes or [])] == expected['prizes'],
+    }
+    return {field: checks[field]() for field in fields or checks}
+
+
+def isolated_components(tmp_dir, concurrency):
+    """Scraper and PrizeExtractor that write to a scratch directory instead of data/ and output/"""
+    store = BountyStateStore(os.path.join(tmp_dir, 'state.db'))
+    archive = SnapshotArchive(root=os.path.join(tmp_dir, 'snapshots'))
+    # Production settings, so accuracy is measured with the order real runs use
+    ranker = StrategyRanker(state_store=store)
+    metrics = RunMetrics()
+
+    # Unlimited, so the benchmark measures the scraper rather than the rate limit
+    rate_limiter = AdaptiveRateLimiter(0)
+    prize_extractor = PrizeExtractor(snapshot_archive=archive, state_store=store, rate_limiter=rate_limiter)
+    prize_extractor.strategy_ranker = ranker
+    prize_extractor.metrics = metrics
+    scraper = ImprovedSuperteamBountyScraper(
+        concurrency=concurrency, requests_per_second=0, prize_extractor=prize_extractor,
+        request_filter=prize_extractor.request_filter, snapshot_archive=archive, state_store=store,
+        rate_limiter=rate_limiter
+    )
+    scraper.strategy_ranker = ranker
+    scraper.metrics = metrics
+    return scraper, prize_extractor
+
+
+async def bench_scraper(urls, concurrency, tmp_dir):
+    """Full scrape (description, country, prizes) through scrape_urls"""
+    scraper, _ = isolated_components(tmp_dir, concurrency)
+    latencies = []
+    scrape_page = scraper.scrape_bounty_from_url
+
+    async def timed(page, url, debug=False):
+        started = time.perf_counter()
+        try:
+            return await scrape_page(page, url, debug=debug)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    scraper.scrape_bounty_from_url = timed
+    results = await scraper.scrape_urls(urls)
+
+    scores = []
+    for index, url in enumerate(urls):
+        expected = EXPECTED[base_slug(scraper.extract_slug_from_url(url))]
+        result = results.get(index) or {}
+        prize = scraper._prize_results_by_url.get(url) or {}
+        scores.append(score(
+            expected,
+            description=result.get('description'),
+            country=result.get('country_restriction'),
+            total_reward=prize.get('total_reward'),
+            prizes=(prize.get('prize_breakdown') or {}).get('individual_prizes'),
+        ))
+    return latencies, scores
+
+
+async def bench_prizes(urls, concurrency, tmp_dir):
+    """PrizeExtractor alone: navigate, wait, click View More, extract"""
+    _, prize_extractor = isolated_components(tmp_dir, concurrency)
+    latencies = []
+
+    async def handle(page, url):
+        started = time.perf_counter()
+        try:
+            return await prize_extractor.extract_prizes_for_bounty(page, url)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    browser_manager = BrowserManager(request_filter=prize_extractor.request_filter, max_pages=concurrency)
+    try:
+        pool = PagePool(size=concurrency, rate_limiter=AdaptiveRateLimiter(0), browser_manager=browser_manager)
+        results = await pool.run(urls, handle)
+    finally:
+        await browser_manager.close()
+
+    scores = []
+    for index, url in enumerate(urls):
+        expected = EXPECTED[base_slug(prize_extractor.extract_slug_from_url(url))]
+        prize = results.get(index) or {}
+        scores.append(score(
+            expected,
+            total_reward=prize.get('total_reward'),
+            prizes=(prize.get('prize_breakdown') or {}).get('individual_prizes'),
+            fields=['total_reward', 'prizes'],
+        ))
+    return latencies, scores
+
+
+MODES = {'scraper': bench_scraper, 'prizes': bench_prizes}
+
+
+async def run_once(mode, server, slugs, concurrency, repeat):
+    urls = [server.listing_url(f"{slug}--{i}") for i in range(repeat) for slug in slugs]
+    with tempfile.TemporaryDirectory() as tmp_dir, PeakRssSampler() as rss:
+        started = time.perf_counter()
+        latencies, scores = await MODES[mode](urls, concurrency, tmp_dir)
+        elapsed = time.perf_counter() - started
+
+    field_totals = {}
+    for page_scores in scores:
+        for field, ok in page_scores.items():
+            hits, total = field_totals.get(field, (0, 0))
+            field_totals[field] = (hits + int(ok), total + 1)
+    correct = sum(hits for hits, _ in field_totals.values())
+    checked = sum(total for _, total in field_totals.values())
+
+    return {
+        'mode': mode,
+        'concurrency': concurrency,
+        'pages': len(urls),
+        'seconds': round(elapsed, 3),
+        'pages_per_sec': round(len(urls) / elapsed, 3) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 1),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 1),
+        'peak_rss_mb': round(rss.peak / (1024 * 1024), 1),
+        'accuracy': round(correct / checked, 4) if checked else 0.0,
+        'field_accuracy': {field: round(hits / total, 4) for field, (hits, total) in field_totals.items()},
+    }
+
+
+# What a fresh interpreter imports before it can do any work
+STARTUP_TARGETS = {
+    'interpreter_ms': 'pass',
+    'entry_point_ms': 'import main',
+    'full_stack_ms': 'import bounty_scraper, prize_extractor, streaming_pipeline',
+}
+
+
+def measure_startup(runs=5):
+    """Median wall time, in fresh interpreters, of importing main.py versus the whole scraping stack"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT_DIR, os.path.join(ROOT_DIR, 'src')]))
+    startup = {}
+    for name, statement in STARTUP_TARGETS.items():
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, '-c', statement], cwd=ROOT_DIR, env=env, check=True,
+                           stdout=subprocess.DEVNULL)
+            timings.append(time.perf_counter() - started)
+        startup[name] = round(statistics.median(timings) * 1000, 1)
+    return startup
+
+
+def print_startup(startup):
+    print(f"\n🚀 Startup: interpreter {startup['interpreter_ms']:.0f} ms, "
+          f"main.py entry point {startup['entry_point_ms']:.0f} ms, "
+          f"full scraping stack {startup['full_stack_ms']:.0f} ms")
+
+
+def print_table(runs):
+    print(f"\n{'mode':<8} {'conc':>4} {'pages':>5} {'pages/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'RSS MB':>8} {'accuracy':>8}")
+    for run in runs:
+        print(f"{run['mode']:<8} {run['concurrency']:>4} {run['pages']:>5} {run['pages_per_sec']:>8.2f} "
+              f"{run['p50_ms']:>8.0f} {run['p95_ms']:>8.0f} {run['peak_rss_mb']:>8.0f} {run['accuracy']:>8.2%}")
+
+
+def compare(runs, baseline_file, tolerance, startup=None):
+    """Print deltas against a baseline report; return False on a regression"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    baseline = {(r['mode'], r['concurrency']): r for r in report['runs']}
+
+    ok = True
+    print(f"\nComparison with {baseline_file} (tolerance {tolerance:.0%}):")
+    for run in runs:
+        base = baseline.get((run['mode'], run['concurrency']))
+        if not base:
+            print(f"  {run['mode']} x{run['concurrency']}: no baseline")
+            continue
+        speed = run['pages_per_sec'] / base['pages_per_sec'] if base['pages_per_sec'] else 1.0
+        regressed = speed < 1 - tolerance or run['accuracy'] < base['accuracy']
+        ok = ok and not regressed
+        print(f"  {'❌' if regressed else '✅'} {run['mode']} x{run['concurrency']}: "
+              f"pages/s {base['pages_per_sec']:.2f} -> {run['pages_per_sec']:.2f} ({speed - 1:+.0%}), "
+              f"p95 {base['p95_ms']:.0f} -> {run['p95_ms']:.0f} ms, "
+              f"accuracy {base['accuracy']:.2%} -> {run['accuracy']:.2%}")
+
+    base_startup = report.get('startup')
+    if startup and base_startup:
+        before, after = base_startup['entry_point_ms'], startup['entry_point_ms']
+        regressed = after > before * (1 + tolerance)
+        ok = ok and not regressed
+        print(f"  {'❌' if regressed else '✅'} main.py startup: {before:.0f} -> {after:.0f} ms")
+    return ok
+
+
+async def main(args):
+    slugs = fixture_slugs()
+    runs = []
+    with FixtureServer(latency_ms=args.latency_ms) as server:
+        print(f"Serving {len(slugs)} fixtures at {server.base_url} (x{args.repeat} per run)")
+        for mode in args.modes:
+            for concurrency in args.concurrency:
+                print(f"\n▶ {mode} at concurrency {concurrency}")
+                runs.append(await run_once(mode, server, slugs, concurrency, args.repeat))
+
+    print_table(runs)
+    startup = measure_startup(args.startup_runs) if args.startup_runs else None
+    if startup:
+        print_startup(startup)
+
+    report = {'timestamp': time.time(), 'repeat': args.repeat, 'latency_ms': args.latency_ms, 'runs': runs,
+              'startup': startup}
+    output = args.output or os.path.join(RESULTS_DIR, f"benchmark_{int(time.time())}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📁 Report saved to: {output}")
+
+    if args.compare and not compare(runs, args.compare, args.tolerance, startup):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark the scrapers against local fixture pages')
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=5, help='times each fixture is scraped per run')
+    parser.add_argument('--latency-ms', type=int, default=0, help='latency added to every fixture response')
+    parser.add_argument('--output', help='report path (default: benchmarks/results/benchmark_<ts>.json)')
+    parser.add_argument('--compare', help='baseline report to compare against; exits 1 on regression')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed pages/sec drop vs baseline')
+    parser.add_argument('--startup-runs', type=int, default=5, help='fresh interpreters per startup timing (0 to skip)')
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args)))
@@ -2,11 +2,11 @@
 """
 Superteam Bounty Extractor - Main Entry Point
 
-This script runs the complete bounty monitoring workflow:
+This script runs the complete bounty monitoring workflow as a streaming pipeline:
 1. Fetch new bounties from API
 2. Scrape bounty details
-3. Extract prize information
-4. Merge prize data into bounty descriptions
+3. Extract and validate prize information
+4. Commit each bounty (description + prizes) as soon as it is done
 """
 
 import asyncio
@@ -17,83 +17,75 @@ from datetime import datetime
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from bounty_api_client import get_new_bounties_only, save_bounty_data
-from bounty_scraper import ImprovedSuperteamBountyScraper
-from prize_extractor import PrizeExtractor
+# Only the API client is imported up front; Playwright and the extractors are
+# loaded once there is something to scrape, so a quiet tick stays cheap
+from bounty_api_client import AsyncBountyApiClient
 import json
 import time
 
+def write_prize_results(prize_filename, prize_results):
+    """Write prize extraction results to a JSON file (run off the event loop)"""
+    with open(prize_filename, 'w') as f:
+        json.dump({
+            'timestamp': time.time(),
+            'total_bounties': len(prize_results),
+            'successful_extractions': len([r for r in prize_results if r.get('amounts_match')]),
+            'results': prize_results
+        }, f, indent=2)
+
 async def main():
     """
-    Main workflow function that runs all bounty processing steps
+    Main workflow function that streams each new bounty through every processing step
     """
     print("🚀 Starting Superteam Bounty Extractor Workflow")
     print(f"📅 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
     
     try:
-        # Step 1: Fetch new bounties from API
-        print("\n📡 Step 1: Fetching new bounties from API...")
-        new_bounties = get_new_bounties_only()
+        print("\n📡 Fetching new bounties from API...")
+        async with AsyncBountyApiClient() as api_client:
+            new_bounties = await api_client.get_new_bounties_async()
         
         if not new_bounties:
             print("✅ No new bounties found. Workflow complete.")
             return
         
-        print(f"✅ Found {len(new_bounties)} new bounties")
-        
-        # Step 2: Save bounty data
-        print("\n💾 Step 2: Saving bounty data...")
-        save_bounty_data(new_bounties)
-        print("✅ Bounty data saved successfully")
+        from bounty_scraper import ImprovedSuperteamBountyScraper
+        from prize_extractor import PrizeExtractor
+        from listing_fast_path import ListingFastPath
+        from streaming_pipeline import StreamingPipeline
+        from page_pool import AdaptiveRateLimiter
         
-        # Step 3: Scrape bounty details
-        print("\n🕷️  Step 3: Scraping bounty details...")
-        scraper = ImprovedSuperteamBountyScraper()
-        await scraper.scrape_new_bounties_only()
-        print("✅ Bounty scraping completed")
+        # Page extraction, prize validation and persistence run side by side;
+        # each bounty is saved as soon as it is done
+        print("\n🕷️  Streaming new bounties through the pipeline...")
+        rate_limiter = AdaptiveRateLimiter()
+        prize_extractor = PrizeExtractor(rate_limiter=rate_limiter)
+        scraper = ImprovedSuperteamBountyScraper(prize_extractor=prize_extractor, rate_limiter=rate_limiter,
+                                                 fast_path=ListingFastPath(rate_limiter=rate_limiter))
+        pipeline = StreamingPipeline(scraper)
+        committed = await pipeline.run(new_bounties)
+        # Every new listing is committed, so the next poll can be a 304
+        await asyncio.to_thread(api_client.commit_validators)
+        # SQLite is the source of truth; refresh the JSON views once for the whole run
+        await asyncio.to_thread(scraper.state_store.export_views, {'descriptions': scraper.results_file})
         
-        # Step 4: Extract prize information
-        print("\n🎯 Step 4: Extracting prize information...")
-        prize_extractor = PrizeExtractor()
+        print(f"✅ Bounty data and descriptions saved to: {scraper.results_file}")
         
-        # Get URLs from new bounties
-        bounty_urls = []
-        for bounty in new_bounties:
-            if 'url' in bounty:
-                bounty_urls.append(bounty['url'])
-            elif 'slug' in bounty:
-                # Construct URL from slug
-                bounty_urls.append(f"https://earn.superteam.fun/listing/{bounty['slug']}")
+        # Save prize information gathered during scraping
+        print("\n🎯 Saving prize information...")
+        prize_results = pipeline.prize_results
         
-        if bounty_urls:
-            # Extract prize information
-            prize_results = await prize_extractor.process_bounties_with_prizes(bounty_urls)
-            
+        if prize_results:
             # Save prize extraction results
             prize_filename = f"prize_extraction_results_{int(time.time())}.json"
-            with open(prize_filename, 'w') as f:
-                json.dump({
-                    'timestamp': time.time(),
-                    'total_bounties': len(prize_results),
-                    'successful_extractions': len([r for r in prize_results if r.get('amounts_match')]),
-                    'results': prize_results
-                }, f, indent=2)
+            await asyncio.to_thread(write_prize_results, prize_filename, prize_results)
             
             print(f"✅ Prize extraction completed:")
             print(f"   • Total bounties processed: {len(prize_results)}")
             print(f"   • Successful extractions: {len([r for r in prize_results if r.get('amounts_match')])}")
             print(f"   • Results saved to: {prize_filename}")
             
-            # Step 5: Merge prize data into bounty descriptions
-            print("\n🔄 Step 5: Merging prize data into bounty descriptions...")
-            success = prize_extractor.update_bounty_descriptions_with_prizes()
-            
-            if success:
-                print("✅ Prize data successfully merged into bounty descriptions")
-            else:
-                print("⚠️  Warning: Prize data merge encountered issues")
-            
             # Print summary of each bounty
             print("\n📊 Bounty Processing Summary:")
             for result in prize_results:
@@ -103,10 +95,10 @@ async def main():
                 print(f"      Total: {result['total_reward']}, Individual Sum: {result['individual_sum']}")
         
         else:
-            print("⚠️  No valid URLs found for prize extraction")
+            print("⚠️  No prize information was extracted")
         
         print("\n" + "=" * 60)
-        print(f"🎉 Workflow completed successfully! Processed {len(new_bounties)} new bounties")
+        print(f"🎉 Workflow completed successfully! Processed {len(committed)}/{pipeline.discovered} new bounties")
         print(f"📅 Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
     except Exception as e:
@@ -1,69 +1,346 @@
+import asyncio
+import aiohttp
 import json
+import random
 import requests
 import os
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from state_store import get_state_store
+from listing_fingerprint import api_fingerprint
+from run_metrics import get_metrics
+from link_registry import get_link_registry
 
-# Get the project root directory (parent of src)
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API_URL = 'https://earn.superteam.fun/api/listings'
 
-# Only run this if the file exists
+# requests only decodes brotli responses when a brotli package is installed
 try:
-    # Read the JSON file
-    data_file = os.path.join(project_root, 'data', 'superteam_bounties.json')
-    with open(data_file, 'r') as file:
-        bounties = json.load(file)
-
-    # Extract bounty links
-    bounty_links = []
-    for bounty in bounties:
-        slug = bounty.get('slug')
-        if slug:
-            link = f"https://earn.superteam.fun/listing/{slug}"
-            bounty_links.append(link)
-
-    # Write links to a .txt file
-    links_file = os.path.join(project_root, 'data', 'bounty_links.txt')
-    with open(links_file, 'w') as output_file:
-        for link in bounty_links:
-            output_file.write(link + '\n')
-
-    print(f"Extracted {len(bounty_links)} bounty links to data/bounty_links.txt")
-except FileNotFoundError:
-    print("No existing superteam_bounties.json found. Will create when new bounties are fetched.")
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+# Get the project root directory (parent of src)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 # Add to extract_bounty_links.py
 def load_existing_bounties():
-    """Load existing bounty IDs from processed_bounties.json"""
-    processed_file = os.path.join(project_root, 'data', 'processed_bounties.json')
-    try:
-        with open(processed_file, 'r') as f:
-            return set(json.load(f))
-    except FileNotFoundError:
-        return set()
+    """Load existing bounty IDs from the state store"""
+    return get_state_store().processed_ids()
 
 def save_processed_bounties(bounty_ids):
-    """Save processed bounty IDs to processed_bounties.json"""
-    processed_file = os.path.join(project_root, 'data', 'processed_bounties.json')
-    with open(processed_file, 'w') as f:
-        json.dump(list(bounty_ids), f)
+    """Record processed bounty IDs (processed_bounties.json is refreshed by export_views())"""
+    get_state_store().mark_processed(bounty_ids)
 
 def save_bounty_data(bounties):
-    """Save bounty data to superteam_bounties.json"""
-    data_file = os.path.join(project_root, 'data', 'superteam_bounties.json')
-    with open(data_file, 'w') as f:
-        json.dump(bounties, f, indent=2)
-    print(f"Saved {len(bounties)} bounties to data/superteam_bounties.json")
+    """Upsert bounty data into the state store (superteam_bounties.json is refreshed by export_views())"""
+    get_state_store().upsert_listings(bounties)
+    print(f"Saved {len(bounties)} bounties to the state store")
+    get_link_registry().record(bounties)
+
+class BountyApiClient:
+    """Keep-alive client for the listings API with conditional requests, timeouts and retries"""
+
+    def __init__(self, url=API_URL, timeout=(5, 30), max_retries=3, backoff_factor=0.5, state_file=None,
+                 max_failed_retries=3):
+        self.url = url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        # Refreshes allowed for a listing whose first scrape failed
+        self.max_failed_retries = max_failed_retries
+        self.state_file = state_file or os.path.join(project_root, 'data', 'api_cache_state.json')
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=4)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING,
+        })
+
+        self.validators = self.load_validators()
+        self.pending_validators = None
+        self.polls = []
+        self.last_listings = None
+        # Changed listings found by the last select_new_bounties(refresh=True)
+        self.last_changed = []
+
+    def load_validators(self):
+        """Load the ETag / Last-Modified seen on the last fully processed poll"""
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def commit_validators(self):
+        """Persist validators from the last poll once its listings have been handled.
+
+        Until this is called a later poll re-downloads the full list, so a run
+        that crashes mid-way can't hide new listings behind a 304.
+        """
+        if not self.pending_validators:
+            return
+        self.validators = self.pending_validators
+        self.pending_validators = None
+        with open(self.state_file, 'w') as f:
+            json.dump(self.validators, f)
+
+    def conditional_headers(self):
+        headers = {}
+        if self.validators.get('etag'):
+            headers['If-None-Match'] = self.validators['etag']
+        if self.validators.get('last_modified'):
+            headers['If-Modified-Since'] = self.validators['last_modified']
+        return headers
+
+    def record_poll(self, status, elapsed_ms, wire_bytes, headers):
+        encoding = headers.get('Content-Encoding', 'identity')
+        self.polls.append({'status': status, 'elapsed_ms': elapsed_ms, 'bytes': wire_bytes, 'encoding': encoding})
+        print(f"📡 API poll: {status} in {elapsed_ms}ms, {wire_bytes / 1024:.1f} KB ({encoding})")
+
+    def accept_listings(self, headers, listings):
+        """Hold the response validators until the listings have been handled"""
+        self.pending_validators = {
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+        }
+        self.last_listings = listings
+        return listings
+
+    def fetch_listings(self):
+        """Return all listings, or None if the server reports nothing changed (304)"""
+        started = time.monotonic()
+        with get_metrics().timer('api_fetch'):
+            response = self.session.get(self.url, headers=self.conditional_headers(), timeout=self.timeout)
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+        self.record_poll(response.status_code, elapsed_ms,
+                         int(response.headers.get('Content-Length') or len(response.content)), response.headers)
+
+        if response.status_code == 304:
+            return None
+
+        response.raise_for_status()
+        return self.accept_listings(response.headers, response.json())
+
+    def get_new_bounties(self, existing_ids=None, refresh=False):
+        """Fetch listings and return only the ones not processed yet"""
+        return self.select_new_bounties(self.fetch_listings(), existing_ids, refresh)
+
+    def select_new_bounties(self, all_bounties, existing_ids=None, refresh=False):
+        """New listings out of a poll's result (None for a 304).
+
+        With nothing new the poll's validators are committed right away;
+        otherwise the caller commits them once the new listings are stored.
+        With `refresh`, changed listings from the same poll are kept in
+        `last_changed` and hold the validators back until they are refreshed too.
+        """
+        if all_bounties is None:
+            print("Listings unchanged since last poll (304), nothing new")
+            self.last_changed = []
+            return []
+
+        # Appends unseen slugs to bounty_links.txt and refreshes last-seen times
+        get_link_registry().record(all_bounties)
+
+        if existing_ids is None:
+            existing_ids = load_existing_bounties()
+
+        # Filter for new bounties only
+        new_bounties = [b for b in all_bounties if b['id'] not in existing_ids]
+
+        print(f"Found {len(new_bounties)} new bounties out of {len(all_bounties)} total")
+        self.last_changed = self.find_changed_bounties(all_bounties) if refresh else []
+        if not new_bounties and not self.last_changed:
+            self.commit_validators()
+        return new_bounties
+
+    def find_changed_bounties(self, all_bounties):
+        """Processed listings whose API fingerprint differs from the recorded one.
+
+        Processed listings without a recorded fingerprint (from before change
+        detection existed) get a baseline instead of being reported as changed,
+        unless they have no successfully scraped description; those are
+        reported so a failed first scrape is retried, until
+        `max_failed_retries` refreshes of it have failed.
+        """
+        store = get_state_store()
+        processed_ids = store.processed_ids()
+        known = store.api_fingerprints()
+        retries = None
+
+        changed = []
+        baseline = []
+        for bounty in all_bounties:
+            if bounty['id'] not in processed_ids:
+                continue
+            fingerprint = api_fingerprint(bounty)
+            previous = known.get(bounty['id'])
+            if previous is None:
+                record = store.description(bounty.get('slug'))
+                if record is None or record.get('status') == 'error':
+                    if retries is None:
+                        retries = store.scrape_retries()
+                    if retries.get(bounty.get('slug'), 0) < self.max_failed_retries:
+                        changed.append(bounty)
+                else:
+                    baseline.append((bounty['id'], bounty.get('slug'), fingerprint, None))
+            elif previous != fingerprint:
+                changed.append(bounty)
+
+        if baseline:
+            store.save_fingerprints(baseline)
+        return changed
+
+    def get_changed_bounties(self):
+        """Fetch listings and return processed ones whose API data changed"""
+        return self.select_changed_bounties(self.fetch_listings())
+
+    def select_changed_bounties(self, all_bounties):
+        """Changed listings out of a poll's result (None for a 304)"""
+        if all_bounties is None:
+            print("Listings unchanged since last poll (304), nothing to refresh")
+            return []
+
+        changed = self.find_changed_bounties(all_bounties)
+        print(f"Found {len(changed)} changed bounties out of {len(all_bounties)} total")
+        store = get_state_store()
+        if not all(store.is_processed(b['id']) for b in all_bounties):
+            # New listings are waiting for the new-bounties path; a refresh must not hide them behind a 304
+            self.pending_validators = None
+        elif not changed:
+            self.commit_validators()
+        return changed
+
+
+class AsyncBountyApiClient(BountyApiClient):
+    """BountyApiClient for use inside the event loop.
+
+    Polls with aiohttp, retrying 429/5xx responses and connection errors
+    with exponential backoff and honouring Retry-After. The JSON parse and
+    the state-store bookkeeping run off the event loop, so browser work and
+    disk writes keep going. Use it as `async with AsyncBountyApiClient() as
+    client:` so its sessions are closed when the caller is done with them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._aiohttp_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def aiohttp_session(self):
+        """aiohttp session reused across this client's polls"""
+        if self._aiohttp_session is None:
+            connect, read = self.timeout
+            self._aiohttp_session = aiohttp.ClientSession(
+                headers=dict(self.session.headers),
+                timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read),
+            )
+        return self._aiohttp_session
+
+    async def fetch_listings_async(self):
+        """Return all listings, or None if the server reports nothing changed (304)"""
+        session = self.aiohttp_session()
+        started = time.monotonic()
+        with get_metrics().timer('api_fetch'):
+            for attempt in range(self.max_retries + 1):
+                delay = self.backoff_factor * (2 ** attempt) + random.uniform(0, self.backoff_factor)
+                try:
+                    async with session.get(self.url, headers=self.conditional_headers()) as response:
+                        if response.status in (429, 500, 502, 503, 504) and attempt < self.max_retries:
+                            retry_after = response.headers.get('Retry-After', '')
+                            await asyncio.sleep(float(retry_after) if retry_after.isdigit() else delay)
+                            continue
+                        body = await response.read()
+                        status, headers = response.status, response.headers
+                        break
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt == self.max_retries:
+                        raise
+                    await asyncio.sleep(delay)
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+        self.record_poll(status, elapsed_ms, int(headers.get('Content-Length') or len(body)), headers)
+
+        if status == 304:
+            return None
+        if status >= 400:
+            raise requests.HTTPError(f"{status} error polling {self.url}")
+        listings = await asyncio.to_thread(json.loads, body)
+        return self.accept_listings(headers, listings)
+
+    async def get_new_bounties_async(self, existing_ids=None, refresh=False):
+        """Fetch listings and return only the ones not processed yet"""
+        all_bounties = await self.fetch_listings_async()
+        return await asyncio.to_thread(self.select_new_bounties, all_bounties, existing_ids, refresh)
+
+    async def get_changed_bounties_async(self):
+        """Fetch listings and return processed ones whose API data changed"""
+        all_bounties = await self.fetch_listings_async()
+        return await asyncio.to_thread(self.select_changed_bounties, all_bounties)
+
+    async def close(self):
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+        self.session.close()
+
+
+_default_client = None
+_default_async_client = None
+
+
+def get_api_client():
+    """Shared BountyApiClient so repeated polls reuse one connection"""
+    global _default_client
+    if _default_client is None:
+        _default_client = BountyApiClient()
+    return _default_client
+
+
+def get_async_api_client():
+    """Shared AsyncBountyApiClient for the current event loop's polls.
+
+    Process-wide, so callers must not close it; code that owns its polls
+    uses `async with AsyncBountyApiClient() as client:` instead.
+    """
+    global _default_async_client
+    if _default_async_client is None:
+        _default_async_client = AsyncBountyApiClient()
+    return _default_async_client
+
 
 def get_new_bounties_only():
     """Fetch only new bounties from API"""
-    existing_ids = load_existing_bounties()
-    
-    # Fetch all bounties from API
-    response = requests.get('https://earn.superteam.fun/api/listings')
-    all_bounties = response.json()
-    
-    # Filter for new bounties only
-    new_bounties = [b for b in all_bounties if b['id'] not in existing_ids]
-    
-    print(f"Found {len(new_bounties)} new bounties out of {len(all_bounties)} total")
-    return new_bounties
\ No newline at end of file
+    return get_api_client().get_new_bounties()
+
+def get_changed_bounties_only():
+    """Fetch already processed bounties whose API data changed since they were scraped"""
+    return get_api_client().get_changed_bounties()
+
+async def get_new_bounties_async():
+    """Fetch only new bounties from API without blocking the event loop"""
+    return await get_async_api_client().get_new_bounties_async()
+
+async def get_changed_bounties_async():
+    """Fetch changed bounties without blocking the event loop"""
+    return await get_async_api_client().get_changed_bounties_async()
@@ -1,45 +1,22 @@
+import argparse
 import asyncio
+import random
+import signal
 import time
-from bounty_api_client import get_new_bounties_only, save_bounty_data
+from bounty_api_client import AsyncBountyApiClient, save_bounty_data
 from bounty_scraper import ImprovedSuperteamBountyScraper
 from prize_extractor import PrizeExtractor
+from listing_fast_path import ListingFastPath
+from browser_manager import BrowserManager
+from page_pool import AdaptiveRateLimiter
+from request_filter import default_request_filter
+from run_metrics import get_metrics
+from state_store import get_state_store
 import json
 
-async def monitor_and_scrape():
-    """Check for new bounties, scrape them, and extract prize information"""
-    print("🔍 Checking for new bounties...")
-    
-    # Get new bounties from API
-    new_bounties = get_new_bounties_only()
-    
-    if not new_bounties:
-        print("No new bounties found.")
-        return
-    
-    # Save new bounty data
-    save_bounty_data(new_bounties)
-    
-    # Scrape new bounties only
-    scraper = ImprovedSuperteamBountyScraper()
-    await scraper.scrape_new_bounties_only()
-    
-    # Extract prize information for new bounties
-    print("\n🎯 Starting prize extraction for new bounties...")
-    prize_extractor = PrizeExtractor()
-    
-    # Get URLs from new bounties
-    bounty_urls = []
-    for bounty in new_bounties:
-        if 'url' in bounty:
-            bounty_urls.append(bounty['url'])
-        elif 'slug' in bounty:
-            # Construct URL from slug if needed - FIXED: Use correct domain
-            bounty_urls.append(f"https://earn.superteam.fun/listing/{bounty['slug']}")
-    
-    if bounty_urls:
-        # Extract prize information
-        prize_results = await prize_extractor.process_bounties_with_prizes(bounty_urls)
-        
+def save_prize_results(prize_results):
+    """Write this run's prize results to a timestamped file and print a summary"""
+    if prize_results:
         # Save prize extraction results
         prize_filename = f"prize_extraction_results_{int(time.time())}.json"
         with open(prize_filename, 'w') as f:
@@ -59,8 +36,153 @@ async def monitor_and_scrape():
         for result in prize_results:
             status = "✅" if result.get('amounts_match') else "⚠️"
             print(f"  {status} {result['title']}: Total={result['total_reward']}, Individual Sum={result['individual_sum']}")
+
+async def monitor_and_scrape():
+    """Check for new bounties, scrape them, and extract prize information"""
+    print("🔍 Checking for new bounties...")
+    
+    # Get new bounties from API without blocking the event loop
+    async with AsyncBountyApiClient() as client:
+        new_bounties = await client.get_new_bounties_async()
+    
+    if not new_bounties:
+        print("No new bounties found.")
+        return
+    
+    # Save new bounty data
+    await asyncio.to_thread(save_bounty_data, new_bounties)
+    
+    # Scrape new bounties only, extracting prizes from the same page visit
+    print("\n🎯 Scraping new bounties with prize extraction...")
+    rate_limiter = AdaptiveRateLimiter()
+    prize_extractor = PrizeExtractor(rate_limiter=rate_limiter)
+    scraper = ImprovedSuperteamBountyScraper(prize_extractor=prize_extractor, rate_limiter=rate_limiter,
+                                             fast_path=ListingFastPath(rate_limiter=rate_limiter))
+    await scraper.scrape_new_bounties_only()
+    # The new listings are committed, so the next poll can be a 304
+    await asyncio.to_thread(client.commit_validators)
+    await asyncio.to_thread(get_state_store().export_views)
+    
+    await asyncio.to_thread(save_prize_results, scraper.prize_results)
     
     print(f"\n✅ Successfully processed {len(new_bounties)} new bounties with prize extraction")
 
+async def refresh_changed():
+    """Re-scrape already processed bounties whose API data changed"""
+    print("🔍 Checking for changed bounties...")
+    
+    async with AsyncBountyApiClient() as client:
+        changed_bounties = await client.get_changed_bounties_async()
+    
+    if not changed_bounties:
+        print("No changed bounties found.")
+        return
+    
+    rate_limiter = AdaptiveRateLimiter()
+    prize_extractor = PrizeExtractor(rate_limiter=rate_limiter)
+    scraper = ImprovedSuperteamBountyScraper(prize_extractor=prize_extractor, rate_limiter=rate_limiter,
+                                             fast_path=ListingFastPath(rate_limiter=rate_limiter))
+    await scraper.refresh_changed_bounties(changed_bounties)
+    # No-op when new listings from the same poll are still unprocessed
+    await asyncio.to_thread(client.commit_validators)
+    await asyncio.to_thread(get_state_store().export_views)
+    
+    await asyncio.to_thread(save_prize_results, scraper.prize_results)
+
+async def run_daemon(interval=300, jitter=30, recycle_after=50, refresh=True, export_json=False):
+    """Poll the API forever, keeping the browser, HTTP sessions and extractors warm.
+    
+    Each cycle fetches listings (a 304 when nothing changed), scrapes new ones
+    and, with `refresh`, re-scrapes listings whose API data changed. SIGTERM or
+    SIGINT stops the daemon after the current cycle; work inside a cycle is
+    checkpointed, so a hard kill resumes where it left off. Results live in
+    the state store; with `export_json` the stale JSON views are rewritten
+    after each cycle.
+    """
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    
+    # The daemon owns its API client, closed on shutdown
+    client = AsyncBountyApiClient()
+    # The request rate learned in one cycle carries over to the next
+    rate_limiter = AdaptiveRateLimiter()
+    fast_path = ListingFastPath(rate_limiter=rate_limiter)
+    request_filter = default_request_filter()
+    browser_manager = BrowserManager(request_filter=request_filter, recycle_after=recycle_after)
+    prize_extractor = PrizeExtractor(request_filter=request_filter, browser_manager=browser_manager,
+                                     rate_limiter=rate_limiter)
+    
+    def new_scraper():
+        # Per-cycle scraper state, shared browser / sessions / extractors
+        return ImprovedSuperteamBountyScraper(prize_extractor=prize_extractor, fast_path=fast_path,
+                                              request_filter=request_filter, browser_manager=browser_manager,
+                                              rate_limiter=rate_limiter)
+    
+    await browser_manager.start()
+    print(f"👀 Daemon started: polling every {interval}s (±{jitter}s), "
+          f"recycling the browser context every {recycle_after} navigations")
+    
+    cycle = 0
+    try:
+        while not stop.is_set():
+            cycle += 1
+            started = time.monotonic()
+            # Stage timings and pages/sec in metrics.prom describe the latest cycle
+            get_metrics().reset()
+            request_filter.reset()
+            prize_extractor.readiness.reset()
+            try:
+                new_bounties = await client.get_new_bounties_async(refresh=refresh)
+                # Computed from the same poll by get_new_bounties_async
+                changed_bounties = client.last_changed
+                
+                if new_bounties:
+                    await asyncio.to_thread(save_bounty_data, new_bounties)
+                    scraper = new_scraper()
+                    await scraper.scrape_new_bounties_only()
+                    await asyncio.to_thread(save_prize_results, scraper.prize_results)
+                if changed_bounties:
+                    scraper = new_scraper()
+                    await scraper.refresh_changed_bounties(changed_bounties)
+                    await asyncio.to_thread(save_prize_results, scraper.prize_results)
+                # Everything from this poll is stored, so the next one can be a 304
+                await asyncio.to_thread(client.commit_validators)
+                if export_json:
+                    await asyncio.to_thread(get_state_store().export_views)
+            except Exception as e:
+                print(f"❌ Cycle {cycle} failed: {e}")
+            
+            elapsed = time.monotonic() - started
+            get_metrics().set_gauge('request_rate', rate_limiter.rate)
+            get_metrics().write_prometheus()
+            delay = max(0.0, interval + random.uniform(-jitter, jitter) - elapsed)
+            print(f"⏱️  Cycle {cycle} took {elapsed:.2f}s, next poll in {delay:.0f}s")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        print("🛑 Shutting down daemon...")
+        await browser_manager.close()
+        await client.close()
+        fast_path.session.close()
+        print(f"👋 Daemon stopped after {cycle} cycles ({browser_manager.recycles} context recycles)")
+
 if __name__ == "__main__":
-    asyncio.run(monitor_and_scrape())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Monitor Superteam bounties')
+    parser.add_argument('--refresh', action='store_true', help='re-scrape processed bounties whose API data changed')
+    parser.add_argument('--daemon', action='store_true', help='keep running and poll on an interval')
+    parser.add_argument('--interval', type=float, default=300, help='daemon poll interval in seconds')
+    parser.add_argument('--jitter', type=float, default=30, help='random +/- seconds added to each interval')
+    parser.add_argument('--recycle-after', type=int, default=50, help='navigations per browser context')
+    parser.add_argument('--export-json', action='store_true', help='daemon: rewrite changed JSON views after each cycle')
+    args = parser.parse_args()
+    
+    if args.daemon:
+        asyncio.run(run_daemon(args.interval, args.jitter, args.recycle_after, export_json=args.export_json))
+    elif args.refresh:
+        asyncio.run(refresh_changed())
+    else:
+        asyncio.run(monitor_and_scrape())
\ No newline at end of file
@@ -1,21 +1,92 @@
 import json
 import asyncio
 import time
-from playwright.async_api import async_playwright
 from urllib.parse import urljoin
 import csv
 import os
+from browser_manager import BrowserManager
+from page_pool import AdaptiveRateLimiter, PagePool, navigate
+from page_readiness import ReadinessWaiter
+from request_filter import default_request_filter
+from snapshot_archive import SnapshotArchive
+from checkpoint_journal import CheckpointJournal
+from link_registry import get_link_registry
+from state_store import get_state_store
+from listing_fingerprint import api_fingerprint, content_fingerprint
+from run_metrics import get_metrics
+from strategy_ranker import get_strategy_ranker
+from page_scripts import BODY_TEXT_JS, DESCRIPTION_CANDIDATES_JS, DESCRIPTION_STRATEGIES
+
 
 class ImprovedSuperteamBountyScraper:
-    def __init__(self, links_file='data/bounty_links.txt', json_file='data/superteam_bounties.json'):
+    def __init__(self, links_file='data/bounty_links.txt', json_file='data/superteam_bounties.json',
+                 concurrency=4, requests_per_second=2.0, prize_extractor=None, readiness=None,
+                 request_filter=None, snapshot_archive=None, fast_path=None, state_store=None,
+                 browser_manager=None, rate_limiter=None, max_requests_per_second=10.0, strategy_ranker=None):
         self.links_file = links_file
+        # Slug index over links_file: first/last-seen times and O(1) membership;
+        # the same instance the API client records new listings in
+        self.link_registry = get_link_registry(links_file)
         self.json_file = json_file
         self.base_url = 'https://earn.superteam.fun/listing/'
         self.results = []
-        self.progress_file = 'output/scraping_progress.json'
+        self.progress_file = 'output/scraping_progress.json'  # legacy full-rewrite checkpoint
+        # Append-only checkpoints: one line per finished listing
+        self.progress_journal = CheckpointJournal('output/scraping_progress.jsonl', key='result.url')
+        self.incremental_journal = CheckpointJournal('output/incremental_progress.jsonl', key='result.url')
         self.bounty_data_cache = {}  # Cache for API data
         self.processed_file = 'data/processed_bounties.json'
         self.results_file = 'output/bounty_descriptions.json'
+        # Processed IDs, listings and results live in SQLite; the JSON files are exported views
+        self.state_store = state_store or get_state_store()
+        # Per-stage timings, page throughput and strategy hits for this process
+        self.metrics = get_metrics()
+        # Skips extraction strategies that have never matched so far
+        self.strategy_ranker = strategy_ranker or get_strategy_ranker()
+        # Chromium is owned by a BrowserManager shared with the prize extractor;
+        # without one passed in, the prize extractor's is used, or one is created
+        # and closed after each run
+        if prize_extractor is not None:
+            if browser_manager is None:
+                browser_manager = prize_extractor.browser_manager
+                self.owns_browser = prize_extractor.owns_browser
+            elif browser_manager is not prize_extractor.browser_manager:
+                raise ValueError("prize_extractor must be built with the same browser_manager as the scraper")
+            else:
+                self.owns_browser = False
+        else:
+            self.owns_browser = browser_manager is None
+        self.request_filter = (request_filter or (browser_manager and browser_manager.request_filter)
+                               or default_request_filter())
+        self.browser_manager = browser_manager or BrowserManager(request_filter=self.request_filter,
+                                                                 max_pages=max(concurrency, 1))
+        self.user_agent = self.browser_manager.user_agent
+        
+        # Worker pool settings: number of concurrent pages and global request rate
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        # AIMD controller for every page and HTTP fetch; pass the same one to the
+        # prize extractor and fast path so they all share a single rate
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(requests_per_second, max_rps=max_requests_per_second)
+        
+        # Optional PrizeExtractor run against the same loaded page, so each
+        # listing is only navigated to once
+        self.prize_extractor = prize_extractor
+        self.prize_results = []
+        self._prize_results_by_url = {}
+        
+        # Waits for the listing to render instead of sleeping a fixed 3s
+        self.readiness = readiness or ReadinessWaiter()
+        
+        # request_filter (set above) blocks images, fonts, media and trackers;
+        # pass RequestFilterPolicy() to disable
+        
+        # Rendered pages are archived so extraction can be re-run offline
+        self.snapshot_archive = snapshot_archive or SnapshotArchive()
+        
+        # Optional ListingFastPath: read the page data over plain HTTP and only
+        # open a browser for listings it can't validate
+        self.fast_path = fast_path
         
         # Add the missing description_selectors attribute
         self.description_selectors = [
@@ -34,7 +105,10 @@ class ImprovedSuperteamBountyScraper:
         ]
 
     def load_bounties(self):
-        """Load bounty data from JSON file"""
+        """Load bounty data from the state store, falling back to the JSON file"""
+        bounties = self.state_store.listings()
+        if bounties:
+            return bounties
         try:
             with open(self.json_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
@@ -46,23 +120,45 @@ class ImprovedSuperteamBountyScraper:
             return []
     
     def load_progress(self):
-        """Load previous progress if exists"""
+        """Load previous progress by replaying the checkpoint journal"""
+        results_by_url = {}
+        
+        # Progress written by older versions as a single JSON file
         if os.path.exists(self.progress_file):
             try:
                 with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {'completed_slugs': [], 'results': []}
-        return {'completed_slugs': [], 'results': []}
+                    for result in json.load(f).get('results', []):
+                        results_by_url[result.get('url', '')] = result
+            except Exception:
+                pass
+        
+        for result in self.replay_journal(self.progress_journal):
+            results_by_url[result.get('url', '')] = result
+        
+        results = list(results_by_url.values())
+        return {'completed_slugs': [r.get('url', '') for r in results], 'results': results}
     
-    def save_progress(self, completed_slugs, results):
-        """Save current progress"""
-        progress = {
-            'completed_slugs': completed_slugs,
-            'results': results
-        }
-        with open(self.progress_file, 'w', encoding='utf-8') as f:
-            json.dump(progress, f, indent=2, ensure_ascii=False)
+    def checkpoint(self, journal, result):
+        """Append one finished listing (and its prize result, if any) to a journal"""
+        journal.append({
+            'result': result,
+            'prize_result': self._prize_results_by_url.get(result.get('url'))
+        })
+    
+    def replay_journal(self, journal):
+        """Return results recorded in a journal, restoring their prize results"""
+        results = []
+        for entry in journal.replay():
+            result = entry['result']
+            if entry.get('prize_result'):
+                self._prize_results_by_url[result['url']] = entry['prize_result']
+            results.append(result)
+        return results
+    
+    def compact_progress(self):
+        """Rewrite the progress journal with one line per listing"""
+        count = self.progress_journal.compact()
+        print(f"Compacted progress journal to {count} entries")
     
     async def debug_page_structure(self, page, slug):
         """Debug function to understand page structure"""
@@ -87,7 +183,7 @@ class ImprovedSuperteamBountyScraper:
                 print(f"  Found {len(elements)} {indicator} elements")
         
         # Get all text content to see what's available
-        body_text = await page.evaluate('() => document.body.innerText')
+        body_text = await page.evaluate(BODY_TEXT_JS)
         if body_text:
             lines = [line.strip() for line in body_text.split('\n') if line.strip()]
             print(f"  Total text lines: {len(lines)}")
@@ -95,82 +191,30 @@ class ImprovedSuperteamBountyScraper:
                 print(f"  Sample text: {lines[5][:100]}...")
     
     async def extract_description_smart(self, page, slug):
-        """Smart description extraction with multiple strategies"""
-        description = None
-        
-        # Strategy 1: Try predefined selectors
-        for selector in self.description_selectors:
-            try:
-                elements = await page.query_selector_all(selector)
-                if elements:
-                    for element in elements:
-                        text = await element.inner_text()
-                        if text and len(text.strip()) > 30:  # Reasonable description length
-                            description = text.strip()
-                            print(f"  ✓ Found description using selector: {selector}")
-                            break
-                    if description:
-                        break
-            except Exception as e:
-                continue
-        
-        # Strategy 2: Look for paragraphs with substantial content
-        if not description:
-            try:
-                paragraphs = await page.query_selector_all('p')
-                for p in paragraphs:
-                    text = await p.inner_text()
-                    if text and len(text.strip()) > 50:
-                        description = text.strip()
-                        print(f"  ✓ Found description in paragraph")
-                        break
-            except Exception as e:
-                pass
-        
-        # Strategy 3: Extract from main content area
-        if not description:
-            try:
-                main = await page.query_selector('main')
-                if main:
-                    # Get all text from main, then try to find description-like content
-                    main_text = await main.inner_text()
-                    if main_text:
-                        lines = [line.strip() for line in main_text.split('\n') if line.strip()]
-                        # Look for longer lines that might be descriptions
-                        for line in lines:
-                            if len(line) > 100 and not line.startswith(('$', 'USDC', 'Deadline')):
-                                description = line
-                                print(f"  ✓ Found description in main content")
-                                break
-            except Exception as e:
-                pass
-        
-        # Strategy 4: Use JavaScript to find content
-        if not description:
-            try:
-                description = await page.evaluate('''
-                    () => {
-                        // Look for elements with substantial text content
-                        const allDivs = document.querySelectorAll('div');
-                        for (let div of allDivs) {
-                            const text = div.innerText;
-                            if (text && text.length > 100 && text.length < 2000) {
-                                // Check if it's likely a description (not navigation, etc.)
-                                if (!text.includes('Sign in') && !text.includes('Menu') && 
-                                    !text.includes('Navigation') && text.includes(' ')) {
-                                    return text.trim();
-                                }
-                            }
-                        }
-                        return null;
-                    }
-                ''')
-                if description:
-                    print(f"  ✓ Found description using JavaScript extraction")
-            except Exception as e:
-                pass
-        
-        return description or "Description not found"
+        """Smart description extraction with multiple strategies, evaluated in a single round trip"""
+        ranker = self.strategy_ranker
+        order = ranker.order('description', DESCRIPTION_STRATEGIES, fallbacks=['divs'])
+        selectors = ranker.order('description_selector', self.description_selectors)
+        try:
+            with self.metrics.timer('extract.description'):
+                best = await page.evaluate(DESCRIPTION_CANDIDATES_JS, {'selectors': selectors, 'order': order})
+        except Exception as e:
+            print(f"  ⚠️  Description extraction failed: {e}")
+            best = None
+        
+        if best is not None:
+            ranker.record('description', best['tried'], best['strategy'])
+            if 'selectors' in best['tried']:
+                tried_selectors = selectors[:selectors.index(best['selector']) + 1] if best['selector'] else selectors
+                ranker.record('description_selector', tried_selectors, best['selector'])
+        
+        if best and best.get('text'):
+            self.metrics.hit('description', best['strategy'])
+            label = f"selector: {best['selector']}" if best['selector'] else best['strategy']
+            print(f"  ✓ Found description using {label}")
+            return best['text']
+        
+        return "Description not found"
     
     async def scrape_bounty_description(self, page, slug, bounty_data, debug=False):
         """Scrape description for a single bounty with improved extraction"""
@@ -180,10 +224,10 @@ class ImprovedSuperteamBountyScraper:
             print(f"\nScraping: {url}")
             
             # Navigate to the page
-            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            await navigate(page, url, self.rate_limiter, self.metrics)
             
-            # Wait for content to load
-            await page.wait_for_timeout(3000)
+            # Wait until the description and prize table have rendered
+            await self.readiness.wait_for_listing(page, slug)
             
             # Debug page structure if requested
             if debug:
@@ -239,83 +283,79 @@ class ImprovedSuperteamBountyScraper:
         sample_bounties = bounties[:sample_size]
         print(f"Testing with {len(sample_bounties)} sample bounties...")
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=False,  # Show browser for debugging
-                args=['--no-sandbox', '--disable-dev-shm-usage']
-            )
-            
-            try:
-                context = await browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
-                
-                page = await context.new_page()
-                
-                for bounty in sample_bounties:
+        # Pass BrowserManager(headless=False) to watch the browser while debugging
+        try:
+            for bounty in sample_bounties:
+                await self.rate_limiter.acquire()
+                async with self.browser_manager.page() as page:
                     result = await self.scrape_bounty_description(page, bounty['slug'], bounty, debug=debug)
-                    self.results.append(result)
-                    
-                    # Small delay between requests
-                    await asyncio.sleep(2)
-                
-            finally:
-                await browser.close()
+                self.browser_manager.record_navigations(1)
+                self.results.append(result)
+        finally:
+            await self.close_browser()
+        
+        self.readiness.print_summary()
+        self.request_filter.print_summary()
         
         # Save sample results
-        self.save_results(filename_suffix='_sample')
+        await asyncio.to_thread(self.save_sample_results)
+        self.print_results_summary()
         print(f"\n🎉 Sample scraping completed! Check the results.")
+        self.report_metrics()
+    
+    async def country_from_slate_span(self, page):
+        """Two-letter upper-case code in a span.text-slate-400"""
+        for elem in await page.query_selector_all('span.text-slate-400'):
+            text = await elem.text_content()
+            if text and len(text.strip()) == 2 and text.strip().isupper():
+                return text.strip()
+        return None
+    
+    async def country_from_span_pattern(self, page):
+        """Any span containing a known country code"""
+        for span in await page.query_selector_all('span'):
+            text = await span.text_content()
+            if text and text.strip() in ['IE', 'IN', 'VN', 'US', 'UK', 'CA', 'AU', 'DE', 'FR', 'GLOBAL']:
+                return text.strip()
+        return None
+    
+    async def country_from_page_content(self, page):
+        """Assume GLOBAL when the page says so or mentions no known code"""
+        page_content = await page.content()
+        if 'global' in page_content.lower() or not any(cc in page_content for cc in ['IE', 'IN', 'VN']):
+            return 'GLOBAL'
+        return None
     
     async def extract_country_restriction(self, page, url):
-        """Extract country restriction from the page"""
-        try:
-            # Try the exact XPath first
-            try:
-                element = await page.wait_for_selector(f'xpath={self.country_xpath}', timeout=5000)
-                if element:
-                    country_text = await element.text_content()
-                    country_restriction = country_text.strip() if country_text else None
-                    if country_restriction:
-                        print(f"  ✓ Found country restriction: {country_restriction}")
-                        return country_restriction
-            except Exception:
-                pass
-            
-            # Fallback: look for spans with country codes
+        """Extract country restriction from the page, most precise strategy first"""
+        strategies = {
+            'slate_span': self.country_from_slate_span,
+            'span_pattern': self.country_from_span_pattern,
+            'page_content': self.country_from_page_content,
+        }
+        # The GLOBAL assumption matches almost any page, so it always runs last
+        order = self.strategy_ranker.order('country', list(strategies), fallbacks=['page_content'])
+        
+        tried = []
+        country_restriction = None
+        for name in order:
+            tried.append(name)
             try:
-                # Look for spans that might contain country codes
-                country_elements = await page.query_selector_all('span.text-slate-400')
-                for elem in country_elements:
-                    text = await elem.text_content()
-                    if text and len(text.strip()) == 2 and text.strip().isupper():
-                        country_restriction = text.strip()
-                        print(f"  ✓ Found country restriction (fallback): {country_restriction}")
-                        return country_restriction
-                
-                # If still not found, look for common country code patterns
-                all_spans = await page.query_selector_all('span')
-                for span in all_spans:
-                    text = await span.text_content()
-                    if text and text.strip() in ['IE', 'IN', 'VN', 'US', 'UK', 'CA', 'AU', 'DE', 'FR', 'GLOBAL']:
-                        country_restriction = text.strip()
-                        print(f"  ✓ Found country restriction (pattern): {country_restriction}")
-                        return country_restriction
-                        
+                with self.metrics.timer(f'country.{name}'):
+                    country_restriction = await strategies[name](page)
             except Exception:
-                pass
-            
-            # If no country restriction found, check if it might be global
-            page_content = await page.content()
-            if 'global' in page_content.lower() or not any(cc in page_content for cc in ['IE', 'IN', 'VN']):
-                print(f"  ✓ Assuming GLOBAL restriction")
-                return 'GLOBAL'
-            
-            print(f"  ⚠️  No country restriction found")
-            return None
-            
-        except Exception as e:
-            print(f"  ✗ Error extracting country restriction: {e}")
-            return None
+                continue
+            if country_restriction:
+                break
+        
+        self.strategy_ranker.record('country', tried, name if country_restriction else None)
+        if country_restriction:
+            self.metrics.hit('country', name)
+            print(f"  ✓ Found country restriction ({name}): {country_restriction}")
+            return country_restriction
+        
+        print(f"  ⚠️  No country restriction found")
+        return None
     
     async def scrape_bounty_from_url(self, page, url, debug=False):
         """Scrape description and country restriction for a single bounty from URL"""
@@ -325,10 +365,10 @@ class ImprovedSuperteamBountyScraper:
             print(f"\nScraping: {url}")
             
             # Navigate to the page
-            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            await navigate(page, url, self.rate_limiter, self.metrics)
             
-            # Wait for content to load
-            await page.wait_for_timeout(3000)
+            # Wait until the description and prize table have rendered
+            await self.readiness.wait_for_listing(page, slug)
             
             # Debug page structure if requested
             if debug:
@@ -340,6 +380,15 @@ class ImprovedSuperteamBountyScraper:
             # Extract country restriction
             country_restriction = await self.extract_country_restriction(page, url)
             
+            # Extract prizes from the same page instead of loading it again
+            prize_result = None
+            if self.prize_extractor:
+                prize_result = await self.prize_extractor.extract_prizes_from_page(page, url)
+                self._prize_results_by_url[url] = prize_result
+            
+            # Archive the page after extraction so expanded prize rows are included
+            await self.snapshot_archive.capture(page, slug, url)
+            
             # Extract basic info from the page
             title = await page.title() or slug.replace('-', ' ').title()
             
@@ -361,7 +410,7 @@ class ImprovedSuperteamBountyScraper:
             
             # Fallback: try to extract from page if not in cache
             if reward_amount is None:
-                page_text = await page.evaluate('() => document.body.innerText')
+                page_text = await page.evaluate(BODY_TEXT_JS)
                 reward_amount = self.extract_reward_amount_from_page(page_text)
             
             # Prepare result with country restriction included
@@ -378,6 +427,9 @@ class ImprovedSuperteamBountyScraper:
                 'status': 'active'
             }
             
+            if prize_result:
+                result['extracted_prize_data'] = self.prize_extractor.to_extracted_prize_data(prize_result)
+            
             success_msg = f"  ✓ Successfully scraped {slug}"
             if country_restriction:
                 success_msg += f" (Country: {country_restriction})"
@@ -387,6 +439,8 @@ class ImprovedSuperteamBountyScraper:
             
         except Exception as e:
             print(f"  ✗ Error scraping {url}: {e}")
+            if self.prize_extractor and url not in self._prize_results_by_url:
+                self._prize_results_by_url[url] = self.prize_extractor.error_result(url, e)
             return {
                 'title': slug.replace('-', ' ').title(),
                 'slug': slug,
@@ -400,11 +454,13 @@ class ImprovedSuperteamBountyScraper:
                 'status': 'error'
             }
 
-    async def scrape_all_bounties(self, debug=False):
-        """Scrape all bounties from the links file"""
-        # Load bounty data cache first
-        self.load_bounty_data_cache()
+    async def scrape_all_bounties(self, debug=False, work_queue=None, run_worker=True):
+        """Scrape all bounties from the links file.
         
+        With a work queue, pending slugs are enqueued and scraped by queue
+        workers (this process included unless run_worker=False), and the
+        results are merged here into the usual outputs.
+        """
         links = self.load_bounty_links()
         if not links:
             print("No bounty links to scrape")
@@ -413,122 +469,204 @@ class ImprovedSuperteamBountyScraper:
         print(f"Found {len(links)} bounty links to scrape...")
         
         # Load previous progress
-        progress = self.load_progress()
+        progress = await asyncio.to_thread(self.load_progress)
         completed_urls = set(result.get('url', '') for result in progress.get('results', []))
         self.results = progress.get('results', [])
+        previous_results = list(self.results)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,  # Set to False for debugging
-                args=['--no-sandbox', '--disable-dev-shm-usage']
-            )
-            
-            try:
-                context = await browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
-                
-                page = await context.new_page()
-                
-                for i, url in enumerate(links, 1):
-                    # Skip if already completed
-                    if url in completed_urls:
-                        print(f"[{i}/{len(links)}] Skipping {url} (already completed)")
-                        continue
-                    
-                    print(f"[{i}/{len(links)}] Processing {url}")
-                    result = await self.scrape_bounty_from_url(page, url, debug=debug)
-                    self.results.append(result)
-                    
-                    # Save progress every 5 bounties
-                    if i % 5 == 0:
-                        completed_urls_list = [r['url'] for r in self.results]
-                        self.save_progress(completed_urls_list, self.results)
-                        print(f"Progress saved ({i}/{len(links)} completed)")
-                    
-                    # Small delay between requests to be respectful
-                    await asyncio.sleep(2)
-                
-            finally:
-                await browser.close()
+        pending_urls = []
+        for i, url in enumerate(links, 1):
+            # Skip if already completed
+            if url in completed_urls:
+                print(f"[{i}/{len(links)}] Skipping {url} (already completed)")
+                continue
+            pending_urls.append(url)
+        
+        # API data for just the listings left to scrape
+        await asyncio.to_thread(self.load_bounty_data_cache, [self.extract_slug_from_url(url) for url in pending_urls])
+        
+        finished = []
+        
+        def on_result(index, url, result):
+            self.results.append(result)
+            finished.append(index)
+            # Checkpoint every finished bounty; fsync is batched by the journal
+            self.checkpoint(self.progress_journal, result)
+            print(f"[{len(finished)}/{len(pending_urls)}] Finished {url}")
+        
+        if work_queue is not None:
+            new_results = await self.scrape_urls_via_queue(pending_urls, work_queue, run_worker, on_result=on_result)
+        else:
+            new_results = await self.scrape_urls(pending_urls, debug=debug, on_result=on_result)
         
-        # Final save
-        completed_urls_list = [r['url'] for r in self.results]
-        self.save_progress(completed_urls_list, self.results)
+        # Keep results in link order regardless of completion order
+        ordered_results = [new_results[i] for i in sorted(new_results)]
+        self.results = previous_results + ordered_results
+        self.prize_results = self.collect_prize_results(ordered_results)
         
-        # Save final results
-        self.save_results()
+        self.readiness.print_summary()
+        self.request_filter.print_summary()
+        
+        # Make sure every checkpoint is on disk
+        self.progress_journal.close()
+        
+        self.state_store.upsert_descriptions(self.results)
+        if self.prize_results:
+            self.state_store.upsert_prize_results(self.prize_results)
+        
+        # The store is the only writer of the descriptions view
+        await asyncio.to_thread(self.state_store.export_views, {'descriptions': self.results_file})
+        print(f"\nResults saved to: {self.results_file}")
+        self.print_results_summary()
         print(f"\n🎉 Scraping completed! Processed {len(self.results)} bounties.")
+        self.report_metrics()
+
+    async def scrape_urls(self, urls, debug=False, on_result=None):
+        """Scrape listing URLs, trying the HTTP fast path first and the browser only for the rest.
+        
+        Returns a dict of index -> result. on_result(index, url, result) is called
+        as soon as each listing finishes.
+        """
+        results = {}
+        rate_limiter = self.rate_limiter
+        browser_indexes = list(range(len(urls)))
+        
+        def finish(index, url, result, source='browser'):
+            self.metrics.page(source, ok=result.get('status') != 'error')
+            results[index] = result
+            if on_result:
+                on_result(index, url, result)
+        
+        if self.fast_path:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            
+            async def try_fast_path(index, url):
+                slug = self.extract_slug_from_url(url)
+                async with semaphore:
+                    await rate_limiter.acquire()
+                    with self.metrics.timer('fast_path'):
+                        extracted = await asyncio.to_thread(
+                            self.fast_path.extract_listing, url, slug, self.bounty_data_cache.get(slug),
+                            self.snapshot_archive
+                        )
+                if extracted:
+                    record, prize_result = extracted
+                    if self.prize_extractor:
+                        record['extracted_prize_data'] = self.prize_extractor.to_extracted_prize_data(prize_result)
+                        self._prize_results_by_url[url] = prize_result
+                    finish(index, url, record, source='fast_path')
+            
+            await asyncio.gather(*(try_fast_path(i, url) for i, url in enumerate(urls)))
+            self.fast_path.print_summary()
+            browser_indexes = [i for i in browser_indexes if i not in results]
+        
+        if not browser_indexes:
+            return results
+        
+        # Launch Chromium only for listings the fast path couldn't handle
+        browser_urls = [urls[i] for i in browser_indexes]
+        
+        async def handle(page, url):
+            return await self.scrape_bounty_from_url(page, url, debug=debug)
+        
+        # Run in chunks so the shared context is recycled between them
+        try:
+            start = 0
+            while start < len(browser_urls):
+                chunk = browser_urls[start:start + self.browser_manager.navigations_left()]
+                offset = start
+                
+                def on_chunk_result(position, url, result, offset=offset):
+                    finish(browser_indexes[offset + position], url, result)
+                
+                pool = PagePool(size=self.concurrency, rate_limiter=rate_limiter, browser_manager=self.browser_manager)
+                try:
+                    await pool.run(chunk, handle, on_result=on_chunk_result)
+                finally:
+                    self.browser_manager.record_navigations(len(chunk))
+                start += len(chunk)
+        finally:
+            await self.close_browser()
+        
+        return results
 
-    def save_results(self, filename_suffix=''):
-        """Save results in JSON format with country restrictions included"""
+    async def close_browser(self):
+        """Close Chromium unless the browser manager was passed in by the caller"""
+        if self.owns_browser:
+            await self.browser_manager.close()
+
+    async def scrape_urls_via_queue(self, urls, work_queue, run_worker=True, on_result=None):
+        """Scrape URLs through a work queue; returns index -> result like scrape_urls"""
+        from queue_worker import QueueWorker, collect_via_queue
+        
+        slugs = [self.extract_slug_from_url(url) for url in urls]
+        worker = None
+        if run_worker:
+            worker = QueueWorker(work_queue, kind='scrape', concurrency=self.concurrency,
+                                 requests_per_second=self.requests_per_second, rate_limiter=self.rate_limiter)
+        collected = await collect_via_queue(work_queue, slugs, worker)
+        
+        results = {}
+        for index, (url, slug) in enumerate(zip(urls, slugs)):
+            payload = collected.get(slug)
+            if not payload:
+                continue
+            result = payload['result']
+            if payload.get('prize_result'):
+                self._prize_results_by_url[result['url']] = payload['prize_result']
+            results[index] = result
+            if on_result:
+                on_result(index, url, result)
+        return results
+
+    def save_sample_results(self):
+        """Write a sample run's results to their own file; they don't go into the state store"""
+        with self.metrics.timer('save.results'):
+            os.makedirs('output', exist_ok=True)
+            with open('output/bounty_descriptions_sample.json', 'w', encoding='utf-8') as f:
+                json.dump(self.results, f, indent=2, ensure_ascii=False)
+        print(f"\nResults saved to:")
+        print(f"  - bounty_descriptions_sample.json ({len(self.results)} entries)")
+
+    def print_results_summary(self):
+        """Print scrape totals and the country breakdown of this run's results"""
         if not self.results:
             print("No results to save")
             return
         
-        # Add summary statistics including country breakdown
-        summary = {
-            'total_bounties': len(self.results),
-            'successful_scrapes': len([r for r in self.results if r['description'] != 'Description not found' and not r['description'].startswith('Error:')]),
-            'country_breakdown': {},
-            'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-        # Count country restrictions
+        successful = len([r for r in self.results
+                          if r['description'] != 'Description not found' and not r['description'].startswith('Error:')])
+        country_breakdown = {}
         for result in self.results:
             if result.get('country_restriction'):
                 country = result['country_restriction']
-                summary['country_breakdown'][country] = summary['country_breakdown'].get(country, 0) + 1
+                country_breakdown[country] = country_breakdown.get(country, 0) + 1
         
-        # Save as JSON with summary
-        output_data = {
-            'summary': summary,
-            'results': self.results
-        }
-        
-        with open(f'output/bounty_descriptions{filename_suffix}.json', 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"\nResults saved to:")
-        print(f"  - bounty_descriptions{filename_suffix}.json ({len(self.results)} entries)")
+        print(f"\n📊 {successful}/{len(self.results)} descriptions scraped successfully")
         print(f"\nCountry breakdown:")
-        for country, count in summary['country_breakdown'].items():
+        for country, count in country_breakdown.items():
             print(f"  {country}: {count} bounties")
 
 # Add these methods to the ImprovedSuperteamBountyScraper class (around line 520, before the main() function)
 
     def load_processed_bounties(self):
         """Load previously processed bounty IDs"""
-        try:
-            with open(self.processed_file, 'r') as f:
-                return set(json.load(f))
-        except FileNotFoundError:
-            return set()
+        return self.state_store.processed_ids()
     
     def save_processed_bounties(self, bounty_ids):
-        """Save processed bounty IDs"""
-        with open(self.processed_file, 'w') as f:
-            json.dump(list(bounty_ids), f)
+        """Record processed bounty IDs (processed_bounties.json is refreshed by export_views())"""
+        self.state_store.mark_processed(bounty_ids)
     
     def load_existing_results(self):
-        """Load existing results from output file"""
-        try:
-            with open(self.results_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return []
+        """Load existing results from the state store"""
+        return self.state_store.descriptions()
     
     async def scrape_new_bounties_only(self):
         """Scrape only new bounties that haven't been processed yet"""
         print("🚀 Starting incremental bounty scraping...")
         
-        # Load processed bounties and existing results
-        processed_ids = self.load_processed_bounties()
-        existing_results = self.load_existing_results()
-        
-        # Load bounty data and filter for new ones
-        all_bounties = self.load_bounties()
-        new_bounties = [b for b in all_bounties if b['id'] not in processed_ids]
+        # Indexed lookup of listings that haven't been processed yet
+        new_bounties = self.state_store.unprocessed_listings()
         
         if not new_bounties:
             print("No new bounties to process.")
@@ -536,67 +674,131 @@ class ImprovedSuperteamBountyScraper:
         
         print(f"Found {len(new_bounties)} new bounties to scrape")
         
-        # Load bounty data cache
-        self.load_bounty_data_cache()
+        # The unprocessed listings already carry their API data
+        self.bounty_data_cache.update((bounty['slug'], bounty) for bounty in new_bounties)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            new_results = []
-            new_processed_ids = set()
-            
-            for i, bounty in enumerate(new_bounties, 1):
-                slug = bounty['slug']
-                url = f"https://earn.superteam.fun/listing/{slug}"
-                
-                print(f"\n[{i}/{len(new_bounties)}] Processing: {slug}")
-                
-                try:
-                    result = await self.scrape_bounty_from_url(page, url)
-                    if result:
-                        new_results.append(result)
-                        new_processed_ids.add(bounty['id'])
-                        print(f"  ✅ Successfully scraped: {slug}")
-                    else:
-                        print(f"  ⚠️  No content found for: {slug}")
-                        
-                except Exception as e:
-                    print(f"  ❌ Error scraping {slug}: {str(e)}")
-                
-                # Small delay between requests
-                await asyncio.sleep(1)
-            
-            await browser.close()
+        urls = [f"https://earn.superteam.fun/listing/{bounty['slug']}" for bounty in new_bounties]
+        
+        # Listings finished by an interrupted earlier run are not scraped again
+        resumed = {r['url']: r for r in await asyncio.to_thread(self.replay_journal, self.incremental_journal)}
+        scraped = {i: resumed[url] for i, url in enumerate(urls) if url in resumed}
+        pending = [i for i in range(len(urls)) if i not in scraped]
+        if scraped:
+            print(f"Resuming: {len(scraped)} bounties already finished in an interrupted run")
+        
+        def on_result(position, url, result):
+            self.checkpoint(self.incremental_journal, result)
+            print(f"  ✅ Successfully scraped: {new_bounties[pending[position]]['slug']}")
+        
+        fresh = await self.scrape_urls([urls[i] for i in pending], on_result=on_result)
+        self.incremental_journal.sync()
+        for position, result in fresh.items():
+            scraped[pending[position]] = result
+        
+        new_results = []
+        new_processed_ids = set()
+        for i in sorted(scraped):
+            new_results.append(scraped[i])
+            new_processed_ids.add(new_bounties[i]['id'])
+        self.prize_results = self.collect_prize_results(new_results)
+        self.readiness.print_summary()
+        self.request_filter.print_summary()
         
         # Update results and processed IDs
         if new_results:
-            all_results = existing_results + new_results
-            
-            # Save updated results
-            with open(self.results_file, 'w', encoding='utf-8') as f:
-                json.dump(all_results, f, indent=2, ensure_ascii=False)
+            # Upsert only this run's listings; the JSON file is a derived view
+            self.state_store.upsert_descriptions(new_results)
+            if self.prize_results:
+                self.state_store.upsert_prize_results(self.prize_results)
             
             # Update processed bounties
-            all_processed_ids = processed_ids.union(new_processed_ids)
-            self.save_processed_bounties(all_processed_ids)
+            await asyncio.to_thread(self.save_processed_bounties, new_processed_ids)
+            self.record_fingerprints(new_bounties, new_results)
+            
+            # Everything in the journal is now committed to the state store
+            self.incremental_journal.clear()
             
             print(f"\n✅ Successfully processed {len(new_results)} new bounties")
-            print(f"📁 Results saved to: {self.results_file}")
-            print(f"📊 Total bounties in database: {len(all_results)}")
+            print(f"📁 Results saved to: {self.state_store.db_path}")
+            print(f"📊 Total bounties in database: {self.state_store.description_count()}")
         else:
             print("\n⚠️  No new results to save")
+        self.report_metrics()
 
-    def load_bounty_links(self):
-        """Load bounty URLs from text file"""
-        try:
-            with open(self.links_file, 'r', encoding='utf-8') as f:
-                links = [line.strip() for line in f if line.strip()]
-            return links
-        except FileNotFoundError:
-            print(f"Error: {self.links_file} not found")
+    def record_fingerprints(self, bounties, results):
+        """Store API and content fingerprints for successfully scraped listings"""
+        by_slug = {bounty['slug']: bounty for bounty in bounties}
+        rows = []
+        for result in results:
+            bounty = by_slug.get(result['slug'])
+            if bounty and result.get('status') != 'error':
+                rows.append((bounty['id'], bounty['slug'], api_fingerprint(bounty), content_fingerprint(result)))
+        self.state_store.save_fingerprints(rows)
+
+    async def refresh_changed_bounties(self, changed_bounties):
+        """Re-scrape listings whose API data changed and upsert only those records.
+
+        A listing whose re-scrape fails keeps its old fingerprint, so the next
+        refresh picks it up again. Failures are counted in the state store,
+        which caps the retries of listings whose first scrape failed.
+        """
+        if not changed_bounties:
+            print("No changed bounties to refresh.")
             return []
+
+        print(f"🔄 Refreshing {len(changed_bounties)} changed bounties...")
+        self.state_store.upsert_listings(changed_bounties)
+        self.bounty_data_cache.update((bounty['slug'], bounty) for bounty in changed_bounties)
+
+        urls = [f"https://earn.superteam.fun/listing/{bounty['slug']}" for bounty in changed_bounties]
+        scraped = await self.scrape_urls(urls)
+        refreshed = [scraped[i] for i in sorted(scraped) if scraped[i].get('status') != 'error']
+        refreshed_slugs = {r['slug'] for r in refreshed}
+        failed_slugs = [bounty['slug'] for bounty in changed_bounties if bounty['slug'] not in refreshed_slugs]
+        failed = len(failed_slugs)
+
+        content_changed = [r['slug'] for r in refreshed
+                           if content_fingerprint(r) != self.state_store.content_fingerprint(r['slug'])]
+        self.prize_results = self.collect_prize_results(refreshed)
+        self.readiness.print_summary()
+        self.request_filter.print_summary()
+
+        if refreshed:
+            self.state_store.upsert_descriptions(refreshed)
+            if self.prize_results:
+                self.state_store.upsert_prize_results(self.prize_results)
+            self.record_fingerprints(changed_bounties, refreshed)
+        if failed_slugs:
+            self.state_store.add_scrape_retries(failed_slugs)
+
+        print(f"\n✅ Refreshed {len(refreshed)} bounties, {len(content_changed)} with changed content")
+        for slug in content_changed:
+            print(f"  📝 {slug}")
+        if failed:
+            print(f"⚠️  {failed} bounties failed and will be retried on the next refresh")
+        self.report_metrics()
+        return refreshed
+
+    def report_metrics(self):
+        """Print the per-stage timing table and write output/metrics.prom"""
+        self.strategy_ranker.flush()
+        self.strategy_ranker.print_summary()
+        self.rate_limiter.print_summary()
+        self.metrics.set_gauge('request_rate', self.rate_limiter.rate)
+        self.metrics.print_summary()
+        path = self.metrics.write_prometheus()
+        print(f"📈 Metrics written to: {path}")
+
+    def collect_prize_results(self, results):
+        """Return prize results gathered during scraping, in the same order as results"""
+        return [self._prize_results_by_url[r['url']] for r in results if r['url'] in self._prize_results_by_url]
+
+    def load_bounty_links(self, since=None):
+        """Load bounty URLs from the link registry, optionally only those first seen since a timestamp"""
+        links = self.link_registry.urls(since)
+        if not links:
+            print(f"Error: no links in {self.links_file}")
+        return links
     
     def extract_slug_from_url(self, url):
         """Extract slug from full URL"""
@@ -604,11 +806,29 @@ class ImprovedSuperteamBountyScraper:
             return url.split('/listing/')[-1]
         return url
     
-    def load_bounty_data_cache(self):
-        """Load and cache bounty data from API JSON for quick lookup"""
+    def load_bounty_data_cache(self, slugs=None):
+        """Load and cache bounty data from the state store (or API JSON) for quick lookup.
+        
+        With `slugs`, only those listings that aren't cached yet are read.
+        """
+        if slugs is not None:
+            slugs = [slug for slug in slugs if slug not in self.bounty_data_cache]
+            if not slugs:
+                return
+            bounties = self.state_store.listings_by_slugs(slugs)
+        else:
+            bounties = self.state_store.listings()
+        if bounties:
+            for bounty in bounties:
+                self.bounty_data_cache[bounty['slug']] = bounty
+            print(f"Loaded {len(bounties)} bounties into cache")
+            return
         try:
             with open(self.json_file, 'r', encoding='utf-8') as f:
                 bounties = json.load(f)
+                if slugs is not None:
+                    wanted = set(slugs)
+                    bounties = [bounty for bounty in bounties if bounty.get('slug') in wanted]
                 # Create a lookup cache by slug
                 for bounty in bounties:
                     self.bounty_data_cache[bounty['slug']] = bounty
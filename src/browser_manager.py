@@ -0,0 +1,224 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from run_metrics import get_metrics
+
+BROWSER_ARGS = ['--no-sandbox', '--disable-dev-shm-usage']
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+DEFAULT_VIEWPORT = {'width': 1280, 'height': 800}
+
+
+def process_tree_rss(root_pid):
+    """Resident memory in bytes of a process and all its descendants (Linux /proc)"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                # The command name may contain spaces, so split after its closing paren
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        try:
+            with open(f'/proc/{pid}/statm', 'r') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            pass
+        stack.extend(children.get(pid, []))
+    return total
+
+
+class BrowserManager:
+    """Shared Chromium instance handing out uniformly configured contexts and pages.
+
+    Every context gets the same user agent, viewport and request filter.
+    Pages are borrowed with `async with manager.page() as page:`; at most
+    `max_pages` are open at once and up to `warm_pages` released pages are
+    kept open for the next borrower. The context is replaced once
+    `recycle_after` navigations have gone through it (reported with
+    record_navigations()) or the process tree uses more than
+    `max_memory_mb`. Recycling rotates: new borrowers get a fresh context
+    while pages still out on the old one finish, and the old context is
+    closed when its last page comes back. So recycling happens even when
+    pages are borrowed back to back, and never pulls a page out from under
+    a running scrape. Only one old context is drained at a time.
+    """
+
+    def __init__(self, user_agent=DEFAULT_USER_AGENT, request_filter=None, recycle_after=50, headless=True,
+                 viewport=None, max_pages=8, warm_pages=0, max_memory_mb=None):
+        self.user_agent = user_agent
+        self.request_filter = request_filter
+        self.recycle_after = max(1, recycle_after)
+        self.headless = headless
+        self.viewport = viewport or DEFAULT_VIEWPORT
+        self.max_pages = max(1, max_pages)
+        self.warm_pages = min(warm_pages, self.max_pages)
+        self.max_memory_mb = max_memory_mb
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._idle_pages = []
+        # Borrowed pages per open context, and the recycled context still draining
+        self._borrowed = {}
+        self._retiring = None
+        self._page_slots = asyncio.Semaphore(self.max_pages)
+        self._lock = asyncio.Lock()
+        self.pages_in_use = 0
+        self.navigations = 0
+        self.recycles = 0
+        self.launches = 0
+
+    async def start(self):
+        """Launch the browser (no-op if already running)"""
+        if self._browser is None or not self._browser.is_connected():
+            if self._playwright is None:
+                # Imported here so modules that only parse saved pages don't need Playwright
+                from playwright.async_api import async_playwright
+                self._playwright = await async_playwright().start()
+            with get_metrics().timer('browser_launch'):
+                self._browser = await self._playwright.chromium.launch(headless=self.headless, args=BROWSER_ARGS)
+            self._context = None
+            self._idle_pages = []
+            self._borrowed = {}
+            self._retiring = None
+            self.navigations = 0
+            self.launches += 1
+            print("🌐 Browser launched")
+        return self._browser
+
+    def memory_mb(self):
+        """Resident memory of this process and its browser processes, or None without /proc"""
+        if not os.path.isdir('/proc'):
+            return None
+        return process_tree_rss(os.getpid()) / (1024 * 1024)
+
+    def recycle_reason(self):
+        if self.navigations >= self.recycle_after:
+            return f"{self.navigations} navigations"
+        if self.max_memory_mb:
+            memory = self.memory_mb()
+            if memory is not None and memory > self.max_memory_mb:
+                return f"{memory:.0f} MB resident"
+        return None
+
+    async def context(self):
+        """Current browser context, replaced once it is over its navigation or memory budget"""
+        async with self._lock:
+            return await self._current_context()
+
+    async def _current_context(self):
+        await self.start()
+        if self._context is not None and self._retiring is None:
+            reason = self.recycle_reason()
+            if reason:
+                await self._retire_context()
+                self.recycles += 1
+                print(f"♻️  Recycled browser context after {reason}")
+        if self._context is None:
+            self._context = await self._browser.new_context(user_agent=self.user_agent, viewport=self.viewport)
+            self._borrowed[self._context] = 0
+            if self.request_filter:
+                await self.request_filter.apply(self._context)
+            self.navigations = 0
+            # Pre-warm pages so the first borrowers don't pay for new_page()
+            for _ in range(self.warm_pages):
+                self._idle_pages.append(await self._context.new_page())
+        return self._context
+
+    async def _retire_context(self):
+        """Stop handing out the current context; close it now or once its borrowed pages are back"""
+        context = self._context
+        self._context = None
+        for page in self._idle_pages:
+            if not page.is_closed():
+                await page.close()
+        self._idle_pages = []
+        if self._borrowed.get(context):
+            self._retiring = context
+        else:
+            self._borrowed.pop(context, None)
+            await context.close()
+
+    async def acquire_page(self):
+        """Borrow a page, waiting while `max_pages` are already out"""
+        await self._page_slots.acquire()
+        context = None
+        try:
+            async with self._lock:
+                context = await self._current_context()
+                # Counted before any await so the context can't be closed under the new page
+                self._borrowed[context] += 1
+                page = self._idle_pages.pop() if self._idle_pages else None
+            if page is None:
+                page = await context.new_page()
+        except BaseException:
+            if context is not None:
+                await self._returned(context)
+            self._page_slots.release()
+            raise
+        self.pages_in_use += 1
+        return page
+
+    async def release_page(self, page):
+        """Return a borrowed page; it stays open for reuse while fewer than `warm_pages` are idle"""
+        self.pages_in_use -= 1
+        context = page.context
+        try:
+            if (context is self._context and len(self._idle_pages) < self.warm_pages
+                    and not page.is_closed()):
+                self._idle_pages.append(page)
+            elif not page.is_closed():
+                await page.close()
+            await self._returned(context)
+        finally:
+            self._page_slots.release()
+
+    async def _returned(self, context):
+        """Count a page as returned; closes a recycled context once its last page is back"""
+        if context in self._borrowed:
+            self._borrowed[context] -= 1
+        if context is self._retiring and not self._borrowed.get(context):
+            self._retiring = None
+            self._borrowed.pop(context, None)
+            await context.close()
+
+    @asynccontextmanager
+    async def page(self):
+        page = await self.acquire_page()
+        try:
+            yield page
+        finally:
+            await self.release_page(page)
+
+    def navigations_left(self):
+        """Navigations the current context may still serve before it is recycled"""
+        if self._context is None:
+            return self.recycle_after
+        return max(1, self.recycle_after - self.navigations)
+
+    def record_navigations(self, count):
+        self.navigations += count
+
+    async def close(self):
+        self._idle_pages = []
+        if self._retiring is not None:
+            await self._retiring.close()
+            self._retiring = None
+        if self._context is not None:
+            await self._context.close()
+            self._context = None
+        self._borrowed = {}
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
@@ -0,0 +1,136 @@
+import json
+import os
+
+
+class CheckpointJournal:
+    """Crash-safe append-only JSONL journal with one record per finished item.
+
+    Each append writes a single line and flushes it; fsync runs every
+    `fsync_every` appends (and on sync/close), so checkpoint cost stays
+    constant per item instead of growing with the number of results.
+    A torn last line from a crash is ignored on replay.
+
+    Re-checkpointed keys leave stale lines behind, so once the journal has
+    at least `compact_min_lines` lines and more than `compact_ratio` lines
+    per live key it is compacted automatically.
+    """
+
+    def __init__(self, path, key='url', fsync_every=5, compact_ratio=2.0, compact_min_lines=1000):
+        self.path = path
+        self.key = key
+        self.fsync_every = max(1, fsync_every)
+        self.compact_ratio = compact_ratio
+        self.compact_min_lines = compact_min_lines
+        self.compactions = 0
+        self._file = None
+        self._unsynced = 0
+        self._lines = None
+        self._keys = set()
+
+    def _count(self):
+        """Count the lines and live keys already in the journal"""
+        self._lines = 0
+        self._keys = set()
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                self._lines += 1
+                try:
+                    self._keys.add(self.key_of(json.loads(line)))
+                except json.JSONDecodeError:
+                    continue
+
+    def _open(self):
+        if self._lines is None:
+            self._count()
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+            # Terminate a torn line left by a crash so the next record stays readable
+            if self._file.tell() > 0:
+                with open(self.path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        self._file.write('\n')
+        return self._file
+
+    def append(self, record):
+        """Append one record; durable after the next fsync batch"""
+        f = self._open()
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        f.flush()
+        self._unsynced += 1
+        self._lines += 1
+        self._keys.add(self.key_of(record))
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+        if self._lines >= self.compact_min_lines and self._lines > self.compact_ratio * len(self._keys):
+            self.compact()
+
+    def sync(self):
+        """Force everything appended so far to disk"""
+        if self._file is not None and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def replay(self):
+        """Return journaled records in order, keeping the latest record per key"""
+        if not os.path.exists(self.path):
+            return []
+        records = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partially written line from an interrupted run
+                    continue
+                key = self.key_of(record)
+                records.pop(key, None)
+                records[key] = record
+        return list(records.values())
+
+    def key_of(self, record):
+        value = record
+        for part in self.key.split('.'):
+            value = value.get(part) if isinstance(value, dict) else None
+        return value
+
+    def compact(self):
+        """Rewrite the journal with one line per key"""
+        self.close()
+        records = self.replay()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.compactions += 1
+        self._lines = len(records)
+        self._keys = {self.key_of(record) for record in records}
+        return len(records)
+
+    def clear(self):
+        """Drop the journal once its records have been committed elsewhere"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._lines = None
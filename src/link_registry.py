@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+from checkpoint_journal import CheckpointJournal
+
+# Get the project root directory (parent of src)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LISTING_URL = 'https://earn.superteam.fun/listing/{}'
+
+
+class LinkRegistry:
+    """Every listing slug ever seen, with first-seen and last-seen timestamps.
+
+    The slug index is an append-only JSONL journal (latest line per slug
+    wins) loaded into a dict, so membership checks are O(1).
+    bounty_links.txt only ever gets lines appended for unseen slugs.
+    last_seen is written at most once per `touch_interval` seconds per slug,
+    and the index is compacted once it holds more superseded lines than live
+    ones.
+    """
+
+    def __init__(self, links_file=None, index_file=None, touch_interval=3600):
+        self.links_file = links_file or os.path.join(project_root, 'data', 'bounty_links.txt')
+        # bounty_links.txt -> bounty_links.index.jsonl next to it
+        self.index = CheckpointJournal(index_file or os.path.splitext(self.links_file)[0] + '.index.jsonl',
+                                       key='slug')
+        self.touch_interval = touch_interval
+        self._entries = None
+        self._stale_lines = 0
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = {entry['slug']: entry for entry in self.index.replay()}
+            if not self._entries:
+                self._seed_from_links_file()
+        return self._entries
+
+    def _seed_from_links_file(self):
+        """Index a links file written before the registry existed"""
+        if not os.path.exists(self.links_file):
+            return
+        seen_at = os.path.getmtime(self.links_file)
+        with open(self.links_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                url = line.strip()
+                slug = url.rstrip('/').split('/')[-1] if url else None
+                if slug and slug not in self._entries:
+                    entry = {'slug': slug, 'url': url, 'first_seen': seen_at, 'last_seen': seen_at}
+                    self._entries[slug] = entry
+                    self.index.append(entry)
+        self.index.sync()
+
+    def __contains__(self, slug):
+        return slug in self._load()
+
+    def __len__(self):
+        return len(self._load())
+
+    def get(self, slug):
+        return self._load().get(slug)
+
+    def record(self, bounties, seen_at=None):
+        """Register listings returned by the API; returns the slugs that were not known before"""
+        seen_at = seen_at or time.time()
+        added = []
+        with self._lock:
+            entries = self._load()
+            for bounty in bounties:
+                slug = bounty.get('slug')
+                if not slug:
+                    continue
+                entry = entries.get(slug)
+                if entry is None:
+                    entry = {'slug': slug, 'url': LISTING_URL.format(slug), 'first_seen': seen_at, 'last_seen': seen_at}
+                    added.append(entry)
+                elif seen_at - entry['last_seen'] >= self.touch_interval:
+                    entry = dict(entry, last_seen=seen_at)
+                    self._stale_lines += 1
+                else:
+                    continue
+                entries[slug] = entry
+                self.index.append(entry)
+
+            if added:
+                directory = os.path.dirname(self.links_file)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.links_file, 'a', encoding='utf-8') as f:
+                    for entry in added:
+                        f.write(entry['url'] + '\n')
+            self.index.sync()
+            if self._stale_lines > len(entries):
+                self.index.compact()
+                self._stale_lines = 0
+        if added:
+            print(f"🔗 Added {len(added)} new links to {os.path.basename(self.links_file)} ({len(entries)} known)")
+        return [entry['slug'] for entry in added]
+
+    def urls(self, since=None):
+        """Listing URLs in first-seen order, optionally only those first seen at or after `since`"""
+        entries = sorted(self._load().values(), key=lambda e: e['first_seen'])
+        return [e['url'] for e in entries if since is None or e['first_seen'] >= since]
+
+    def seen_since(self, timestamp):
+        """Slugs the API has listed at or after `timestamp` (within `touch_interval`)"""
+        return [slug for slug, e in self._load().items() if e['last_seen'] >= timestamp]
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_link_registry(links_file=None):
+    """Shared LinkRegistry for a links file (default data/bounty_links.txt), one per absolute path"""
+    links_file = os.path.abspath(links_file or os.path.join(project_root, 'data', 'bounty_links.txt'))
+    with _registries_lock:
+        if links_file not in _registries:
+            _registries[links_file] = LinkRegistry(links_file)
+        return _registries[links_file]
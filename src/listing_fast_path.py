@@ -0,0 +1,204 @@
+import json
+import re
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from browser_manager import DEFAULT_USER_AGENT
+from offline_page import OfflinePage
+
+NEXT_DATA_PATTERN = re.compile(
+    r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
+# Ordinal reward keys used by older listings; newer ones use "1", "2", ...
+ORDINAL_KEYS = ['first', 'second', 'third', 'fourth', 'fifth', 'sixth', 'seventh', 'eighth', 'ninth', 'tenth']
+# Reward key earn.superteam.fun uses for bonus spots
+BONUS_REWARD_KEY = '99'
+
+
+def ordinal(position):
+    """1 -> '1st', 2 -> '2nd', 11 -> '11th'"""
+    if 10 <= position % 100 <= 20:
+        suffix = 'th'
+    else:
+        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(position % 10, 'th')
+    return f"{position}{suffix}"
+
+
+class ListingFastPath:
+    """Read listing data from the server-rendered Next.js payload without a browser.
+
+    extract_listing() returns None whenever the payload is missing or fails
+    validation (no description, or prizes that don't add up to the total),
+    so callers can fall back to Playwright for just those listings. Requests
+    go out with the browser's default user agent unless `user_agent` is
+    given; pass the BrowserManager's when it uses a custom one.
+    """
+
+    def __init__(self, session=None, timeout=15, pool_size=8, user_agent=DEFAULT_USER_AGENT, rate_limiter=None):
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        if session is None:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+        self.user_agent = user_agent
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+        # Optional AdaptiveRateLimiter fed with each response's status and latency
+        self.rate_limiter = rate_limiter
+        self.hits = 0
+        self.misses = 0
+
+    def fetch_next_data(self, url):
+        """Fetch a listing page and return its embedded __NEXT_DATA__ JSON"""
+        return self.parse_next_data(self.fetch_page(url))
+
+    def fetch_page(self, url):
+        """Fetch a listing page's server-rendered HTML"""
+        started = time.monotonic()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            if self.rate_limiter:
+                self.rate_limiter.record(error=e, kind='http')
+            raise
+        if self.rate_limiter:
+            self.rate_limiter.record(status=response.status_code, latency=time.monotonic() - started, kind='http')
+        response.raise_for_status()
+        return response.text
+
+    def parse_next_data(self, html):
+        match = NEXT_DATA_PATTERN.search(html)
+        if not match:
+            return None
+        return json.loads(match.group(1))
+
+    def find_listing(self, data, slug):
+        """Depth-first search for the listing object with this slug"""
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                if node.get('slug') == slug and ('rewards' in node or 'description' in node):
+                    return node
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        return None
+
+    def prizes_from_rewards(self, listing):
+        """Convert the listing's rewards map into prize breakdown entries"""
+        rewards = listing.get('rewards') or {}
+        prizes = []
+        numbered = []
+        for key, amount in rewards.items():
+            if amount in (None, ''):
+                continue
+            key = str(key)
+            if key == BONUS_REWARD_KEY:
+                continue
+            if key.isdigit():
+                numbered.append((int(key), amount))
+            elif key.lower() in ORDINAL_KEYS:
+                numbered.append((ORDINAL_KEYS.index(key.lower()) + 1, amount))
+
+        for position, amount in sorted(numbered):
+            prizes.append({'position': ordinal(position), 'amount': int(float(amount))})
+
+        bonus = rewards.get(BONUS_REWARD_KEY)
+        bonus_spots = listing.get('maxBonusSpots') or 0
+        if bonus and bonus_spots:
+            prizes.append({'position': 'additional', 'amount': int(float(bonus)) * int(bonus_spots)})
+
+        return prizes
+
+    def country_from_region(self, region):
+        if not region or str(region).lower() == 'global':
+            return 'GLOBAL'
+        return str(region).upper()
+
+    def extract_listing(self, url, slug, api_data=None, snapshot_archive=None):
+        """Return (record, prize_result) for a listing, or None if the fast path can't be trusted.
+
+        With a SnapshotArchive, the fetched HTML of a listing the fast path
+        handled is archived like a rendered page would be.
+        """
+        api_data = api_data or {}
+        html = None
+        try:
+            html = self.fetch_page(url)
+            data = self.parse_next_data(html)
+            listing = self.find_listing(data, slug) if data else None
+        except Exception as e:
+            print(f"  ⚠️  Fast path failed for {slug}: {e}")
+            listing = None
+
+        if not listing:
+            self.misses += 1
+            return None
+
+        try:
+            description_html = listing.get('description') or ''
+            description = OfflinePage(description_html).body.inner_text() if description_html else ''
+            prizes = self.prizes_from_rewards(listing)
+            total_reward = listing.get('rewardAmount')
+            if total_reward in (None, ''):
+                total_reward = api_data.get('rewardAmount')
+            total_reward = int(float(total_reward)) if total_reward not in (None, '') else None
+        except (TypeError, ValueError) as e:
+            self.misses += 1
+            print(f"  ⚠️  Fast path could not parse {slug}: {e}")
+            return None
+
+        individual_sum = sum(prize['amount'] for prize in prizes)
+        amounts_match = (total_reward == individual_sum) if total_reward else False
+
+        if not description or not amounts_match:
+            self.misses += 1
+            print(f"  ↪️  Fast path data for {slug} failed validation, falling back to browser")
+            return None
+
+        token = listing.get('token') or api_data.get('token', '')
+        sponsor = listing.get('sponsor') or api_data.get('sponsor') or {}
+        title = listing.get('title') or api_data.get('title') or slug.replace('-', ' ').title()
+        prize_result = {
+            'title': title,
+            'slug': slug,
+            'url': url,
+            'total_reward': total_reward,
+            'prize_breakdown': {
+                'individual_prizes': prizes,
+                'token_type': token or 'USDC',
+                'total_prizes': len(prizes)
+            },
+            'individual_sum': individual_sum,
+            'amounts_match': amounts_match
+        }
+        record = {
+            'title': title,
+            'slug': slug,
+            'url': url,
+            'description': description,
+            'country_restriction': self.country_from_region(listing.get('region')),
+            'reward_amount': api_data.get('rewardAmount', total_reward),
+            'token': token,
+            'deadline': listing.get('deadline') or api_data.get('deadline', ''),
+            'sponsor': sponsor.get('name', '') if isinstance(sponsor, dict) else '',
+            'status': 'active'
+        }
+
+        if snapshot_archive:
+            try:
+                snapshot_archive.save(slug, url, html)
+            except OSError as e:
+                print(f"  ⚠️  Could not archive snapshot for {slug}: {e}")
+
+        self.hits += 1
+        print(f"  ⚡ Fast path extracted {slug} ({len(prizes)} prizes, total {total_reward})")
+        return record, prize_result
+
+    def print_summary(self):
+        total = self.hits + self.misses
+        if total:
+            print(f"\n⚡ HTTP fast path: {self.hits}/{total} listings without a browser, "
+                  f"{self.misses} fell back to Playwright")
@@ -0,0 +1,27 @@
+import hashlib
+import json
+
+# API fields that change when a sponsor edits a listing
+API_FINGERPRINT_FIELDS = [
+    'title', 'rewardAmount', 'rewards', 'maxBonusSpots', 'token', 'deadline',
+    'status', 'region', 'isWinnersAnnounced', 'isPublished',
+]
+# Parts of a scraped record that matter downstream
+CONTENT_FINGERPRINT_FIELDS = ['description', 'country_restriction', 'extracted_prize_data']
+
+
+def _digest(fields):
+    payload = json.dumps(fields, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def api_fingerprint(bounty):
+    """Hash of the listing fields from the API, including any updated-at style value"""
+    fields = {key: bounty.get(key) for key in API_FINGERPRINT_FIELDS}
+    fields.update({key: value for key, value in bounty.items() if 'updated' in key.lower()})
+    return _digest(fields)
+
+
+def content_fingerprint(record):
+    """Hash of the extracted description, country and prize data"""
+    return _digest({key: record.get(key) for key in CONTENT_FINGERPRINT_FIELDS})
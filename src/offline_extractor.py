@@ -0,0 +1,90 @@
+import asyncio
+import json
+import os
+import time
+from bounty_scraper import ImprovedSuperteamBountyScraper
+from offline_page import AsyncOfflinePage, OfflinePage
+from page_scripts import BODY_TEXT_JS
+from prize_extractor import PrizeExtractor
+from snapshot_archive import SnapshotArchive
+from state_store import get_state_store
+from strategy_ranker import StrategyRanker
+
+
+class OfflineReextractor:
+    """Re-run description, country and prize extraction against archived snapshots.
+
+    Calls the same strategy methods as ImprovedSuperteamBountyScraper and
+    PrizeExtractor on an AsyncOfflinePage, which answers their page calls and
+    page scripts from the saved HTML, so no browser or network access is
+    needed. Strategies run in the order the recorded stats give, but
+    re-extracting doesn't add to those stats.
+    """
+
+    def __init__(self, scraper=None, prize_extractor=None, archive=None, state_store=None):
+        ranker = StrategyRanker(state_store=state_store or get_state_store(), exploration=0, persist=False)
+        self.scraper = scraper or ImprovedSuperteamBountyScraper(state_store=state_store, strategy_ranker=ranker)
+        self.prize_extractor = prize_extractor or PrizeExtractor(state_store=state_store, strategy_ranker=ranker)
+        self.archive = archive or SnapshotArchive()
+
+    async def reextract_page(self, html, slug, url, inner_text=None):
+        """Build a merged description + prize record from saved page HTML"""
+        page = AsyncOfflinePage(OfflinePage(html, inner_text))
+        api_data = self.scraper.bounty_data_cache.get(slug, {})
+        description = await self.scraper.extract_description_smart(page, slug)
+        country_restriction = await self.scraper.extract_country_restriction(page, url)
+        prize_result = await self.prize_extractor.extract_prizes_from_page(page, url)
+
+        reward_amount = api_data.get('rewardAmount')
+        if reward_amount is None:
+            reward_amount = self.scraper.extract_reward_amount_from_page(await page.evaluate(BODY_TEXT_JS))
+
+        return {
+            'title': api_data.get('title') or prize_result['title'],
+            'slug': slug,
+            'url': url,
+            'description': description,
+            'country_restriction': country_restriction,
+            'reward_amount': reward_amount,
+            'token': api_data.get('token', ''),
+            'deadline': api_data.get('deadline', ''),
+            'sponsor': (api_data.get('sponsor') or {}).get('name', ''),
+            'status': 'active',
+            'extracted_prize_data': self.prize_extractor.to_extracted_prize_data(prize_result)
+        }
+
+    async def reextract_entry(self, entry):
+        """Re-extract one archived snapshot"""
+        print(f"\n📦 Re-extracting {entry['slug']} (captured {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['fetched_at']))})")
+        result = await self.reextract_page(self.archive.load_html(entry), entry['slug'], entry['url'],
+                                           self.archive.load_text(entry))
+        result['snapshot_fetched_at'] = entry['fetched_at']
+        return result
+
+    async def reextract_all(self, output_file='output/bounty_descriptions_reextracted.json'):
+        """Re-extract the latest snapshot of every archived listing"""
+        entries = sorted(self.archive.latest().values(), key=lambda e: e['slug'])
+        if not entries:
+            print("No archived snapshots found")
+            return []
+        self.scraper.load_bounty_data_cache([entry['slug'] for entry in entries])
+
+        started = time.time()
+        results = []
+        for entry in entries:
+            try:
+                results.append(await self.reextract_entry(entry))
+            except Exception as e:
+                print(f"  ✗ Error re-extracting {entry['slug']}: {e}")
+
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+        print(f"\n🎉 Re-extracted {len(results)} listings from snapshots in {time.time() - started:.1f}s")
+        print(f"📁 Results saved to: {output_file}")
+        return results
+
+
+if __name__ == "__main__":
+    asyncio.run(OfflineReextractor().reextract_all())
@@ -0,0 +1,337 @@
+import hashlib
+import re
+from html.parser import HTMLParser
+
+# Elements whose contents never show up in innerText
+SKIPPED_TAGS = {'script', 'style', 'noscript', 'template', 'head', 'svg'}
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+# Elements that start a new line in innerText
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figcaption',
+    'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav',
+    'ol', 'p', 'pre', 'section', 'table', 'tr', 'ul',
+}
+
+SELECTOR_PART = re.compile(r'([a-zA-Z0-9]*)((?:\.[\w-]+)*)((?:\[[^\]]+\])*)((?::has-text\("[^"]*"\))*)$')
+ATTRIBUTE_PART = re.compile(r'\[([\w-]+)(\*=|=)"([^"]*)"\]')
+HAS_TEXT_PART = re.compile(r':has-text\("([^"]*)"\)')
+POSITION_LABELS = ['1st', '2nd', '3rd', '4th', '5th', '6th', '7th', '8th', '9th', '10th']
+
+
+def has_text_in(node, text):
+    """Playwright-style :has-text() check (case-insensitive substring)"""
+    return text.lower() in node.text_content().lower()
+
+
+class OfflineNode:
+    """A parsed HTML element with just enough of the DOM API for extraction"""
+
+    def __init__(self, tag, attrs, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs)
+        self.classes = set((self.attrs.get('class') or '').split())
+        self.parent = parent
+        self.children = []
+
+    def matches(self, selector):
+        """Match a simple compound selector such as 'div.flex.gap-1', 'div[class*="x"]' or 'p:has-text("x")'"""
+        match = SELECTOR_PART.match(selector.strip())
+        if not match:
+            return False
+        tag, classes, attributes, has_text = match.groups()
+        if tag and tag.lower() != self.tag:
+            return False
+        if any(cls not in self.classes for cls in classes.split('.') if cls):
+            return False
+        for name, operator, value in ATTRIBUTE_PART.findall(attributes):
+            actual = self.attrs.get(name)
+            if actual is None:
+                return False
+            if operator == '=' and actual != value:
+                return False
+            if operator == '*=' and value not in actual:
+                return False
+        return all(has_text_in(self, text) for text in HAS_TEXT_PART.findall(has_text))
+
+    def iter_descendants(self):
+        for child in self.children:
+            if isinstance(child, OfflineNode):
+                yield child
+                yield from child.iter_descendants()
+
+    def query_selector_all(self, selector):
+        """Return descendants matching any of the comma-separated selectors, in document order"""
+        selectors = [part for part in selector.split(',') if part.strip()]
+        return [node for node in self.iter_descendants() if any(node.matches(sel) for sel in selectors)]
+
+    def query_selector(self, selector):
+        matches = self.query_selector_all(selector)
+        return matches[0] if matches else None
+
+    def closest(self, selector):
+        node = self
+        while node is not None:
+            if node.matches(selector):
+                return node
+            node = node.parent
+        return None
+
+    def text_content(self):
+        """Raw concatenated text, like Node.textContent"""
+        parts = []
+        for child in self.children:
+            if isinstance(child, OfflineNode):
+                if child.tag not in SKIPPED_TAGS:
+                    parts.append(child.text_content())
+            else:
+                parts.append(child)
+        return ''.join(parts)
+
+    def inner_text(self):
+        """Approximate Element.innerText: block elements on their own lines"""
+        lines = []
+        current = []
+        self._collect_lines(lines, current)
+        self._flush(lines, current)
+        text = '\n'.join(line.strip() for line in lines)
+        return re.sub(r'\n{3,}', '\n\n', text).strip()
+
+    def _collect_lines(self, lines, current):
+        for child in self.children:
+            if isinstance(child, OfflineNode):
+                if child.tag in SKIPPED_TAGS:
+                    continue
+                if child.tag in BLOCK_TAGS:
+                    self._flush(lines, current)
+                    child._collect_lines(lines, current)
+                    self._flush(lines, current)
+                else:
+                    child._collect_lines(lines, current)
+            else:
+                current.append(child)
+
+    @staticmethod
+    def _flush(lines, current):
+        if current:
+            line = re.sub(r'\s+', ' ', ''.join(current)).strip()
+            if line:
+                lines.append(line)
+            current.clear()
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = OfflineNode('#document', [])
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = OfflineNode(tag, attrs, parent=self.current)
+        self.current.children.append(node)
+        if tag not in VOID_TAGS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self.current.children.append(OfflineNode(tag, attrs, parent=self.current))
+
+    def handle_endtag(self, tag):
+        # Close up to the nearest open element with this tag; ignore stray end tags
+        node = self.current
+        while node is not None and node.tag != tag:
+            node = node.parent
+        if node is not None and node.parent is not None:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+
+class OfflinePage:
+    """Read-only stand-in for a loaded Playwright page built from saved HTML"""
+
+    def __init__(self, html, inner_text=None):
+        builder = _TreeBuilder()
+        builder.feed(html)
+        builder.close()
+        self.html = html
+        self.document = builder.root
+        self.body = self.document.query_selector('body') or self.document
+        self._inner_text = inner_text
+
+    def title(self):
+        node = self.document.query_selector('title')
+        return node.text_content().strip() if node else ''
+
+    def content(self):
+        return self.html
+
+    def body_text(self):
+        """Saved innerText when available, otherwise an approximation from the HTML"""
+        if self._inner_text is not None:
+            return self._inner_text
+        return self.body.inner_text()
+
+    def query_selector_all(self, selector):
+        return self.document.query_selector_all(selector)
+
+    def query_selector(self, selector):
+        return self.document.query_selector(selector)
+
+
+def description_candidates(page, args):
+    """Twin of page_scripts.DESCRIPTION_CANDIDATES_JS"""
+    def selectors():
+        for selector in args['selectors']:
+            for element in page.query_selector_all(selector):
+                text = element.inner_text()
+                if len(text) > 30:
+                    return {'text': text, 'selector': selector}
+        return None
+
+    def paragraph():
+        for p in page.query_selector_all('p'):
+            text = p.inner_text()
+            if len(text) > 50:
+                return {'text': text}
+        return None
+
+    def main():
+        main = page.query_selector('main')
+        if not main:
+            return None
+        for line in main.inner_text().split('\n'):
+            line = line.strip()
+            if len(line) > 100 and not line.startswith(('$', 'USDC', 'Deadline')):
+                return {'text': line}
+        return None
+
+    def divs():
+        for div in page.query_selector_all('div'):
+            text = div.inner_text()
+            if (100 < len(text) < 2000 and 'Sign in' not in text and 'Menu' not in text
+                    and 'Navigation' not in text and ' ' in text):
+                return {'text': text}
+        return None
+
+    strategies = {'selectors': selectors, 'paragraph': paragraph, 'main': main, 'divs': divs}
+    tried = []
+    for name in args['order']:
+        tried.append(name)
+        found = strategies[name]()
+        if found:
+            return {'text': found['text'], 'selector': found.get('selector'), 'strategy': name, 'tried': tried}
+    return {'text': None, 'selector': None, 'strategy': None, 'tried': tried}
+
+
+def prize_table(page, args=None):
+    """Twin of page_scripts.PRIZE_TABLE_JS"""
+    def find_position(row, labels):
+        return next((p for p in row.query_selector_all('p')
+                     if p.matches('p.mt-auto.mb-1') or any(has_text_in(p, label) for label in labels)), None)
+
+    def text_of(node):
+        return node.inner_text() if node else None
+
+    rows = []
+    for row in page.query_selector_all('div.relative.flex.gap-3'):
+        container = row.query_selector('div.flex.gap-1')
+        amount = container.query_selector('p.ml-auto') if container else None
+        position = find_position(row, POSITION_LABELS) if amount else None
+        plus = next((p for p in row.query_selector_all('p') if has_text_in(p, '+')), None)
+        rows.append({'amount': text_of(amount), 'position': text_of(position), 'plus': text_of(plus)})
+
+    amount_rows = []
+    for amount in page.query_selector_all('p.ml-auto'):
+        row = amount.closest('div.relative.flex.gap-3')
+        position = find_position(row, POSITION_LABELS[:5]) if row else None
+        if position:
+            amount_rows.append({'amount': amount.inner_text(), 'position': position.inner_text()})
+
+    token = next((span for span in page.query_selector_all('span')
+                  if any(has_text_in(span, name) for name in ['USDC', 'SOL', 'JUP'])), None)
+
+    return {'rows': rows, 'amount_rows': amount_rows, 'token': text_of(token), 'body_text': page.body_text()}
+
+
+def body_text(page, args=None):
+    """Twin of page_scripts.BODY_TEXT_JS"""
+    return page.body_text()
+
+
+def closest_container(node, args=None):
+    """Twin of page_scripts.CLOSEST_CONTAINER_JS"""
+    return node.closest('div') or node.closest('td')
+
+
+def script_fingerprint(script):
+    return hashlib.sha1(script.encode('utf-8')).hexdigest()[:12]
+
+
+# Python twins of the page scripts, keyed by the fingerprint of the script text
+# each one mirrors. Editing a script changes its fingerprint, so the stale twin
+# stops being used until it is updated and re-keyed.
+SCRIPT_TWINS = {
+    'f72c94848e8b': description_candidates,
+    '62202721e93f': prize_table,
+    '0f1904705134': body_text,
+    'f0dfc4673395': closest_container,
+}
+
+
+def run_script(script, target, arg=None):
+    """Run the twin of a page script against an OfflinePage or OfflineNode"""
+    twin = SCRIPT_TWINS.get(script_fingerprint(script))
+    if twin is None:
+        raise NotImplementedError(f"No offline twin for page script {script.strip()[:40]!r}")
+    return twin(target, arg)
+
+
+class AsyncOfflineElement:
+    """Async ElementHandle stand-in over an OfflineNode"""
+
+    def __init__(self, node):
+        self.node = node
+
+    async def text_content(self):
+        return self.node.text_content()
+
+    async def inner_text(self):
+        return self.node.inner_text()
+
+    async def query_selector_all(self, selector):
+        return [AsyncOfflineElement(node) for node in self.node.query_selector_all(selector)]
+
+    async def query_selector(self, selector):
+        node = self.node.query_selector(selector)
+        return AsyncOfflineElement(node) if node else None
+
+    async def is_visible(self):
+        # Nothing in a snapshot can be clicked; it was saved after the live run's clicks
+        return False
+
+    async def evaluate_handle(self, script, arg=None):
+        node = run_script(script, self.node, arg)
+        return AsyncOfflineElement(node) if node else None
+
+
+class AsyncOfflinePage:
+    """Async stand-in for a loaded Playwright page, so the live extractors can read an OfflinePage"""
+
+    def __init__(self, page):
+        self.page = page
+
+    async def title(self):
+        return self.page.title()
+
+    async def content(self):
+        return self.page.content()
+
+    async def query_selector_all(self, selector):
+        return [AsyncOfflineElement(node) for node in self.page.query_selector_all(selector)]
+
+    async def query_selector(self, selector):
+        node = self.page.query_selector(selector)
+        return AsyncOfflineElement(node) if node else None
+
+    async def evaluate(self, script, arg=None):
+        return run_script(script, self.page, arg)
@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+
+
+class AdaptiveRateLimiter:
+    """Shared AIMD request-rate controller for every page, worker and HTTP fetch.
+
+    acquire() hands out request slots at the current rate. record() feeds back
+    each response: while status codes and latencies stay healthy the rate
+    grows additively (about `increase` requests/sec per second of successes);
+    a 429/5xx, a timeout or latency above `latency_factor` times the best
+    observed average cuts it by `decrease`, at most once per `cooldown`
+    seconds so a burst of in-flight failures counts as one signal. The
+    latency baseline is re-learned after every back-off, so a site that
+    stays slower than its best moment doesn't keep the rate pinned low.
+    `requests_per_second=0` disables limiting (feedback is still recorded).
+    """
+
+    def __init__(self, requests_per_second=2.0, min_rps=0.2, max_rps=10.0, increase=0.25,
+                 decrease=0.5, latency_factor=2.0, cooldown=5.0):
+        self.enabled = bool(requests_per_second)
+        self.rate = float(requests_per_second or max_rps)
+        self.min_rps = min_rps
+        self.max_rps = max(max_rps, self.rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self._next_slot = 0.0
+        self._last_decrease = 0.0
+        self._latency_avg = {}
+        self._latency_count = {}
+        self._latency_floor = {}
+        # record() is also called from fast-path worker threads
+        self._lock = threading.Lock()
+        self.successes = 0
+        self.backoffs = {}
+        self.peak_rate = self.rate
+        self.low_rate = self.rate
+
+    async def acquire(self):
+        """Wait until the next request slot is available"""
+        if not self.enabled:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record(self, status=None, latency=None, error=None, kind='goto'):
+        """Feed back one request's outcome; latency is compared per kind ('goto', 'http')"""
+        with self._lock:
+            reason = None
+            if error is not None:
+                if 'timeout' in f"{type(error).__name__} {error}".lower():
+                    reason = 'timeout'
+            elif status == 429 or (status is not None and status >= 500):
+                reason = f"http_{status}"
+            elif latency is not None:
+                average = self._latency_avg.get(kind)
+                average = latency if average is None else 0.8 * average + 0.2 * latency
+                self._latency_avg[kind] = average
+                self._latency_count[kind] = self._latency_count.get(kind, 0) + 1
+                # Only trust the baseline once a few samples have smoothed it
+                if self._latency_count[kind] >= 5:
+                    floor = min(self._latency_floor.get(kind, average), average)
+                    self._latency_floor[kind] = floor
+                    if average > floor * self.latency_factor:
+                        reason = 'latency'
+
+            if reason:
+                self._back_off(reason)
+            elif error is None:
+                self.successes += 1
+                self.rate = min(self.max_rps, self.rate + self.increase / self.rate)
+                self.peak_rate = max(self.peak_rate, self.rate)
+
+    def _back_off(self, reason):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.rate = max(self.min_rps, self.rate * self.decrease)
+        self.low_rate = min(self.low_rate, self.rate)
+        self.backoffs[reason] = self.backoffs.get(reason, 0) + 1
+        # Let the averages and the baseline re-settle at the new, slower rate before judging latency again
+        self._latency_avg = {}
+        self._latency_count = {}
+        self._latency_floor = {}
+        print(f"  🐢 Backing off to {self.rate:.2f} req/s ({reason})")
+
+    def print_summary(self):
+        reasons = ', '.join(f"{reason}: {count}" for reason, count in sorted(self.backoffs.items())) or 'none'
+        limit = f"{self.rate:.2f} req/s" if self.enabled else "unlimited"
+        print(f"\n🚦 Request rate: {limit} now (range {self.low_rate:.2f}-{self.peak_rate:.2f}), "
+              f"{self.successes} healthy responses, back-offs: {reasons}")
+
+
+async def navigate(page, url, rate_limiter, metrics, timeout=30000):
+    """page.goto timed as the 'goto' stage, with its outcome fed back to the rate limiter"""
+    started = time.monotonic()
+    try:
+        with metrics.timer('goto'):
+            response = await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+    except Exception as e:
+        rate_limiter.record(error=e)
+        raise
+    rate_limiter.record(status=response.status if response else None, latency=time.monotonic() - started)
+    return response
+
+
+class PagePool:
+    """Bounded pool of worker pages that share one browser context.
+
+    With a BrowserManager, pages are borrowed from it (and count towards its
+    page limit) instead of being opened on `context` directly.
+    """
+
+    def __init__(self, context=None, size=4, rate_limiter=None, browser_manager=None):
+        self.context = context
+        self.size = max(1, size)
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.browser_manager = browser_manager
+
+    async def run(self, items, handler, on_result=None):
+        """Run handler(page, item) for every item using at most `size` pages.
+
+        on_result(index, item, result) is called as soon as each item finishes,
+        so callers can checkpoint while the rest of the pool keeps working.
+        Returns a dict of index -> result.
+        """
+        queue = asyncio.Queue()
+        for index, item in enumerate(items):
+            queue.put_nowait((index, item))
+
+        results = {}
+        worker_count = min(self.size, queue.qsize())
+
+        async def worker(worker_id):
+            if self.browser_manager:
+                page = await self.browser_manager.acquire_page()
+            else:
+                page = await self.context.new_page()
+            try:
+                while True:
+                    try:
+                        index, item = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    await self.rate_limiter.acquire()
+                    try:
+                        result = await handler(page, item)
+                    except Exception as e:
+                        print(f"  ❌ Worker {worker_id} failed on {item}: {e}")
+                        continue
+                    results[index] = result
+                    if on_result:
+                        on_result(index, item, result)
+            finally:
+                if self.browser_manager:
+                    await self.browser_manager.release_page(page)
+                else:
+                    await page.close()
+
+        if worker_count:
+            print(f"⚙️  Running {len(items)} items across {worker_count} page(s)")
+            await asyncio.gather(*(worker(i + 1) for i in range(worker_count)))
+
+        return results
@@ -0,0 +1,115 @@
+import time
+from collections import deque
+from run_metrics import get_metrics
+
+# Nodes that tell us a listing page has rendered. Each inner list is a group of
+# alternatives; the page is ready once every group has a match.
+DESCRIPTION_READY_SELECTORS = [
+    'div[class*="description"]',
+    'article',
+    'main p',
+]
+PRIZE_READY_SELECTORS = [
+    'div.relative.flex.gap-3',
+    'p.ml-auto',
+]
+
+# Resolves once the required nodes exist and the DOM has stopped mutating,
+# or once the hard cap is hit.
+WAIT_FOR_READY_JS = '''
+({groups, required, quietMs, settleMs, maxMs}) => new Promise(resolve => {
+    const start = performance.now();
+    let lastMutation = start;
+    const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+
+    const present = (group) => group.some(selector => document.querySelector(selector));
+    let timer = null;
+    const finish = (ready) => {
+        observer.disconnect();
+        clearInterval(timer);
+        resolve({ready, elapsed: performance.now() - start});
+    };
+
+    const check = () => {
+        const now = performance.now();
+        const quietFor = now - lastMutation;
+        if (groups.every(present) && quietFor >= quietMs) return finish(true);
+        // Pages without a prize table settle on the required nodes alone
+        if (required.every(present) && quietFor >= settleMs) return finish(true);
+        if (now - start >= maxMs) return finish(false);
+    };
+    timer = setInterval(check, 50);
+    check();
+})
+'''
+
+
+class ReadinessWaiter:
+    """Adaptive replacement for fixed wait_for_timeout sleeps after navigation.
+
+    A wait never takes longer than `max_wait_ms`, which defaults to the 3s
+    sleep it replaced. Only the last `max_timings` waits are kept for the
+    summary.
+    """
+
+    def __init__(self, max_wait_ms=3000, quiet_ms=300, settle_ms=1000, max_timings=1000):
+        self.max_wait_ms = max_wait_ms
+        self.quiet_ms = quiet_ms
+        self.settle_ms = settle_ms
+        self.timings = deque(maxlen=max_timings)
+
+    def reset(self):
+        """Forget recorded waits, e.g. at the start of a daemon cycle"""
+        self.timings.clear()
+
+    async def wait_until_stable(self, page, label, groups, required=None, max_wait_ms=None, kind='listing'):
+        """Wait until every selector group is present and the DOM is quiet.
+
+        Returns (elapsed_ms, ready) where ready is False if the hard cap was hit.
+        """
+        max_wait_ms = max_wait_ms or self.max_wait_ms
+        started = time.monotonic()
+        try:
+            outcome = await page.evaluate(WAIT_FOR_READY_JS, {
+                'groups': groups,
+                'required': required if required is not None else groups,
+                'quietMs': self.quiet_ms,
+                'settleMs': self.settle_ms,
+                'maxMs': max_wait_ms,
+            })
+            ready = outcome.get('ready', False)
+        except Exception as e:
+            print(f"  ⚠️  Readiness check failed for {label}: {e}")
+            ready = False
+
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+        get_metrics().observe(f"readiness.{kind}", elapsed_ms / 1000)
+        self.timings.append({'label': label, 'kind': kind, 'elapsed_ms': elapsed_ms, 'ready': ready})
+        return elapsed_ms, ready
+
+    async def wait_for_listing(self, page, label):
+        """Wait until the listing description and prize table have rendered"""
+        elapsed_ms, ready = await self.wait_until_stable(
+            page, label,
+            groups=[DESCRIPTION_READY_SELECTORS, PRIZE_READY_SELECTORS],
+            required=[DESCRIPTION_READY_SELECTORS],
+        )
+        status = "ready" if ready else "hit wait cap"
+        print(f"  ⏱️  Page {status} after {elapsed_ms}ms")
+        return elapsed_ms
+
+    async def wait_for_quiet(self, page, label, max_wait_ms=1000):
+        """Wait for the DOM to stop changing, e.g. after expanding content"""
+        elapsed_ms, _ = await self.wait_until_stable(page, label, groups=[], max_wait_ms=max_wait_ms, kind='quiet')
+        return elapsed_ms
+
+    def print_summary(self):
+        """Print how long pages actually needed before extraction"""
+        listing_waits = [t for t in self.timings if t['kind'] == 'listing']
+        if not listing_waits:
+            return
+        waits = sorted(t['elapsed_ms'] for t in listing_waits)
+        capped = len([t for t in listing_waits if not t['ready']])
+        print(f"\n⏱️  Readiness waits: {len(waits)} total, "
+              f"median {waits[len(waits) // 2]}ms, max {waits[-1]}ms, {capped} hit the cap")
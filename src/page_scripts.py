@@ -0,0 +1,117 @@
+# Scripts the extractors evaluate inside a listing page. They live apart from
+# the extractors so offline_page can run its Python twins of them without
+# importing Playwright.
+
+# Runs the description strategies inside the page in the order given and
+# returns the first match, the strategy and selector that produced it, and the
+# strategies that were tried. Strategies:
+#   selectors  - predefined description selectors (text longer than 30 chars)
+#   paragraph  - paragraphs longer than 50 chars
+#   main       - long lines in <main> that don't look like rewards or deadlines
+#   divs       - any div with 100-2000 chars that isn't navigation
+DESCRIPTION_STRATEGIES = ['selectors', 'paragraph', 'main', 'divs']
+DESCRIPTION_CANDIDATES_JS = '''
+({selectors, order}) => {
+    const strategies = {
+        selectors: () => {
+            for (const selector of selectors) {
+                let elements = [];
+                try {
+                    elements = document.querySelectorAll(selector);
+                } catch (e) {
+                    continue;
+                }
+                for (const element of elements) {
+                    const text = (element.innerText || '').trim();
+                    if (text.length > 30) return {text: text, selector: selector};
+                }
+            }
+            return null;
+        },
+        paragraph: () => {
+            for (const p of document.querySelectorAll('p')) {
+                const text = (p.innerText || '').trim();
+                if (text.length > 50) return {text: text};
+            }
+            return null;
+        },
+        main: () => {
+            const main = document.querySelector('main');
+            if (!main) return null;
+            const lines = (main.innerText || '').split('\\n').map(line => line.trim()).filter(Boolean);
+            for (const line of lines) {
+                if (line.length > 100 && !['$', 'USDC', 'Deadline'].some(prefix => line.startsWith(prefix))) {
+                    return {text: line};
+                }
+            }
+            return null;
+        },
+        divs: () => {
+            for (const div of document.querySelectorAll('div')) {
+                const text = div.innerText;
+                if (text && text.length > 100 && text.length < 2000 &&
+                    !text.includes('Sign in') && !text.includes('Menu') &&
+                    !text.includes('Navigation') && text.includes(' ')) {
+                    return {text: text.trim()};
+                }
+            }
+            return null;
+        }
+    };
+
+    const tried = [];
+    for (const name of order) {
+        tried.push(name);
+        const found = strategies[name]();
+        if (found) return {text: found.text, selector: found.selector || null, strategy: name, tried: tried};
+    }
+    return {text: null, selector: null, strategy: null, tried: tried};
+}
+'''
+
+# Reads every prize row, the fallback amount elements, the token label and the
+# page text in a single evaluation instead of per-element protocol calls.
+PRIZE_TABLE_JS = '''
+() => {
+    const positionLabels = ['1st', '2nd', '3rd', '4th', '5th', '6th', '7th', '8th', '9th', '10th'];
+    const hasText = (el, text) => (el.textContent || '').toLowerCase().includes(text.toLowerCase());
+    const findPosition = (row, labels) => Array.from(row.querySelectorAll('p')).find(
+        p => p.matches('p.mt-auto.mb-1') || labels.some(label => hasText(p, label))
+    );
+    const textOf = (el) => el ? el.innerText : null;
+
+    const rows = [];
+    for (const row of document.querySelectorAll('div.relative.flex.gap-3')) {
+        const container = row.querySelector('div.flex.gap-1');
+        const amountEl = container ? container.querySelector('p.ml-auto') : null;
+        const positionEl = amountEl ? findPosition(row, positionLabels) : null;
+        const plusEl = Array.from(row.querySelectorAll('p')).find(p => hasText(p, '+'));
+        rows.push({amount: textOf(amountEl), position: textOf(positionEl), plus: textOf(plusEl)});
+    }
+
+    const amountRows = [];
+    for (const amountEl of document.querySelectorAll('p.ml-auto')) {
+        const row = amountEl.closest('div.relative.flex.gap-3');
+        const positionEl = row ? findPosition(row, positionLabels.slice(0, 5)) : null;
+        if (positionEl) {
+            amountRows.push({amount: amountEl.innerText, position: positionEl.innerText});
+        }
+    }
+
+    const tokenEl = Array.from(document.querySelectorAll('span')).find(
+        span => ['USDC', 'SOL', 'JUP'].some(token => hasText(span, token))
+    );
+
+    return {
+        rows: rows,
+        amount_rows: amountRows,
+        token: textOf(tokenEl),
+        body_text: document.body.innerText
+    };
+}
+'''
+
+BODY_TEXT_JS = '() => document.body.innerText'
+
+# Container searched for the amount next to a "Total Prizes" label
+CLOSEST_CONTAINER_JS = 'element => element.closest("div") || element.closest("td")'
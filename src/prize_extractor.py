@@ -1,14 +1,40 @@
 import json
 import asyncio
-from playwright.async_api import async_playwright
 import re
+from page_readiness import ReadinessWaiter
+from request_filter import default_request_filter
+from snapshot_archive import SnapshotArchive
+from state_store import get_state_store
+from run_metrics import get_metrics
+from strategy_ranker import get_strategy_ranker
+from page_scripts import BODY_TEXT_JS, CLOSEST_CONTAINER_JS, PRIZE_TABLE_JS
+from page_pool import AdaptiveRateLimiter, navigate
+from browser_manager import BrowserManager
+
 
 class PrizeExtractor:
-    def __init__(self):
+    def __init__(self, readiness=None, request_filter=None, snapshot_archive=None, state_store=None,
+                 rate_limiter=None, browser_manager=None, strategy_ranker=None):
         self.results = []
+        self.readiness = readiness or ReadinessWaiter()
+        self.request_filter = (request_filter or (browser_manager and browser_manager.request_filter)
+                               or default_request_filter())
+        # Shared Chromium; one created here is closed after each run
+        self.owns_browser = browser_manager is None
+        self.browser_manager = browser_manager or BrowserManager(request_filter=self.request_filter)
+        self.snapshot_archive = snapshot_archive or SnapshotArchive()
+        self.state_store = state_store or get_state_store()
+        self.metrics = get_metrics()
+        self.strategy_ranker = strategy_ranker or get_strategy_ranker()
+        # Pass the scraper's limiter when this extractor runs alongside it
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
     
     async def click_view_more_buttons(self, page):
         """Click all 'View More' buttons to expand hidden prizes"""
+        with self.metrics.timer('view_more'):
+            await self._click_view_more_buttons(page)
+    
+    async def _click_view_more_buttons(self, page):
         try:
             # Look for "View More" buttons
             view_more_buttons = await page.query_selector_all('button:has-text("View More")')
@@ -23,8 +49,8 @@ class PrizeExtractor:
                         if is_visible:
                             print(f"  Clicking 'View More' button {i+1}")
                             await button.click()
-                            # Wait for content to expand
-                            await page.wait_for_timeout(1000)
+                            # Wait for the expanded rows to finish rendering
+                            await self.readiness.wait_for_quiet(page, f"view-more-{i+1}")
                     except Exception as e:
                         print(f"  Could not click 'View More' button {i+1}: {e}")
             else:
@@ -75,172 +101,146 @@ class PrizeExtractor:
         
         return expanded_prizes
 
+    def parse_prize_row(self, amount_text, position_text, plus_text=None):
+        """Normalize the texts read from one prize row into prize entries"""
+        prizes = []
+        
+        # Handle comma-separated numbers like "1,000"
+        amount_clean = (amount_text or '').strip().replace(',', '')
+        if amount_clean.isdigit() and position_text:
+            prizes.append({
+                'position': position_text.strip(),
+                'amount': int(amount_clean)
+            })
+        
+        # Extract number from "+1,000" format (additional prizes)
+        if plus_text:
+            plus_match = re.search(r'\+(\d{1,3}(?:,\d{3})*)', plus_text)
+            if plus_match:
+                prizes.append({
+                    'position': 'additional',
+                    'amount': int(plus_match.group(1).replace(',', ''))
+                })
+        
+        return prizes
+    
+    def detect_token_type(self, token_text):
+        """Return the first known token symbol mentioned in text"""
+        for token in ['USDC', 'SOL', 'JUP']:
+            if token in (token_text or '').upper():
+                return token
+        return None
+    
+    def extract_prizes_from_text(self, page_text):
+        """Parse prize positions and amounts out of plain page text"""
+        prize_breakdown = []
+        
+        # Look for patterns like "1,000 USDC" followed by "1st" or vice versa
+        prize_patterns = [
+            r'(\d{1,3}(?:,\d{3})*)\s*USDC.*?(1st|2nd|3rd|4th|5th|6th|7th|8th|9th|10th)',
+            r'(1st|2nd|3rd|4th|5th|6th|7th|8th|9th|10th).*?(\d{1,3}(?:,\d{3})*)\s*USDC'
+        ]
+
+        for pattern in prize_patterns:
+            matches = re.findall(pattern, page_text, re.IGNORECASE | re.DOTALL)
+
+            for match in matches:
+                if len(match) == 2:
+                    # Determine which is amount and which is position
+                    if match[0].replace(',', '').isdigit():
+                        amount = int(match[0].replace(',', ''))
+                        position = match[1]
+                    else:
+                        amount = int(match[1].replace(',', ''))
+                        position = match[0]
+
+                    prize_breakdown.append({
+                        'position': position,
+                        'amount': amount
+                    })
+                    print(f"  Strategy 3 - Found prize: {position} = {amount}")
+        
+        return prize_breakdown
+    
+    def finalize_prize_breakdown(self, prize_breakdown, token_type='USDC'):
+        """Expand ranges, drop duplicates and build the prize breakdown result"""
+        # Expand range positions into individual positions
+        expanded_prizes = self.expand_range_positions(prize_breakdown)
+
+        # Remove duplicates and sort by position
+        unique_prizes = []
+        seen_positions = set()
+
+        for prize in expanded_prizes:
+            pos_key = f"{prize['position']}_{prize['amount']}"
+            if pos_key not in seen_positions:
+                unique_prizes.append(prize)
+                seen_positions.add(pos_key)
+
+        print(f"  Final extracted prizes: {len(unique_prizes)} prizes")
+        for prize in unique_prizes:
+            print(f"    {prize['position']}: {prize['amount']}")
+
+        return {
+            'individual_prizes': unique_prizes,
+            'token_type': token_type,
+            'total_prizes': len(unique_prizes)
+        }
+
+    def prizes_from_rows(self, snapshot):
+        """Strategy 1: prize rows (div.relative.flex.gap-3) with amount, position and "+X" texts"""
+        prize_breakdown = []
+        for row in snapshot.get('rows', []):
+            prizes = self.parse_prize_row(row.get('amount'), row.get('position'), row.get('plus'))
+            for prize in prizes:
+                print(f"  Found prize: {prize['position']} = {prize['amount']}")
+            prize_breakdown.extend(prizes)
+        return prize_breakdown
+    
+    def prizes_from_amount_rows(self, snapshot):
+        """Strategy 2: amount elements (p.ml-auto) paired with the position in their row"""
+        prize_breakdown = []
+        for row in snapshot.get('amount_rows', []):
+            prizes = self.parse_prize_row(row.get('amount'), row.get('position'))
+            for prize in prizes:
+                print(f"  Strategy 2 - Found prize: {prize['position']} = {prize['amount']}")
+            prize_breakdown.extend(prizes)
+        return prize_breakdown
+    
+    def prize_breakdown_from_snapshot(self, snapshot):
+        """Turn the raw prize-table read into a normalized prize breakdown"""
+        strategies = {
+            'rows': self.prizes_from_rows,
+            'amount_rows': self.prizes_from_amount_rows,
+            # Strategy 3: Parse page text for all prize information (fallback)
+            'text': lambda snapshot: self.extract_prizes_from_text(snapshot.get('body_text') or ''),
+        }
+        order = self.strategy_ranker.order('prize_breakdown', list(strategies), fallbacks=['text'])
+        
+        tried = []
+        prize_breakdown = []
+        for name in order:
+            tried.append(name)
+            prize_breakdown = strategies[name](snapshot)
+            if prize_breakdown:
+                self.metrics.hit('prize_breakdown', name)
+                break
+        self.strategy_ranker.record('prize_breakdown', tried, name if prize_breakdown else None)
+        
+        token_type = self.detect_token_type(snapshot.get('token')) or 'USDC'
+        
+        return self.finalize_prize_breakdown(prize_breakdown, token_type)
+
     async def extract_prize_breakdown(self, page):
         """Extract individual prize amounts from the prize breakdown table"""
         try:
             # First, click any "View More" buttons to expand hidden content
             await self.click_view_more_buttons(page)
             
-            prize_breakdown = []
-            
-            # Strategy 1: Look for the specific HTML structure from the provided example
-            # Target the exact structure: div.relative.flex.gap-3 containing prize info
-            prize_rows = await page.query_selector_all('div.relative.flex.gap-3')
-            
-            for row in prize_rows:
-                try:
-                    # Look for amount in the structure: div.flex.gap-1 > p.ml-auto
-                    amount_container = await row.query_selector('div.flex.gap-1')
-                    if amount_container:
-                        amount_element = await amount_container.query_selector('p.ml-auto')
-                        if amount_element:
-                            amount_text = await amount_element.inner_text()
-                            # Handle comma-separated numbers like "1,000"
-                            amount_clean = amount_text.strip().replace(',', '')
-                            
-                            if amount_clean.isdigit():
-                                amount = int(amount_clean)
-                                
-                                # Look for position in the same container
-                                position_element = await row.query_selector('p.mt-auto.mb-1, p:has-text("1st"), p:has-text("2nd"), p:has-text("3rd"), p:has-text("4th"), p:has-text("5th"), p:has-text("6th"), p:has-text("7th"), p:has-text("8th"), p:has-text("9th"), p:has-text("10th")')
-                                
-                                if position_element:
-                                    position_text = await position_element.inner_text()
-                                    position = position_text.strip()
-                                    
-                                    prize_breakdown.append({
-                                        'position': position,
-                                        'amount': amount
-                                    })
-                                    print(f"  Found prize: {position} = {amount}")
-                    
-                    # Also check for "+X,XXX" pattern (additional prizes)
-                    plus_amount_element = await row.query_selector('p:has-text("+")')
-                    if plus_amount_element:
-                        plus_text = await plus_amount_element.inner_text()
-                        # Extract number from "+1,000" format
-                        plus_match = re.search(r'\+(\d{1,3}(?:,\d{3})*)', plus_text)
-                        if plus_match:
-                            additional_amount = int(plus_match.group(1).replace(',', ''))
-                            prize_breakdown.append({
-                                'position': 'additional',
-                                'amount': additional_amount
-                            })
-                            print(f"  Found additional prize: +{additional_amount}")
-                            
-                except Exception as e:
-                    print(f"  Error processing row: {e}")
-                    continue
-            
-            # Strategy 2: More specific approach for the exact HTML structure
-            if not prize_breakdown:
-                try:
-                    # Look for the specific pattern: amount followed by position
-                    # Based on your HTML: <p class="ml-auto">1,000</p> ... <p class="mt-auto mb-1 ...">1st</p>
-                    
-                    # Find all amount elements first
-                    amount_elements = await page.query_selector_all('p.ml-auto')
-                    
-                    for amount_element in amount_elements:
-                        try:
-                            amount_text = await amount_element.inner_text()
-                            amount_clean = amount_text.strip().replace(',', '')
-                            
-                            if amount_clean.isdigit():
-                                amount = int(amount_clean)
-                                
-                                # Find the corresponding position element in the same row
-                                # Navigate up to the parent container and look for position
-                                parent_row = await amount_element.evaluate('el => el.closest("div.relative.flex.gap-3")')
-                                if parent_row:
-                                    position_element = await parent_row.query_selector('p.mt-auto.mb-1, p:has-text("1st"), p:has-text("2nd"), p:has-text("3rd"), p:has-text("4th"), p:has-text("5th")')
-                                    if position_element:
-                                        position_text = await position_element.inner_text()
-                                        position = position_text.strip()
-                                        
-                                        prize_breakdown.append({
-                                            'position': position,
-                                            'amount': amount
-                                        })
-                                        print(f"  Strategy 2 - Found prize: {position} = {amount}")
-                        except Exception as e:
-                            print(f"  Strategy 2 error: {e}")
-                            continue
-                            
-                except Exception as e:
-                    print(f"  Strategy 2 failed: {e}")
-                    pass
-            
-            # Strategy 3: Parse page text for all prize information (fallback)
-            if not prize_breakdown:
-                try:
-                    page_text = await page.evaluate('() => document.body.innerText')
-                    
-                    # Look for patterns like "1,000 USDC" followed by "1st" or vice versa
-                    prize_patterns = [
-                        r'(\d{1,3}(?:,\d{3})*)\s*USDC.*?(1st|2nd|3rd|4th|5th|6th|7th|8th|9th|10th)',
-                        r'(1st|2nd|3rd|4th|5th|6th|7th|8th|9th|10th).*?(\d{1,3}(?:,\d{3})*)\s*USDC'
-                    ]
-                    
-                    for pattern in prize_patterns:
-                        matches = re.findall(pattern, page_text, re.IGNORECASE | re.DOTALL)
-                        
-                        for match in matches:
-                            if len(match) == 2:
-                                # Determine which is amount and which is position
-                                if match[0].replace(',', '').isdigit():
-                                    amount = int(match[0].replace(',', ''))
-                                    position = match[1]
-                                else:
-                                    amount = int(match[1].replace(',', ''))
-                                    position = match[0]
-                                
-                                prize_breakdown.append({
-                                    'position': position,
-                                    'amount': amount
-                                })
-                                print(f"  Strategy 3 - Found prize: {position} = {amount}")
-                        
-                except Exception as e:
-                    print(f"  Strategy 3 failed: {e}")
-                    pass
-            
-            # Extract token type
-            token_type = 'USDC'  # default
-            try:
-                token_element = await page.query_selector('span:has-text("USDC"), span:has-text("SOL"), span:has-text("JUP")')
-                if token_element:
-                    token_text = await token_element.inner_text()
-                    if any(token in token_text.upper() for token in ['USDC', 'SOL', 'JUP']):
-                        for token in ['USDC', 'SOL', 'JUP']:
-                            if token in token_text.upper():
-                                token_type = token
-                                break
-            except Exception:
-                pass
-            
-            # Expand range positions into individual positions
-            expanded_prizes = self.expand_range_positions(prize_breakdown)
-            
-            # Remove duplicates and sort by position
-            unique_prizes = []
-            seen_positions = set()
-            
-            for prize in expanded_prizes:
-                pos_key = f"{prize['position']}_{prize['amount']}"
-                if pos_key not in seen_positions:
-                    unique_prizes.append(prize)
-                    seen_positions.add(pos_key)
-            
-            print(f"  Final extracted prizes: {len(unique_prizes)} prizes")
-            for prize in unique_prizes:
-                print(f"    {prize['position']}: {prize['amount']}")
-            
-            return {
-                'individual_prizes': unique_prizes,
-                'token_type': token_type,
-                'total_prizes': len(unique_prizes)
-            }
+            # Read the whole prize table in one round trip; Python only normalizes
+            with self.metrics.timer('extract.prize_table'):
+                snapshot = await page.evaluate(PRIZE_TABLE_JS)
+            return self.prize_breakdown_from_snapshot(snapshot)
             
         except Exception as e:
             print(f"  ⚠️  Error extracting prize breakdown: {e}")
@@ -250,178 +250,252 @@ class PrizeExtractor:
                 'total_prizes': 0
             }
 
+    def extract_total_reward_from_text(self, page_text):
+        """Find the total reward amount in plain page text"""
+        # Look for patterns like "2000 USDC Total Prizes" or "Total Prizes 2000"
+        total_patterns = [
+            r'(\d{1,3}(?:,\d{3})*)\s*(?:USDC|SOL|JUP)\s*Total Prizes',
+            r'Total Prizes[\s\S]*?(\d{1,3}(?:,\d{3})*)\s*(?:USDC|SOL|JUP)',
+            r'(\d{1,3}(?:,\d{3})*)\s*(?:USDC|SOL|JUP)'
+        ]
+
+        for pattern in total_patterns:
+            matches = re.findall(pattern, page_text, re.IGNORECASE)
+            if matches:
+                # Return the largest amount found (likely the total)
+                amounts = [int(match.replace(',', '')) for match in matches]
+                return max(amounts)
+        
+        return None
+
     async def extract_total_reward(self, page):
         """Extract total reward amount from the page"""
-        try:
+        strategies = {
             # Look for "Total Prizes" text and associated amount
-            total_prize_elements = await page.query_selector_all('p:has-text("Total Prizes")')
-            
-            for element in total_prize_elements:
-                try:
-                    # Look for amount in the same container
-                    parent = await element.evaluate_handle('element => element.closest("div") || element.closest("td")')
-                    amount_elements = await parent.query_selector_all('span, p')
-                    
-                    for amt_elem in amount_elements:
-                        text = await amt_elem.inner_text()
-                        # Look for numeric values
-                        amount_match = re.search(r'(\d{1,3}(?:,\d{3})*)', text)
-                        if amount_match:
-                            return int(amount_match.group(1).replace(',', ''))
-                except Exception:
-                    continue
-            
-            # Fallback: search page text for total amounts
-            page_text = await page.evaluate('() => document.body.innerText')
-            
-            # Look for patterns like "2000 USDC Total Prizes" or "Total Prizes 2000"
-            total_patterns = [
-                r'(\d{1,3}(?:,\d{3})*)\s*(?:USDC|SOL|JUP)\s*Total Prizes',
-                r'Total Prizes[\s\S]*?(\d{1,3}(?:,\d{3})*)\s*(?:USDC|SOL|JUP)',
-                r'(\d{1,3}(?:,\d{3})*)\s*(?:USDC|SOL|JUP)'
-            ]
-            
-            for pattern in total_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                if matches:
-                    # Return the largest amount found (likely the total)
-                    amounts = [int(match.replace(',', '')) for match in matches]
-                    return max(amounts)
-            
-            return None
+            'element': self.total_reward_from_elements,
+            # Fallback: search page text for total amounts (largest amount wins)
+            'text': self.total_reward_from_page_text,
+        }
+        order = self.strategy_ranker.order('total_reward', list(strategies), fallbacks=['text'])
+        try:
+            tried = []
+            total = None
+            for name in order:
+                tried.append(name)
+                with self.metrics.timer(f'total_reward.{name}'):
+                    total = await strategies[name](page)
+                if total is not None:
+                    self.metrics.hit('total_reward', name)
+                    break
+            self.strategy_ranker.record('total_reward', tried, name if total is not None else None)
+            return total
             
         except Exception as e:
             print(f"  ⚠️  Error extracting total reward: {e}")
             return None
     
+    async def total_reward_from_page_text(self, page):
+        page_text = await page.evaluate(BODY_TEXT_JS)
+        return self.extract_total_reward_from_text(page_text)
+    
+    async def total_reward_from_elements(self, page):
+        """Amount next to a 'Total Prizes' label, or None"""
+        total_prize_elements = await page.query_selector_all('p:has-text("Total Prizes")')
+        
+        for element in total_prize_elements:
+            try:
+                # Look for amount in the same container
+                parent = await element.evaluate_handle(CLOSEST_CONTAINER_JS)
+                amount_elements = await parent.query_selector_all('span, p')
+                
+                for amt_elem in amount_elements:
+                    text = await amt_elem.inner_text()
+                    # Look for numeric values
+                    amount_match = re.search(r'(\d{1,3}(?:,\d{3})*)', text)
+                    if amount_match:
+                        return int(amount_match.group(1).replace(',', ''))
+            except Exception:
+                continue
+        return None
+    
     def extract_slug_from_url(self, url):
         """Extract slug from full URL"""
         if '/listing/' in url:
             return url.split('/listing/')[-1]
         return url
 
+    async def extract_prizes_from_page(self, page, url):
+        """Extract complete prize information from a page that is already loaded"""
+        # Extract title
+        title = await page.title() or self.extract_slug_from_url(url).replace('-', ' ').title()
+        
+        # Extract total reward
+        total_reward = await self.extract_total_reward(page)
+        
+        # Extract prize breakdown
+        prize_breakdown = await self.extract_prize_breakdown(page)
+        
+        # Calculate sum of individual prizes for validation
+        individual_sum = sum(prize['amount'] for prize in prize_breakdown['individual_prizes'])
+        
+        result = {
+            'title': title,
+            'slug': self.extract_slug_from_url(url),
+            'url': url,
+            'total_reward': total_reward,
+            'prize_breakdown': prize_breakdown,
+            'individual_sum': individual_sum,
+            'amounts_match': (total_reward == individual_sum) if total_reward else False
+        }
+        
+        print(f"  ✓ Total: {total_reward}, Individual sum: {individual_sum}, Match: {result['amounts_match']}")
+        print(f"  ✓ Found {prize_breakdown['total_prizes']} individual prizes")
+        
+        return result
+    
+    def error_result(self, url, error):
+        """Prize result recorded when a bounty page could not be processed"""
+        return {
+            'title': self.extract_slug_from_url(url).replace('-', ' ').title(),
+            'slug': self.extract_slug_from_url(url),
+            'url': url,
+            'total_reward': None,
+            'prize_breakdown': {'individual_prizes': [], 'token_type': 'USDC', 'total_prizes': 0},
+            'individual_sum': 0,
+            'amounts_match': False,
+            'error': str(error)
+        }
+    
+    def to_extracted_prize_data(self, result):
+        """Convert a prize result into the 'extracted_prize_data' block stored on descriptions"""
+        return {
+            'total_reward': result.get('total_reward'),
+            'prize_breakdown': result.get('prize_breakdown', {}),
+            'individual_sum': result.get('individual_sum'),
+            'amounts_match': result.get('amounts_match'),
+            'extraction_successful': result.get('total_reward') is not None
+        }
+
     async def extract_prizes_for_bounty(self, page, url):
         """Extract complete prize information for a single bounty"""
         try:
             print(f"\n🎯 Extracting prizes for: {url}")
             
             # Navigate to the page
-            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            await navigate(page, url, self.rate_limiter, self.metrics)
             
-            # Wait for content to load
-            await page.wait_for_timeout(3000)
-            
-            # Extract title
-            title = await page.title() or self.extract_slug_from_url(url).replace('-', ' ').title()
-            
-            # Extract total reward
-            total_reward = await self.extract_total_reward(page)
-            
-            # Extract prize breakdown
-            prize_breakdown = await self.extract_prize_breakdown(page)
-            
-            # Calculate sum of individual prizes for validation
-            individual_sum = sum(prize['amount'] for prize in prize_breakdown['individual_prizes'])
-            
-            result = {
-                'title': title,
-                'slug': self.extract_slug_from_url(url),
-                'url': url,
-                'total_reward': total_reward,
-                'prize_breakdown': prize_breakdown,
-                'individual_sum': individual_sum,
-                'amounts_match': (total_reward == individual_sum) if total_reward else False
-            }
-            
-            print(f"  ✓ Total: {total_reward}, Individual sum: {individual_sum}, Match: {result['amounts_match']}")
-            print(f"  ✓ Found {prize_breakdown['total_prizes']} individual prizes")
+            # Wait until the prize table has rendered
+            await self.readiness.wait_for_listing(page, self.extract_slug_from_url(url))
             
+            result = await self.extract_prizes_from_page(page, url)
+            await self.snapshot_archive.capture(page, result['slug'], url)
             return result
             
         except Exception as e:
             print(f"  ✗ Error extracting prizes for {url}: {e}")
-            return {
-                'title': self.extract_slug_from_url(url).replace('-', ' ').title(),
-                'slug': self.extract_slug_from_url(url),
-                'url': url,
-                'total_reward': None,
-                'prize_breakdown': {'individual_prizes': [], 'token_type': 'USDC', 'total_prizes': 0},
-                'individual_sum': 0,
-                'amounts_match': False,
-                'error': str(e)
-            }
+            return self.error_result(url, e)
 
-    async def process_bounties_with_prizes(self, bounty_urls):
-        """Process multiple bounties and extract prize information"""
+    async def process_bounties_with_prizes(self, bounty_urls, work_queue=None, run_worker=True):
+        """Process multiple bounties and extract prize information
+        
+        With a work queue, slugs are enqueued and extracted by queue workers
+        (this process included unless run_worker=False); dead-lettered
+        bounties come back as error results.
+        """
+        if work_queue is not None:
+            return await self.process_bounties_via_queue(bounty_urls, work_queue, run_worker)
+        
         results = []
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            try:
-                for url in bounty_urls:
+        try:
+            for url in bounty_urls:
+                await self.rate_limiter.acquire()
+                async with self.browser_manager.page() as page:
                     result = await self.extract_prizes_for_bounty(page, url)
-                    results.append(result)
-                    
-                    # Small delay between requests
-                    await page.wait_for_timeout(2000)
-                    
-            finally:
-                await browser.close()
+                self.browser_manager.record_navigations(1)
+                self.metrics.page('browser', ok='error' not in result)
+                results.append(result)
+        finally:
+            if self.owns_browser:
+                await self.browser_manager.close()
+        
+        self.readiness.print_summary()
+        self.request_filter.print_summary()
+        
+        # Upsert into the state store so results outlive the timestamped JSON files
+        self.state_store.upsert_prize_results(results)
+        self.strategy_ranker.flush()
+        self.strategy_ranker.print_summary()
+        self.rate_limiter.print_summary()
+        self.metrics.set_gauge('request_rate', self.rate_limiter.rate)
+        self.metrics.print_summary()
+        self.metrics.write_prometheus()
+        return results
+    
+    async def process_bounties_via_queue(self, bounty_urls, work_queue, run_worker=True):
+        """Coordinator side of process_bounties_with_prizes for a work queue"""
+        from queue_worker import QueueWorker, collect_via_queue
         
+        slugs = [self.extract_slug_from_url(url) for url in bounty_urls]
+        worker = QueueWorker(work_queue, kind='prizes', prize_extractor=self) if run_worker else None
+        collected = await collect_via_queue(work_queue, slugs, worker)
+        dead = {entry['item']: entry['error'] for entry in work_queue.dead_letters()}
+        
+        results = [collected.get(slug) or self.error_result(url, dead.get(slug, 'not processed'))
+                   for url, slug in zip(bounty_urls, slugs)]
+        self.state_store.upsert_prize_results(results)
         return results
     
+    def merge_prize_results(self, prize_results):
+        """Upsert prize data for the slugs in prize_results; other bounties are left untouched.
+        
+        Returns the number of descriptions whose prize data changed.
+        """
+        updated = []
+        missing = 0
+        
+        for result in prize_results:
+            slug = result.get('slug')
+            if not slug:
+                continue
+            
+            bounty = self.state_store.description(slug)
+            if bounty is None:
+                missing += 1
+                continue
+            
+            previous = bounty.get('extracted_prize_data') or {}
+            prize_data = self.to_extracted_prize_data(result)
+            
+            # Never replace a successful earlier extraction with a failed one
+            if previous.get('extraction_successful') and not prize_data['extraction_successful']:
+                continue
+            if previous == prize_data:
+                continue
+            
+            bounty['extracted_prize_data'] = prize_data
+            updated.append(bounty)
+        
+        if updated:
+            self.state_store.upsert_descriptions(updated)
+        
+        print(f"✓ Updated {len(updated)} bounties with extracted prize data")
+        if missing:
+            print(f"⚠️  {missing} prize results have no scraped description yet")
+        
+        return len(updated)
+    
     def merge_prizes_into_descriptions(self, prize_results_file, descriptions_file):
-        """Merge extracted prize data into bounty descriptions JSON file"""
+        """Merge extracted prize data from a results file into bounty descriptions"""
         try:
             # Load prize extraction results
             with open(prize_results_file, 'r', encoding='utf-8') as f:
                 prize_data = json.load(f)
             
-            # Load bounty descriptions
-            with open(descriptions_file, 'r', encoding='utf-8') as f:
-                descriptions = json.load(f)
-            
-            # Create a mapping of slug to prize data
-            prize_map = {}
-            for result in prize_data.get('results', []):
-                slug = result.get('slug')
-                if slug:
-                    prize_map[slug] = {
-                        'extracted_prize_data': {
-                            'total_reward': result.get('total_reward'),
-                            'prize_breakdown': result.get('prize_breakdown', {}),
-                            'individual_sum': result.get('individual_sum'),
-                            'amounts_match': result.get('amounts_match'),
-                            'extraction_successful': result.get('total_reward') is not None
-                        }
-                    }
-            
-            # Merge prize data into descriptions
-            updated_count = 0
-            for bounty in descriptions:
-                slug = bounty.get('slug')
-                if slug and slug in prize_map:
-                    bounty.update(prize_map[slug])
-                    updated_count += 1
-                else:
-                    # Add empty prize data for bounties without extracted prizes
-                    bounty['extracted_prize_data'] = {
-                        'total_reward': None,
-                        'prize_breakdown': {'individual_prizes': [], 'token_type': 'USDC', 'total_prizes': 0},
-                        'individual_sum': 0,
-                        'amounts_match': False,
-                        'extraction_successful': False
-                    }
-            
-            # Save updated descriptions
-            with open(descriptions_file, 'w', encoding='utf-8') as f:
-                json.dump(descriptions, f, indent=2, ensure_ascii=False)
-            
-            print(f"✓ Successfully merged prize data into {descriptions_file}")
-            print(f"✓ Updated {updated_count} bounties with extracted prize data")
-            print(f"✓ Total bounties in file: {len(descriptions)}")
+            if self.merge_prize_results(prize_data.get('results', [])):
+                # Only refresh the exported view when something actually changed
+                self.state_store.export_views({'descriptions': descriptions_file})
+                print(f"✓ Successfully merged prize data into {descriptions_file}")
             
             return True
             
@@ -429,27 +503,37 @@ class PrizeExtractor:
             print(f"✗ Error merging prize data: {e}")
             return False
     
-    def update_bounty_descriptions_with_prizes(self):
-        """Convenience method to merge latest prize extraction results into bounty descriptions"""
+    def update_bounty_descriptions_with_prizes(self, prize_results=None):
+        """Merge prize results that haven't been merged yet into bounty descriptions.
+        
+        With no arguments this picks up every prize result stored since the
+        last merge, instead of searching the project root for the newest file.
+        """
         import os
+        import time
         
-        # Find the most recent prize extraction results file
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        prize_files = [f for f in os.listdir(project_root) if f.startswith('prize_extraction_results_') and f.endswith('.json')]
-        
-        if not prize_files:
-            print("✗ No prize extraction results files found")
-            return False
-        
-        # Get the most recent file (highest timestamp)
-        latest_prize_file = max(prize_files, key=lambda x: float(x.split('_')[-1].replace('.json', '')))
-        prize_results_path = os.path.join(project_root, latest_prize_file)
         descriptions_path = os.path.join(project_root, 'output', 'bounty_descriptions.json')
         
-        print(f"Using prize results: {latest_prize_file}")
-        print(f"Updating descriptions: {descriptions_path}")
-        
-        return self.merge_prizes_into_descriptions(prize_results_path, descriptions_path)
+        try:
+            merge_started = time.time()
+            if prize_results is None:
+                last_merge = float(self.state_store.get_meta('prizes_merged_at', 0))
+                prize_results = self.state_store.prize_results_since(last_merge)
+            
+            if not prize_results:
+                print("✓ No new prize extraction results to merge")
+                return True
+            
+            print(f"Merging {len(prize_results)} prize results into: {descriptions_path}")
+            if self.merge_prize_results(prize_results):
+                self.state_store.export_views({'descriptions': descriptions_path})
+            self.state_store.set_meta('prizes_merged_at', merge_started)
+            return True
+            
+        except Exception as e:
+            print(f"✗ Error merging prize data: {e}")
+            return False
 
 # Convenience function to run the merge process
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+import argparse
+import asyncio
+import time
+from bounty_scraper import ImprovedSuperteamBountyScraper
+from listing_fast_path import ListingFastPath
+from page_pool import AdaptiveRateLimiter, PagePool
+from prize_extractor import PrizeExtractor
+from work_queue import SQLiteWorkQueue, default_worker_id
+
+LISTING_URL = 'https://earn.superteam.fun/listing/{}'
+
+
+class QueueWorker:
+    """Pull slugs from a work queue, extract them and push the results back.
+
+    kind='scrape' runs the full description + prize scrape (results have the
+    same {'result', 'prize_result'} shape as the checkpoint journals);
+    kind='prizes' runs PrizeExtractor only. Any number of workers, on any
+    host that can reach the queue, can run at once.
+    """
+
+    def __init__(self, work_queue, kind='scrape', concurrency=4, requests_per_second=2.0,
+                 worker_id=None, scraper=None, prize_extractor=None, browser_manager=None, rate_limiter=None,
+                 max_requests_per_second=10.0):
+        self.work_queue = work_queue
+        self.kind = kind
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.worker_id = worker_id or default_worker_id()
+        # One AIMD controller for every batch this worker runs
+        if rate_limiter is None and prize_extractor is not None:
+            rate_limiter = prize_extractor.rate_limiter
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(requests_per_second, max_rps=max_requests_per_second)
+        self.prize_extractor = prize_extractor or PrizeExtractor(rate_limiter=self.rate_limiter,
+                                                                 browser_manager=browser_manager)
+        # One Chromium for both kinds of batch, closed when the worker stops
+        self.browser_manager = browser_manager or self.prize_extractor.browser_manager
+        self.scraper = scraper
+        if kind == 'scrape' and scraper is None:
+            self.scraper = ImprovedSuperteamBountyScraper(
+                concurrency=concurrency, requests_per_second=requests_per_second,
+                prize_extractor=self.prize_extractor, request_filter=self.prize_extractor.request_filter,
+                fast_path=ListingFastPath(rate_limiter=self.rate_limiter), browser_manager=self.browser_manager,
+                rate_limiter=self.rate_limiter)
+        self.acked = 0
+        self.failed = 0
+
+    def finish(self, slug, payload, error=None):
+        if error is None and self.work_queue.ack(slug, payload, self.worker_id):
+            self.acked += 1
+            return
+        if error is None:
+            print(f"  ⚠️  Lease on {slug} was lost; result discarded")
+            return
+        self.failed += 1
+        status = self.work_queue.fail(slug, error, self.worker_id)
+        if status == 'dead':
+            print(f"  ☠️  {slug} moved to dead-letter bucket: {error}")
+
+    async def scrape_batch(self, slugs):
+        urls = [LISTING_URL.format(slug) for slug in slugs]
+        self.scraper.load_bounty_data_cache(slugs)
+
+        def on_result(index, url, result):
+            error = result['description'] if result.get('status') == 'error' else None
+            prize_result = self.scraper._prize_results_by_url.get(url)
+            self.finish(slugs[index], {'result': result, 'prize_result': prize_result}, error)
+
+        results = await self.scraper.scrape_urls(urls, on_result=on_result)
+        for index, slug in enumerate(slugs):
+            if index not in results:
+                self.finish(slug, None, 'no result')
+
+    async def prize_batch(self, slugs):
+        urls = [LISTING_URL.format(slug) for slug in slugs]
+
+        def on_result(index, url, result):
+            self.finish(slugs[index], result, result.get('error'))
+
+        pool = PagePool(size=self.concurrency, rate_limiter=self.rate_limiter, browser_manager=self.browser_manager)
+        try:
+            results = await pool.run(urls, self.prize_extractor.extract_prizes_for_bounty, on_result=on_result)
+        finally:
+            self.browser_manager.record_navigations(len(urls))
+        for index, slug in enumerate(slugs):
+            if index not in results:
+                self.finish(slug, None, 'no result')
+
+    async def keep_leases(self, slugs):
+        """Extend a batch's leases until it finishes, so a slow batch isn't handed to another worker"""
+        interval = max(1.0, self.work_queue.visibility_timeout / 3)
+        while True:
+            await asyncio.sleep(interval)
+            for slug in slugs:
+                self.work_queue.extend(slug, self.worker_id)
+
+    async def run(self, wait=False, poll_interval=5):
+        """Work until the queue is drained (or forever with wait=True)"""
+        print(f"👷 Worker {self.worker_id} pulling '{self.work_queue.queue}' items")
+        try:
+            while True:
+                slugs = self.work_queue.lease(self.worker_id, batch_size=self.concurrency)
+                if not slugs:
+                    if not wait and self.work_queue.is_drained():
+                        break
+                    await asyncio.sleep(poll_interval)
+                    continue
+                heartbeat = asyncio.create_task(self.keep_leases(slugs))
+                try:
+                    if self.kind == 'prizes':
+                        await self.prize_batch(slugs)
+                    else:
+                        await self.scrape_batch(slugs)
+                finally:
+                    heartbeat.cancel()
+        finally:
+            self.prize_extractor.strategy_ranker.flush()
+            await self.browser_manager.close()
+        print(f"👷 Worker {self.worker_id} done: {self.acked} acked, {self.failed} failed")
+        self.rate_limiter.print_summary()
+
+
+async def wait_for_drain(work_queue, poll_interval=5, stall_timeout=900):
+    """Block until no item is pending or leased, printing queue progress.
+
+    Raises TimeoutError when the counts haven't changed for `stall_timeout`
+    seconds, e.g. because no worker is running or the ones holding leases died.
+    """
+    last = None
+    last_change = time.monotonic()
+    while True:
+        counts = work_queue.counts()
+        if counts != last:
+            print(f"📬 Queue '{work_queue.queue}': {counts['pending']} pending, {counts['leased']} leased, "
+                  f"{counts['done']} done, {counts['dead']} dead")
+            last = counts
+            last_change = time.monotonic()
+        if counts['pending'] == 0 and counts['leased'] == 0:
+            return counts
+        if stall_timeout is not None and time.monotonic() - last_change > stall_timeout:
+            raise TimeoutError(
+                f"Queue '{work_queue.queue}' made no progress for {stall_timeout}s with {counts['pending']} pending "
+                f"and {counts['leased']} leased items; start a worker (python src/queue_worker.py) and re-run")
+        await asyncio.sleep(poll_interval)
+
+
+def report_dead_letters(work_queue):
+    dead = work_queue.dead_letters()
+    if dead:
+        print(f"\n☠️  {len(dead)} items in the dead-letter bucket (requeue with requeue_dead()):")
+        for entry in dead:
+            print(f"  • {entry['item']} after {entry['attempts']} attempts: {entry['error']}")
+    return dead
+
+
+async def collect_via_queue(work_queue, slugs, worker=None, poll_interval=5, stall_timeout=900):
+    """Coordinator side: enqueue slugs, drain the queue and return {slug: result}.
+
+    With `worker`, this process works the queue until it is drained, taking
+    over items whose remote lease expired; otherwise it only waits for remote
+    workers, and gives up with TimeoutError once the queue has made no
+    progress for `stall_timeout` seconds. Results are removed from the queue
+    once returned.
+    """
+    counts = work_queue.enqueue(slugs)
+    print(f"📬 Enqueued {counts['added']} new items on '{work_queue.queue}': {counts['requeued']} requeued "
+          f"from the dead-letter bucket, {counts['in_progress']} already queued, "
+          f"{counts['done']} already done")
+    if worker:
+        await worker.run()
+    await wait_for_drain(work_queue, poll_interval, stall_timeout)
+
+    results = work_queue.results()
+    collected = {slug: results[slug] for slug in slugs if slug in results}
+    report_dead_letters(work_queue)
+    work_queue.purge_done(list(collected))
+    return collected
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Pull bounty slugs from the work queue and extract them')
+    parser.add_argument('--queue', choices=['scrape', 'prizes'], default='scrape')
+    parser.add_argument('--db', default=None, help='queue database (default: data/work_queue.db)')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--rps', type=float, default=2.0)
+    parser.add_argument('--max-rps', type=float, default=10.0, help="ceiling for this worker's rate controller")
+    parser.add_argument('--wait', action='store_true', help='keep polling when the queue is empty')
+    args = parser.parse_args()
+
+    queue = SQLiteWorkQueue(args.db, queue=args.queue)
+    worker = QueueWorker(queue, kind=args.queue, concurrency=args.concurrency, requests_per_second=args.rps,
+                         max_requests_per_second=args.max_rps)
+    asyncio.run(worker.run(wait=args.wait))
@@ -0,0 +1,117 @@
+import fnmatch
+
+# Typical transfer sizes used to estimate what a blocked request would have cost
+# when we have not seen the same URL served before.
+ESTIMATED_BYTES_BY_TYPE = {
+    'image': 60_000,
+    'media': 500_000,
+    'font': 40_000,
+    'stylesheet': 30_000,
+    'script': 80_000,
+    'xhr': 5_000,
+    'fetch': 5_000,
+    'ping': 500,
+    'other': 5_000,
+}
+
+
+class RequestFilterPolicy:
+    """Allow/deny rules for requests made by a Playwright browser context.
+
+    Requests are checked in this order: allowed URL patterns always pass,
+    blocked URL patterns and blocked resource types are aborted, everything
+    else continues. Patterns use shell-style wildcards (fnmatch). Sizes of
+    served URLs are remembered for at most `max_seen_sizes` URLs.
+    """
+
+    def __init__(self, blocked_resource_types=None, blocked_url_patterns=None, allowed_url_patterns=None,
+                 max_seen_sizes=5000):
+        self.blocked_resource_types = set(blocked_resource_types or [])
+        self.blocked_url_patterns = list(blocked_url_patterns or [])
+        self.allowed_url_patterns = list(allowed_url_patterns or [])
+        self.max_seen_sizes = max_seen_sizes
+        self.reset()
+
+    def reset(self):
+        """Zero the counters and forget seen sizes, e.g. at the start of a daemon cycle"""
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+        self.blocked_requests = 0
+        self.blocked_by_type = {}
+        self.estimated_bytes_saved = 0
+        self._seen_sizes = {}
+
+    def should_block(self, url, resource_type):
+        """Return True if a request should be aborted"""
+        if any(fnmatch.fnmatch(url, pattern) for pattern in self.allowed_url_patterns):
+            return False
+        if resource_type in self.blocked_resource_types:
+            return True
+        return any(fnmatch.fnmatch(url, pattern) for pattern in self.blocked_url_patterns)
+
+    async def apply(self, context):
+        """Install the policy on a browser context"""
+        await context.route('**/*', self._handle_route)
+        context.on('response', self._record_response)
+
+    async def _handle_route(self, route):
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.blocked_requests += 1
+            self.blocked_by_type[request.resource_type] = self.blocked_by_type.get(request.resource_type, 0) + 1
+            self.estimated_bytes_saved += self._seen_sizes.get(
+                request.url, ESTIMATED_BYTES_BY_TYPE.get(request.resource_type, ESTIMATED_BYTES_BY_TYPE['other'])
+            )
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _record_response(self, response):
+        try:
+            size = int(response.headers.get('content-length', 0))
+        except ValueError:
+            size = 0
+        self.allowed_requests += 1
+        self.allowed_bytes += size
+        if size:
+            if len(self._seen_sizes) >= self.max_seen_sizes and response.url not in self._seen_sizes:
+                # Drop the oldest entry; dicts keep insertion order
+                del self._seen_sizes[next(iter(self._seen_sizes))]
+            self._seen_sizes[response.url] = size
+
+    def print_summary(self):
+        """Print requests and bytes saved by blocking during this run"""
+        total = self.allowed_requests + self.blocked_requests
+        if not total:
+            return
+        print(f"\n🚫 Request filter: blocked {self.blocked_requests}/{total} requests, "
+              f"~{self.estimated_bytes_saved / 1_000_000:.1f} MB saved "
+              f"({self.allowed_bytes / 1_000_000:.1f} MB downloaded)")
+        for resource_type, count in sorted(self.blocked_by_type.items()):
+            print(f"  {resource_type}: {count} blocked")
+
+
+def default_request_filter():
+    """Default profile: keep documents, scripts, styles and API calls needed to render text.
+
+    Stylesheets are kept because innerText and visibility checks depend on
+    layout; without them hidden duplicate blocks leak into extracted text.
+    """
+    return RequestFilterPolicy(
+        blocked_resource_types=['image', 'media', 'font', 'ping', 'manifest', 'texttrack', 'eventsource'],
+        blocked_url_patterns=[
+            '*google-analytics.com*',
+            '*googletagmanager.com*',
+            '*doubleclick.net*',
+            '*segment.io*',
+            '*segment.com*',
+            '*mixpanel.com*',
+            '*posthog.com*',
+            '*hotjar.com*',
+            '*sentry.io*',
+            '*intercom.io*',
+            '*vercel-insights.com*',
+            '*/_vercel/insights/*',
+            '*/_vercel/speed-insights/*',
+        ],
+    )
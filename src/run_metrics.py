@@ -0,0 +1,178 @@
+import os
+import random
+import time
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = [0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with a bounded sample reservoir for quantiles.
+
+    Once `max_samples` observations are held, each new one replaces a random
+    sample with probability max_samples/count (reservoir sampling), so the
+    quantiles stay representative while memory stays flat in a long-running
+    daemon.
+    """
+
+    def __init__(self, buckets=None, max_samples=1024, rng=None):
+        self.buckets = buckets or DEFAULT_BUCKETS
+        self.bucket_counts = [0] * len(self.buckets)
+        self.max_samples = max(1, max_samples)
+        self.rng = rng or random.Random()
+        self.samples = []
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if len(self.samples) < self.max_samples:
+            self.samples.append(seconds)
+        else:
+            index = self.rng.randrange(self.count)
+            if index < self.max_samples:
+                self.samples[index] = seconds
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.bucket_counts[i] += 1
+
+    def quantile(self, q):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class RunMetrics:
+    """Per-stage timings, error counts, page throughput and strategy hits for a run.
+
+    Wrap a stage in `with metrics.timer('goto'):`; an exception escaping the
+    block is counted as an error for that stage and re-raised. Results are
+    written as Prometheus text format by write_prometheus() and printed as a
+    table by print_summary(). A long-running process calls reset() to start
+    a new window, so throughput is reported per window.
+    """
+
+    def __init__(self, buckets=None):
+        self.buckets = buckets
+        self.reset()
+
+    def reset(self):
+        """Start a new measurement window, e.g. one daemon cycle; pages/sec is counted from here"""
+        self.started = time.time()
+        self.stages = {}
+        self.errors = {}
+        self.pages = {}
+        self.strategy_hits = {}
+        self.gauges = {}
+
+    def observe(self, stage, seconds):
+        if stage not in self.stages:
+            self.stages[stage] = Histogram(self.buckets)
+        self.stages[stage].observe(seconds)
+
+    def error(self, stage):
+        self.errors[stage] = self.errors.get(stage, 0) + 1
+
+    @contextmanager
+    def timer(self, stage):
+        started = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self.error(stage)
+            raise
+        finally:
+            self.observe(stage, time.monotonic() - started)
+
+    def page(self, source, ok=True):
+        """Count one finished listing; source is 'fast_path' or 'browser'"""
+        self.pages[source] = self.pages.get(source, 0) + 1
+        if not ok:
+            self.error('page')
+
+    def hit(self, extractor, strategy):
+        """Record which strategy produced an extractor's accepted value"""
+        key = (extractor, str(strategy))
+        self.strategy_hits[key] = self.strategy_hits.get(key, 0) + 1
+
+    def set_gauge(self, name, value):
+        """Record a point-in-time value, e.g. the current request rate"""
+        self.gauges[name] = value
+
+    def pages_per_second(self):
+        elapsed = time.time() - self.started
+        return sum(self.pages.values()) / elapsed if elapsed > 0 else 0.0
+
+    def prometheus_text(self):
+        lines = [
+            '# HELP bounty_stage_duration_seconds Time spent in each scraping stage',
+            '# TYPE bounty_stage_duration_seconds histogram',
+        ]
+        for stage, histogram in sorted(self.stages.items()):
+            for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+                lines.append(f'bounty_stage_duration_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}')
+            lines.append(f'bounty_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+            lines.append(f'bounty_stage_duration_seconds_sum{{stage="{stage}"}} {histogram.total:.6f}')
+            lines.append(f'bounty_stage_duration_seconds_count{{stage="{stage}"}} {histogram.count}')
+
+        lines += ['# HELP bounty_stage_errors_total Errors raised per stage',
+                  '# TYPE bounty_stage_errors_total counter']
+        for stage, count in sorted(self.errors.items()):
+            lines.append(f'bounty_stage_errors_total{{stage="{stage}"}} {count}')
+
+        lines += ['# HELP bounty_pages_total Listings finished per source',
+                  '# TYPE bounty_pages_total counter']
+        for source, count in sorted(self.pages.items()):
+            lines.append(f'bounty_pages_total{{source="{source}"}} {count}')
+
+        lines += ['# HELP bounty_pages_per_second Listings finished per second since the run or cycle started',
+                  '# TYPE bounty_pages_per_second gauge',
+                  f'bounty_pages_per_second {self.pages_per_second():.4f}']
+
+        lines += ['# HELP bounty_strategy_hits_total Accepted values per extractor strategy',
+                  '# TYPE bounty_strategy_hits_total counter']
+        for (extractor, strategy), count in sorted(self.strategy_hits.items()):
+            lines.append(f'bounty_strategy_hits_total{{extractor="{extractor}",strategy="{strategy}"}} {count}')
+
+        for name, value in sorted(self.gauges.items()):
+            lines += [f'# TYPE bounty_{name} gauge', f'bounty_{name} {value:.4f}']
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path='output/metrics.prom'):
+        """Write metrics in Prometheus text format (node_exporter textfile style)"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+        return path
+
+    def print_summary(self):
+        """Print a per-stage latency table and throughput"""
+        if not self.stages and not self.pages:
+            return
+        print(f"\n📈 {'Stage':<28} {'count':>6} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'total s':>8}")
+        for stage, histogram in sorted(self.stages.items(), key=lambda item: -item[1].total):
+            print(f"   {stage:<28} {histogram.count:>6} {self.errors.get(stage, 0):>6} "
+                  f"{histogram.quantile(0.5) * 1000:>8.0f} {histogram.quantile(0.95) * 1000:>8.0f} "
+                  f"{histogram.max * 1000:>8.0f} {histogram.total:>8.1f}")
+        pages = sum(self.pages.values())
+        sources = ', '.join(f"{source}: {count}" for source, count in sorted(self.pages.items()))
+        print(f"   {pages} pages ({sources}) at {self.pages_per_second():.2f} pages/sec, "
+              f"{self.errors.get('page', 0)} failed")
+
+
+_default_metrics = None
+
+
+def get_metrics():
+    """Shared RunMetrics for the current process"""
+    global _default_metrics
+    if _default_metrics is None:
+        _default_metrics = RunMetrics()
+    return _default_metrics
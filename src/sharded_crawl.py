@@ -0,0 +1,217 @@
+import argparse
+import asyncio
+import glob
+import json
+import multiprocessing
+import os
+import time
+from bounty_scraper import ImprovedSuperteamBountyScraper
+from checkpoint_journal import CheckpointJournal
+from listing_fast_path import ListingFastPath
+from page_pool import AdaptiveRateLimiter
+from prize_extractor import PrizeExtractor
+
+
+def shard_journal_path(shard_dir, shard_id):
+    return os.path.join(shard_dir, f"shard-{shard_id}.jsonl")
+
+
+def shard_status_path(shard_dir, shard_id):
+    return os.path.join(shard_dir, f"shard-{shard_id}.status.json")
+
+
+def write_status(path, status):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(status, f)
+    os.replace(tmp_path, path)
+
+
+async def crawl_shard(shard_id, urls, shard_dir, concurrency, requests_per_second, max_requests_per_second,
+                      use_fast_path):
+    """Scrape one shard's URLs with its own browser, journaling every result.
+
+    The rates are this shard's share of the crawl's totals.
+    """
+    journal = CheckpointJournal(shard_journal_path(shard_dir, shard_id), key='result.url')
+    status_file = shard_status_path(shard_dir, shard_id)
+    status = {'shard': shard_id, 'pid': os.getpid(), 'total': len(urls), 'done': 0, 'failed': 0,
+              'state': 'running', 'updated_at': time.time()}
+    write_status(status_file, status)
+
+    rate_limiter = AdaptiveRateLimiter(requests_per_second, max_rps=max_requests_per_second)
+    scraper = ImprovedSuperteamBountyScraper(
+        concurrency=concurrency,
+        requests_per_second=requests_per_second,
+        prize_extractor=PrizeExtractor(rate_limiter=rate_limiter),
+        fast_path=ListingFastPath(rate_limiter=rate_limiter) if use_fast_path else None,
+        rate_limiter=rate_limiter,
+    )
+    scraper.load_bounty_data_cache([scraper.extract_slug_from_url(url) for url in urls])
+
+    def on_result(index, url, result):
+        scraper.checkpoint(journal, result)
+        status['done'] += 1
+        if result.get('status') == 'error':
+            status['failed'] += 1
+        status['updated_at'] = time.time()
+        write_status(status_file, status)
+
+    try:
+        await scraper.scrape_urls(urls, on_result=on_result)
+    finally:
+        journal.close()
+        scraper.strategy_ranker.flush()
+        scraper.metrics.write_prometheus(os.path.join(shard_dir, f"metrics-shard-{shard_id}.prom"))
+    status['state'] = 'finished'
+    write_status(status_file, status)
+
+
+def run_shard(shard_id, urls, shard_dir, concurrency, requests_per_second, max_requests_per_second, use_fast_path):
+    """Process entry point for one shard"""
+    asyncio.run(crawl_shard(shard_id, urls, shard_dir, concurrency, requests_per_second, max_requests_per_second,
+                            use_fast_path))
+
+
+class ShardedCrawl:
+    """Split bounty_links.txt across worker processes, each driving its own Chromium.
+
+    Shard k gets every k-th pending link. Workers journal results to
+    output/shards/shard-<k>.jsonl, so a crashed shard only loses its in-flight
+    listings and a re-run skips everything already journaled. The parent
+    merges the journals back into link order and writes the usual outputs.
+    `requests_per_second` is the total starting rate across all shards and
+    `max_requests_per_second` (default: the starting rate) the total the
+    shards' rate controllers may climb to; each shard gets an equal share.
+    """
+
+    def __init__(self, shards=None, concurrency=4, requests_per_second=2.0, use_fast_path=True,
+                 shard_dir='output/shards', scraper=None, max_requests_per_second=None):
+        self.shards = max(1, shards or os.cpu_count() or 1)
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.max_requests_per_second = max_requests_per_second or requests_per_second
+        self.use_fast_path = use_fast_path
+        self.shard_dir = shard_dir
+        self.scraper = scraper or ImprovedSuperteamBountyScraper()
+
+    def shard_journals(self):
+        return [CheckpointJournal(path, key='result.url')
+                for path in sorted(glob.glob(os.path.join(self.shard_dir, 'shard-*.jsonl')))]
+
+    def journaled_results(self):
+        """Results from every shard journal, including ones left by earlier runs"""
+        results = {}
+        for journal in self.shard_journals():
+            for result in self.scraper.replay_journal(journal):
+                results[result['url']] = result
+        return results
+
+    def print_progress(self, last_line):
+        parts = []
+        for shard_id in range(self.shards):
+            try:
+                with open(shard_status_path(self.shard_dir, shard_id), 'r', encoding='utf-8') as f:
+                    status = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                parts.append(f"#{shard_id} starting")
+                continue
+            part = f"#{shard_id} {status['done']}/{status['total']}"
+            if status['failed']:
+                part += f" ({status['failed']} failed)"
+            parts.append(part)
+        line = ' | '.join(parts)
+        if line != last_line:
+            print(f"📊 {line}")
+        return line
+
+    def run(self):
+        """Crawl all links across the shards and merge the results"""
+        links = self.scraper.load_bounty_links()
+        if not links:
+            print("No bounty links to scrape")
+            return []
+
+        os.makedirs(self.shard_dir, exist_ok=True)
+        for path in glob.glob(os.path.join(self.shard_dir, 'shard-*.status.json')):
+            os.remove(path)
+        completed = {r.get('url', '') for r in self.scraper.load_progress().get('results', [])}
+        completed.update(self.journaled_results())
+        pending = [url for url in links if url not in completed]
+        shard_count = min(self.shards, len(pending)) or 1
+        print(f"Found {len(links)} bounty links, {len(pending)} pending, "
+              f"splitting across {shard_count} shard(s)")
+
+        processes = []
+        if pending:
+            ctx = multiprocessing.get_context('spawn')
+            per_shard_rate = self.requests_per_second / shard_count
+            per_shard_max = self.max_requests_per_second / shard_count
+            for shard_id in range(shard_count):
+                process = ctx.Process(
+                    target=run_shard,
+                    args=(shard_id, pending[shard_id::shard_count], self.shard_dir,
+                          self.concurrency, per_shard_rate, per_shard_max, self.use_fast_path),
+                    name=f"shard-{shard_id}"
+                )
+                process.start()
+                processes.append(process)
+
+        self.shards = shard_count
+        last_line = None
+        while any(process.is_alive() for process in processes):
+            time.sleep(2)
+            last_line = self.print_progress(last_line)
+        self.print_progress(last_line)
+
+        failed_shards = [(shard_id, p.exitcode) for shard_id, p in enumerate(processes) if p.exitcode != 0]
+        for shard_id, exitcode in failed_shards:
+            print(f"💥 Shard {shard_id} exited with code {exitcode}; its finished listings are kept "
+                  f"and the rest will be retried on the next run")
+
+        return self.merge(links, clear=not failed_shards)
+
+    def merge(self, links, clear=True):
+        """Merge previous progress and shard journals in link order and write the outputs"""
+        by_url = {r.get('url', ''): r for r in self.scraper.load_progress().get('results', [])}
+        journaled = self.journaled_results()
+        by_url.update(journaled)
+        results = [by_url[url] for url in links if url in by_url]
+
+        self.scraper.results = results
+        self.scraper.prize_results = self.scraper.collect_prize_results(results)
+        self.scraper.state_store.upsert_descriptions(results)
+        if self.scraper.prize_results:
+            self.scraper.state_store.upsert_prize_results(self.scraper.prize_results)
+        self.scraper.state_store.export_views({'descriptions': self.scraper.results_file})
+        self.scraper.print_results_summary()
+
+        if clear:
+            # Carry the shard results into the scraper's own journal first, so a
+            # resumed run still skips them once the shard journals are gone
+            for result in journaled.values():
+                self.scraper.checkpoint(self.scraper.progress_journal, result)
+            self.scraper.progress_journal.sync()
+            for journal in self.shard_journals():
+                journal.clear()
+            for path in glob.glob(os.path.join(self.shard_dir, 'shard-*.status.json')):
+                os.remove(path)
+
+        missing = len(links) - len(results)
+        print(f"\n🎉 Sharded crawl merged {len(results)} bounties"
+              + (f", {missing} still missing" if missing else ""))
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Crawl bounty_links.txt across several processes')
+    parser.add_argument('--shards', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--concurrency', type=int, default=4, help='pages per shard')
+    parser.add_argument('--rps', type=float, default=2.0, help='total requests per second across shards')
+    parser.add_argument('--max-rps', type=float, default=None,
+                        help='total rate the shards may climb to (default: --rps)')
+    parser.add_argument('--no-fast-path', action='store_true', help='always use the browser')
+    args = parser.parse_args()
+
+    ShardedCrawl(shards=args.shards, concurrency=args.concurrency, requests_per_second=args.rps,
+                 use_fast_path=not args.no_fast_path, max_requests_per_second=args.max_rps).run()
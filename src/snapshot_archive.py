@@ -0,0 +1,109 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from run_metrics import get_metrics
+from page_scripts import BODY_TEXT_JS
+
+
+class SnapshotArchive:
+    """Compressed, content-hashed archive of rendered listing pages.
+
+    Layout under `root`:
+      objects/<aa>/<sha256>.gz  - gzip-compressed HTML or innerText, stored once per hash
+      index.jsonl               - one line per capture: slug, url, fetched_at and object hashes
+    """
+
+    def __init__(self, root='output/snapshots', store_text=True):
+        self.root = root
+        self.store_text = store_text
+        self.index_file = os.path.join(root, 'index.jsonl')
+        self.objects_dir = os.path.join(root, 'objects')
+        # The HTTP fast path saves from worker threads
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.gz")
+
+    def _put_object(self, content):
+        """Store content once under its SHA-256 and return the digest"""
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Unique per process and thread so parallel writers never share a temp file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return digest
+
+    def _get_object(self, digest):
+        with gzip.open(self._object_path(digest), 'rb') as f:
+            return f.read().decode('utf-8')
+
+    def save(self, slug, url, html, inner_text=None):
+        """Archive one rendered page and return its index entry"""
+        entry = {
+            'slug': slug,
+            'url': url,
+            'fetched_at': time.time(),
+            'html_sha256': self._put_object(html),
+            'text_sha256': self._put_object(inner_text) if inner_text is not None else None,
+        }
+        os.makedirs(self.root, exist_ok=True)
+        with self._lock, open(self.index_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+        return entry
+
+    async def capture(self, page, slug, url):
+        """Archive the page as currently rendered in the browser"""
+        try:
+            with get_metrics().timer('snapshot'):
+                html = await page.content()
+                inner_text = None
+                if self.store_text:
+                    inner_text = await page.evaluate(BODY_TEXT_JS)
+                # Compress and write off the event loop, like the other file writes in a run
+                return await asyncio.to_thread(self.save, slug, url, html, inner_text)
+        except Exception as e:
+            print(f"  ⚠️  Could not archive snapshot for {slug}: {e}")
+            return None
+
+    def entries(self):
+        """All index entries in capture order"""
+        if not os.path.exists(self.index_file):
+            return []
+        entries = []
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A partially written last line from an interrupted run
+                    continue
+        return entries
+
+    def latest(self):
+        """Most recent entry per slug"""
+        latest = {}
+        for entry in self.entries():
+            current = latest.get(entry['slug'])
+            if current is None or entry['fetched_at'] >= current['fetched_at']:
+                latest[entry['slug']] = entry
+        return latest
+
+    def load_html(self, entry):
+        return self._get_object(entry['html_sha256'])
+
+    def load_text(self, entry):
+        if not entry.get('text_sha256'):
+            return None
+        return self._get_object(entry['text_sha256'])
@@ -0,0 +1,347 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from run_metrics import get_metrics
+
+# Get the project root directory (parent of src)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS processed_bounties (
+    id TEXT PRIMARY KEY,
+    processed_at REAL
+);
+CREATE TABLE IF NOT EXISTS listings (
+    id TEXT PRIMARY KEY,
+    slug TEXT,
+    data TEXT NOT NULL,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_listings_slug ON listings(slug);
+CREATE TABLE IF NOT EXISTS descriptions (
+    slug TEXT PRIMARY KEY,
+    url TEXT,
+    data TEXT NOT NULL,
+    updated_at REAL
+);
+CREATE TABLE IF NOT EXISTS prize_results (
+    slug TEXT PRIMARY KEY,
+    url TEXT,
+    data TEXT NOT NULL,
+    extracted_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_prize_results_extracted_at ON prize_results(extracted_at);
+CREATE TABLE IF NOT EXISTS listing_fingerprints (
+    id TEXT PRIMARY KEY,
+    slug TEXT,
+    api_fingerprint TEXT,
+    content_fingerprint TEXT,
+    checked_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_listing_fingerprints_slug ON listing_fingerprints(slug);
+CREATE TABLE IF NOT EXISTS strategy_stats (
+    extractor TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    hits INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (extractor, strategy)
+);
+CREATE TABLE IF NOT EXISTS scrape_retries (
+    slug TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_attempt_at REAL
+);
+'''
+
+
+class BountyStateStore:
+    """SQLite-backed state for processed IDs, API listings, descriptions and prize results.
+
+    Every write is an upsert keyed by id or slug, so a run only touches the
+    rows for the listings it handled. The JSON files in data/ and output/
+    are derived views: writes only mark their view stale, and export_views()
+    rewrites the stale ones on demand (once at the end of a run, or from the
+    command line with --export).
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(project_root, 'data', 'bounty_state.db')
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        # JSON views whose tables changed since they were last exported
+        self.stale_views = set()
+        self.migrate_from_json()
+
+    def close(self):
+        self.conn.close()
+
+    def _write(self, sql, rows):
+        with self._lock, self.conn:
+            self.conn.executemany(sql, rows)
+
+    def _meta(self, key):
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def get_meta(self, key, default=None):
+        value = self._meta(key)
+        return default if value is None else value
+
+    def set_meta(self, key, value):
+        with self._lock, self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, str(value)))
+
+    def migrate_from_json(self):
+        """One-time import of the JSON state files used before the store existed"""
+        if self._meta('json_migrated'):
+            return
+
+        def load(path):
+            try:
+                with open(os.path.join(project_root, path), 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                return None
+
+        processed = load('data/processed_bounties.json')
+        if processed:
+            self.mark_processed(processed)
+        listings = load('data/superteam_bounties.json')
+        if listings:
+            self.upsert_listings(listings)
+        descriptions = load('output/bounty_descriptions.json')
+        if isinstance(descriptions, dict):
+            descriptions = descriptions.get('results', [])
+        if descriptions:
+            self.upsert_descriptions(descriptions)
+
+        # The imported rows came from the views, so they are already current
+        self.stale_views.clear()
+        self.set_meta('json_migrated', time.time())
+
+    # Processed bounty IDs
+
+    def processed_ids(self):
+        return {row[0] for row in self.conn.execute('SELECT id FROM processed_bounties')}
+
+    def is_processed(self, bounty_id):
+        return self.conn.execute('SELECT 1 FROM processed_bounties WHERE id = ?', (bounty_id,)).fetchone() is not None
+
+    def mark_processed(self, bounty_ids):
+        now = time.time()
+        self._write(
+            'INSERT OR IGNORE INTO processed_bounties (id, processed_at) VALUES (?, ?)',
+            [(bounty_id, now) for bounty_id in bounty_ids]
+        )
+        self.stale_views.add('processed')
+
+    # API listings
+
+    def upsert_listings(self, bounties):
+        now = time.time()
+        self._write(
+            '''INSERT INTO listings (id, slug, data, updated_at) VALUES (?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET slug = excluded.slug, data = excluded.data, updated_at = excluded.updated_at''',
+            [(b['id'], b.get('slug'), json.dumps(b), now) for b in bounties if b.get('id')]
+        )
+        self.stale_views.add('listings')
+
+    def listing_by_slug(self, slug):
+        row = self.conn.execute('SELECT data FROM listings WHERE slug = ?', (slug,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def listings(self):
+        return [json.loads(row[0]) for row in self.conn.execute('SELECT data FROM listings ORDER BY rowid')]
+
+    def listings_by_slugs(self, slugs, chunk_size=500):
+        """Listings for just these slugs, via the slug index"""
+        slugs = list(slugs)
+        bounties = []
+        for start in range(0, len(slugs), chunk_size):
+            chunk = slugs[start:start + chunk_size]
+            placeholders = ', '.join('?' * len(chunk))
+            bounties += [json.loads(row[0]) for row in self.conn.execute(
+                f'SELECT data FROM listings WHERE slug IN ({placeholders}) ORDER BY rowid', chunk)]
+        return bounties
+
+    def unprocessed_listings(self):
+        return [json.loads(row[0]) for row in self.conn.execute(
+            '''SELECT data FROM listings
+               WHERE id NOT IN (SELECT id FROM processed_bounties)
+               ORDER BY rowid'''
+        )]
+
+    # Scraped descriptions (merged records)
+
+    def upsert_descriptions(self, records):
+        now = time.time()
+        self._write(
+            '''INSERT INTO descriptions (slug, url, data, updated_at) VALUES (?, ?, ?, ?)
+               ON CONFLICT(slug) DO UPDATE SET url = excluded.url, data = excluded.data, updated_at = excluded.updated_at''',
+            [(r['slug'], r.get('url'), json.dumps(r, ensure_ascii=False), now) for r in records if r.get('slug')]
+        )
+        self.stale_views.add('descriptions')
+
+    def description(self, slug):
+        row = self.conn.execute('SELECT data FROM descriptions WHERE slug = ?', (slug,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def descriptions(self):
+        return [json.loads(row[0]) for row in self.conn.execute('SELECT data FROM descriptions ORDER BY rowid')]
+
+    def description_count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM descriptions').fetchone()[0]
+
+    # Prize extraction results
+
+    def upsert_prize_results(self, results):
+        now = time.time()
+        self._write(
+            '''INSERT INTO prize_results (slug, url, data, extracted_at) VALUES (?, ?, ?, ?)
+               ON CONFLICT(slug) DO UPDATE SET url = excluded.url, data = excluded.data, extracted_at = excluded.extracted_at''',
+            [(r['slug'], r.get('url'), json.dumps(r, ensure_ascii=False), now) for r in results if r.get('slug')]
+        )
+
+    def prize_results_since(self, timestamp):
+        """Prize results extracted after `timestamp`, oldest first"""
+        return [json.loads(row[0]) for row in self.conn.execute(
+            'SELECT data FROM prize_results WHERE extracted_at > ? ORDER BY extracted_at', (timestamp,)
+        )]
+
+    def prize_result(self, slug):
+        row = self.conn.execute('SELECT data FROM prize_results WHERE slug = ?', (slug,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    # Change-detection fingerprints
+
+    def api_fingerprints(self):
+        """Map of listing id -> recorded API fingerprint"""
+        return {row[0]: row[1] for row in self.conn.execute(
+            'SELECT id, api_fingerprint FROM listing_fingerprints WHERE api_fingerprint IS NOT NULL'
+        )}
+
+    def content_fingerprint(self, slug):
+        row = self.conn.execute('SELECT content_fingerprint FROM listing_fingerprints WHERE slug = ?', (slug,)).fetchone()
+        return row[0] if row else None
+
+    def save_fingerprints(self, rows):
+        """Upsert (id, slug, api_fingerprint, content_fingerprint) rows; None keeps the stored value"""
+        now = time.time()
+        self._write(
+            '''INSERT INTO listing_fingerprints (id, slug, api_fingerprint, content_fingerprint, checked_at)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   slug = excluded.slug,
+                   api_fingerprint = COALESCE(excluded.api_fingerprint, api_fingerprint),
+                   content_fingerprint = COALESCE(excluded.content_fingerprint, content_fingerprint),
+                   checked_at = excluded.checked_at''',
+            [(bounty_id, slug, api_fp, content_fp, now) for bounty_id, slug, api_fp, content_fp in rows]
+        )
+
+    # Extraction strategy hit counts
+
+    def strategy_stats(self):
+        """Map of (extractor, strategy) -> (attempts, hits)"""
+        return {(row[0], row[1]): (row[2], row[3]) for row in self.conn.execute(
+            'SELECT extractor, strategy, attempts, hits FROM strategy_stats'
+        )}
+
+    def add_strategy_stats(self, rows):
+        """Add (extractor, strategy, attempts, hits) increments"""
+        self._write(
+            '''INSERT INTO strategy_stats (extractor, strategy, attempts, hits) VALUES (?, ?, ?, ?)
+               ON CONFLICT(extractor, strategy) DO UPDATE SET
+                   attempts = attempts + excluded.attempts,
+                   hits = hits + excluded.hits''',
+            rows
+        )
+
+    # Failed refresh attempts
+
+    def scrape_retries(self):
+        """Map of slug -> number of refreshes that failed"""
+        return {row[0]: row[1] for row in self.conn.execute('SELECT slug, attempts FROM scrape_retries')}
+
+    def add_scrape_retries(self, slugs):
+        """Count one more failed refresh for each slug"""
+        now = time.time()
+        self._write(
+            '''INSERT INTO scrape_retries (slug, attempts, last_attempt_at) VALUES (?, 1, ?)
+               ON CONFLICT(slug) DO UPDATE SET attempts = attempts + 1, last_attempt_at = excluded.last_attempt_at''',
+            [(slug, now) for slug in slugs]
+        )
+
+    # Derived JSON views
+
+    def _export(self, path, data, indent=2):
+        with get_metrics().timer('save.export'):
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=indent, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+    def export_processed(self, path=None):
+        self._export(path or os.path.join(project_root, 'data', 'processed_bounties.json'),
+                     sorted(self.processed_ids()), indent=None)
+        self.stale_views.discard('processed')
+
+    def export_listings(self, path=None):
+        self._export(path or os.path.join(project_root, 'data', 'superteam_bounties.json'), self.listings())
+        self.stale_views.discard('listings')
+
+    def export_descriptions(self, path=None):
+        self._export(path or os.path.join(project_root, 'output', 'bounty_descriptions.json'), self.descriptions())
+        self.stale_views.discard('descriptions')
+
+
+    def export_views(self, paths=None, force=False):
+        """Rewrite the JSON views that are stale (all of them with `force`); returns the views written.
+
+        `paths` maps a view name to a file other than its default.
+        """
+        paths = paths or {}
+        exporters = {
+            'processed': self.export_processed,
+            'listings': self.export_listings,
+            'descriptions': self.export_descriptions,
+        }
+        views = sorted(exporters if force else self.stale_views & set(exporters))
+        for view in views:
+            exporters[view](paths.get(view))
+        return views
+
+
+_default_store = None
+
+
+def get_state_store():
+    """Shared BountyStateStore for the default database"""
+    global _default_store
+    if _default_store is None:
+        _default_store = BountyStateStore()
+    return _default_store
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Inspect or export the bounty state store')
+    parser.add_argument('--export', action='store_true', help='rewrite every JSON view from the database')
+    args = parser.parse_args()
+
+    store = get_state_store()
+    if args.export:
+        print(f"Exported {', '.join(store.export_views(force=True))}")
+    print(f"{len(store.processed_ids())} processed, {len(store.listings())} listings, "
+          f"{store.description_count()} descriptions")
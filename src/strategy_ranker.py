@@ -0,0 +1,88 @@
+import random
+from state_store import get_state_store
+
+
+class StrategyRanker:
+    """Skip extraction strategies that never produce the accepted value.
+
+    Strategies are listed in priority order: an earlier one is more precise
+    than a later one and may return a different value for the same page, so
+    the order itself is never changed. The ranker only moves strategies that
+    have been tried at least `min_attempts` times without ever winning
+    behind the rest, which saves their cost without changing what the
+    cascade returns. Counts are kept per (extractor, strategy) in the state
+    store, so later runs start with what earlier runs learned. With
+    probability `exploration` the full priority order is used so a demoted
+    strategy that starts matching again is noticed. With persist=False the
+    stored counts are read but never added to.
+
+    Fallbacks (heuristics that accept almost any page, like "assume GLOBAL")
+    always stay last.
+    """
+
+    def __init__(self, state_store=None, exploration=0.1, min_attempts=5, flush_every=25, rng=None,
+                 persist=True):
+        self.state_store = state_store or get_state_store()
+        self.exploration = exploration
+        self.min_attempts = min_attempts
+        self.flush_every = max(1, flush_every)
+        self.rng = rng or random.Random()
+        self.persist = persist
+        self.stats = self.state_store.strategy_stats()
+        self._pending = {}
+        self._records = 0
+
+    def never_matches(self, extractor, strategy):
+        attempts, hits = self.stats.get((extractor, strategy), (0, 0))
+        return attempts >= self.min_attempts and hits == 0
+
+    def order(self, extractor, strategies, fallbacks=()):
+        """Return strategies in priority order with the never-matching ones moved last, then the fallbacks"""
+        ranked = [s for s in strategies if s not in fallbacks]
+        if self.rng.random() >= self.exploration:
+            ranked = ([s for s in ranked if not self.never_matches(extractor, s)]
+                      + [s for s in ranked if self.never_matches(extractor, s)])
+        return ranked + [s for s in strategies if s in fallbacks]
+
+    def record(self, extractor, tried, winner=None):
+        """Count an attempt for every strategy tried and a hit for the one that produced the value"""
+        for strategy in tried:
+            key = (extractor, strategy)
+            hit = 1 if strategy == winner else 0
+            attempts, hits = self.stats.get(key, (0, 0))
+            self.stats[key] = (attempts + 1, hits + hit)
+            pending_attempts, pending_hits = self._pending.get(key, (0, 0))
+            self._pending[key] = (pending_attempts + 1, pending_hits + hit)
+        self._records += 1
+        if self._records % self.flush_every == 0:
+            self.flush()
+
+    def flush(self):
+        """Add the counts recorded since the last flush to the state store"""
+        if self._pending and self.persist:
+            self.state_store.add_strategy_stats(
+                [(extractor, strategy, attempts, hits)
+                 for (extractor, strategy), (attempts, hits) in self._pending.items()]
+            )
+            self._pending = {}
+
+    def print_summary(self):
+        extractors = sorted({extractor for extractor, _ in self.stats})
+        if not extractors:
+            return
+        print("\n🎯 Strategy hit rates:")
+        for extractor in extractors:
+            rows = sorted(((s, a, h) for (e, s), (a, h) in self.stats.items() if e == extractor),
+                          key=lambda row: -(row[2] / row[1] if row[1] else 0))
+            print(f"  {extractor}: " + ', '.join(f"{s} {h}/{a}" for s, a, h in rows))
+
+
+_default_ranker = None
+
+
+def get_strategy_ranker():
+    """Shared StrategyRanker backed by the default state store"""
+    global _default_ranker
+    if _default_ranker is None:
+        _default_ranker = StrategyRanker()
+    return _default_ranker
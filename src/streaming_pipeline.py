@@ -0,0 +1,186 @@
+import asyncio
+import time
+from bounty_api_client import get_async_api_client, get_new_bounties_async, save_bounty_data
+from listing_fingerprint import api_fingerprint, content_fingerprint
+
+LISTING_URL = 'https://earn.superteam.fun/listing/{}'
+
+# Marks the end of a stage's output
+DONE = object()
+
+
+class StreamingPipeline:
+    """API discovery -> page extraction -> prize validation -> persistence, joined by bounded queues.
+
+    Each listing is committed to the state store as soon as it has been
+    validated, so the first results land while the rest of the batch is still
+    being scraped. The queues hold at most `queue_size` listings, which keeps
+    memory flat on large batches and makes a slow stage throttle the ones
+    before it. The JSON views are left to the caller's export_views().
+    """
+
+    def __init__(self, scraper, queue_size=None):
+        self.scraper = scraper
+        self.prize_extractor = scraper.prize_extractor
+        self.state_store = scraper.state_store
+        self.metrics = scraper.metrics
+        self.queue_size = queue_size or scraper.concurrency * 2
+        # Chromium is only launched once a listing misses the HTTP fast path
+        self.browser_manager = scraper.browser_manager
+        self.started = None
+        self.started_at = None
+        self.first_result_at = None
+        self.discovered = 0
+        self.committed = []
+        self.prize_results = []
+        self.mismatched = 0
+
+    async def discover(self, listings, bounties=None):
+        """Fetch new listings from the API (unless already given) and feed them to the extraction workers"""
+        try:
+            if bounties is None:
+                with self.metrics.timer('pipeline.discover'):
+                    bounties = await get_new_bounties_async()
+            if not bounties:
+                return
+            await asyncio.to_thread(save_bounty_data, bounties)
+            print(f"✅ Found {len(bounties)} new bounties")
+            for bounty in bounties:
+                self.scraper.bounty_data_cache[bounty['slug']] = bounty
+                self.discovered += 1
+                await listings.put(bounty)
+        finally:
+            for _ in range(self.scraper.concurrency):
+                await listings.put(DONE)
+
+    async def extract_listing(self, bounty):
+        """Scrape one listing, over HTTP when the fast path validates it and in a browser page otherwise"""
+        scraper = self.scraper
+        url = LISTING_URL.format(bounty['slug'])
+        if scraper.fast_path:
+            await scraper.rate_limiter.acquire()
+            with self.metrics.timer('fast_path'):
+                extracted = await asyncio.to_thread(scraper.fast_path.extract_listing, url, bounty['slug'], bounty,
+                                                    scraper.snapshot_archive)
+            if extracted:
+                record, prize_result = extracted
+                self.metrics.page('fast_path')
+                return record, prize_result
+
+        await scraper.rate_limiter.acquire()
+        async with self.browser_manager.page() as page:
+            record = await scraper.scrape_bounty_from_url(page, url)
+        self.browser_manager.record_navigations(1)
+        self.metrics.page('browser', ok=record.get('status') != 'error')
+        return record, scraper._prize_results_by_url.pop(url, None)
+
+    async def extract(self, listings, extracted):
+        """Extraction worker; `concurrency` of these run side by side"""
+        while True:
+            bounty = await listings.get()
+            if bounty is DONE:
+                return
+            try:
+                record, prize_result = await self.extract_listing(bounty)
+            except Exception as e:
+                # Not marked processed, so the next run picks it up again
+                print(f"  ✗ Pipeline failed on {bounty['slug']}: {e}")
+                self.metrics.page('browser', ok=False)
+                continue
+            await extracted.put((bounty, record, prize_result))
+
+    async def extract_stage(self, listings, extracted):
+        try:
+            await asyncio.gather(*(self.extract(listings, extracted) for _ in range(self.scraper.concurrency)))
+        finally:
+            await extracted.put(DONE)
+
+    async def validate(self, extracted, validated):
+        """Attach the prize breakdown to each record and flag totals that don't add up"""
+        try:
+            while True:
+                item = await extracted.get()
+                if item is DONE:
+                    return
+                bounty, record, prize_result = item
+                if prize_result and self.prize_extractor:
+                    prize_data = self.prize_extractor.to_extracted_prize_data(prize_result)
+                    record['extracted_prize_data'] = prize_data
+                    if prize_data['extraction_successful'] and not prize_data['amounts_match']:
+                        self.mismatched += 1
+                        print(f"  ⚠️  {bounty['slug']}: prizes sum to {prize_data['individual_sum']}, "
+                              f"total is {prize_data['total_reward']}")
+                await validated.put((bounty, record, prize_result))
+        finally:
+            await validated.put(DONE)
+
+    async def persist(self, validated):
+        """Commit each listing to the state store as soon as it arrives"""
+        while True:
+            item = await validated.get()
+            if item is DONE:
+                return
+            bounty, record, prize_result = item
+            with self.metrics.timer('pipeline.commit'):
+                await asyncio.to_thread(self.commit, bounty, record, prize_result)
+            self.committed.append(record)
+            if prize_result:
+                self.prize_results.append(prize_result)
+            if self.first_result_at is None:
+                self.first_result_at = time.monotonic() - self.started
+                self.metrics.observe('pipeline.first_result', self.first_result_at)
+                print(f"⏱️  First result committed after {self.first_result_at:.2f}s")
+            print(f"  💾 [{len(self.committed)}/{self.discovered}] Committed {bounty['slug']}")
+
+    def commit(self, bounty, record, prize_result):
+        self.state_store.upsert_descriptions([record])
+        if prize_result:
+            self.state_store.upsert_prize_results([prize_result])
+        self.state_store.mark_processed([bounty['id']])
+        if record.get('status') != 'error':
+            self.state_store.save_fingerprints(
+                [(bounty['id'], bounty['slug'], api_fingerprint(bounty), content_fingerprint(record))])
+
+    async def run(self, bounties=None):
+        """Run every stage to completion; returns the committed records in completion order.
+
+        `bounties` skips the API call for listings the caller already fetched;
+        the caller then commits its client's validators.
+        """
+        self.started = time.monotonic()
+        self.started_at = time.time()
+        listings = asyncio.Queue(maxsize=self.queue_size)
+        extracted = asyncio.Queue(maxsize=self.queue_size)
+        validated = asyncio.Queue(maxsize=self.queue_size)
+        tasks = [
+            asyncio.create_task(self.discover(listings, bounties)),
+            asyncio.create_task(self.extract_stage(listings, extracted)),
+            asyncio.create_task(self.validate(extracted, validated)),
+            asyncio.create_task(self.persist(validated)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            await self.scraper.close_browser()
+
+        if not self.discovered:
+            return []
+        if bounties is None:
+            # The listings this pipeline polled for are all committed, so the next poll can be a 304
+            await asyncio.to_thread(get_async_api_client().commit_validators)
+        if self.committed:
+            # Prize data was attached to each record before commit, so nothing is left to merge
+            self.state_store.set_meta('prizes_merged_at', self.started_at)
+        self.scraper.prize_results = self.prize_results
+        self.scraper.readiness.print_summary()
+        self.scraper.request_filter.print_summary()
+        if self.scraper.fast_path:
+            self.scraper.fast_path.print_summary()
+        print(f"\n✅ Pipeline committed {len(self.committed)}/{self.discovered} listings in "
+              f"{time.monotonic() - self.started:.2f}s ({self.mismatched} with mismatched prize totals)")
+        self.scraper.report_metrics()
+        return self.committed
@@ -0,0 +1,209 @@
+import json
+import os
+import socket
+import sqlite3
+import time
+
+# Get the project root directory (parent of src)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    queue TEXT NOT NULL,
+    item TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    enqueued_at REAL,
+    updated_at REAL,
+    PRIMARY KEY (queue, item)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs(queue, status, available_at);
+'''
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SQLiteWorkQueue:
+    """Durable work queue of slugs with leases, retries and a dead-letter bucket.
+
+    Items move pending -> leased -> done. A lease hides an item from other
+    workers for `visibility_timeout` seconds; if the worker neither acks nor
+    fails it in time, the item becomes leasable again. Failed items are
+    retried with a linear backoff and moved to 'dead' after `max_attempts`.
+
+    Every transition runs in a single IMMEDIATE transaction, so any number of
+    worker processes can share the database file. Across machines, put it on
+    storage with working file locks (a local disk shared over NFS is not safe).
+    """
+
+    def __init__(self, path=None, queue='scrape', visibility_timeout=300, max_attempts=3, retry_delay=30):
+        self.path = path or os.path.join(project_root, 'data', 'work_queue.db')
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.queue = queue
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _transaction(self, fn):
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            value = fn()
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.conn.execute('COMMIT')
+        return value
+
+    def enqueue(self, items):
+        """Add items and return how many of each kind there were.
+
+        Dead-lettered items are given a fresh set of attempts ('requeued').
+        Pending and leased items are left alone ('in_progress'), and so are
+        finished ones whose results haven't been purged yet ('done'), so a
+        coordinator that restarts picks those results up instead of
+        redoing the work.
+        """
+        now = time.time()
+        items = list(dict.fromkeys(items))
+
+        def insert():
+            states = {}
+            for start in range(0, len(items), 500):
+                chunk = items[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                states.update(self.conn.execute(
+                    f'SELECT item, status FROM jobs WHERE queue = ? AND item IN ({placeholders})',
+                    [self.queue] + chunk))
+            counts = {'added': 0, 'requeued': 0, 'done': 0, 'in_progress': 0}
+            for item in items:
+                status = states.get(item)
+                if status is None:
+                    counts['added'] += 1
+                elif status == 'dead':
+                    counts['requeued'] += 1
+                elif status == 'done':
+                    counts['done'] += 1
+                else:
+                    counts['in_progress'] += 1
+            self.conn.executemany(
+                '''INSERT OR IGNORE INTO jobs (queue, item, available_at, enqueued_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?)''',
+                [(self.queue, item, now, now, now) for item in items if item not in states])
+            self.conn.executemany(
+                '''UPDATE jobs SET status = 'pending', attempts = 0, error = NULL, available_at = ?, updated_at = ?
+                   WHERE queue = ? AND item = ? AND status = 'dead' ''',
+                [(now, now, self.queue, item) for item in items if states.get(item) == 'dead'])
+            return counts
+        return self._transaction(insert)
+
+    def lease(self, worker_id=None, batch_size=1):
+        """Claim up to batch_size ready items for this worker"""
+        worker_id = worker_id or default_worker_id()
+
+        def claim():
+            now = time.time()
+            # Leases that expired on their last allowed attempt go to the dead-letter bucket
+            self.conn.execute(
+                '''UPDATE jobs SET status = 'dead', error = 'lease expired', lease_owner = NULL, updated_at = ?
+                   WHERE queue = ? AND status = 'leased' AND lease_expires < ? AND attempts >= ?''',
+                (now, self.queue, now, self.max_attempts))
+            items = [row[0] for row in self.conn.execute(
+                '''SELECT item FROM jobs
+                   WHERE queue = ? AND ((status = 'pending' AND available_at <= ?)
+                                        OR (status = 'leased' AND lease_expires < ?))
+                   ORDER BY enqueued_at, rowid LIMIT ?''',
+                (self.queue, now, now, batch_size))]
+            self.conn.executemany(
+                '''UPDATE jobs SET status = 'leased', attempts = attempts + 1, lease_owner = ?,
+                       lease_expires = ?, updated_at = ?
+                   WHERE queue = ? AND item = ?''',
+                [(worker_id, now + self.visibility_timeout, now, self.queue, item) for item in items])
+            return items
+        return self._transaction(claim)
+
+    def extend(self, item, worker_id=None):
+        """Push a lease's expiry out by another visibility timeout"""
+        now = time.time()
+        cursor = self.conn.execute(
+            '''UPDATE jobs SET lease_expires = ?, updated_at = ?
+               WHERE queue = ? AND item = ? AND status = 'leased' AND lease_owner = ?''',
+            (now + self.visibility_timeout, now, self.queue, item, worker_id or default_worker_id()))
+        return cursor.rowcount == 1
+
+    def ack(self, item, result, worker_id=None):
+        """Store the item's result; False if the lease was lost to another worker"""
+        cursor = self.conn.execute(
+            '''UPDATE jobs SET status = 'done', result = ?, error = NULL, lease_owner = NULL, updated_at = ?
+               WHERE queue = ? AND item = ? AND status = 'leased' AND lease_owner = ?''',
+            (json.dumps(result, ensure_ascii=False), time.time(), self.queue, item,
+             worker_id or default_worker_id()))
+        return cursor.rowcount == 1
+
+    def fail(self, item, error, worker_id=None):
+        """Release a failed item for retry, or dead-letter it after max_attempts"""
+        worker_id = worker_id or default_worker_id()
+
+        def release():
+            row = self.conn.execute(
+                "SELECT attempts FROM jobs WHERE queue = ? AND item = ? AND status = 'leased' AND lease_owner = ?",
+                (self.queue, item, worker_id)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            status = 'dead' if row[0] >= self.max_attempts else 'pending'
+            self.conn.execute(
+                '''UPDATE jobs SET status = ?, error = ?, lease_owner = NULL, available_at = ?, updated_at = ?
+                   WHERE queue = ? AND item = ?''',
+                (status, str(error), now + self.retry_delay * row[0], now, self.queue, item))
+            return status
+        return self._transaction(release)
+
+    def counts(self):
+        """Number of items per status"""
+        counts = {'pending': 0, 'leased': 0, 'done': 0, 'dead': 0}
+        for status, count in self.conn.execute(
+                'SELECT status, COUNT(*) FROM jobs WHERE queue = ? GROUP BY status', (self.queue,)):
+            counts[status] = count
+        return counts
+
+    def is_drained(self):
+        counts = self.counts()
+        return counts['pending'] == 0 and counts['leased'] == 0
+
+    def results(self):
+        """Map of item -> result for finished items"""
+        return {item: json.loads(result) for item, result in self.conn.execute(
+            "SELECT item, result FROM jobs WHERE queue = ? AND status = 'done'", (self.queue,))}
+
+    def dead_letters(self):
+        return [{'item': item, 'attempts': attempts, 'error': error} for item, attempts, error in self.conn.execute(
+            "SELECT item, attempts, error FROM jobs WHERE queue = ? AND status = 'dead' ORDER BY updated_at",
+            (self.queue,))]
+
+    def requeue_dead(self):
+        """Give dead-lettered items a fresh set of attempts"""
+        cursor = self.conn.execute(
+            '''UPDATE jobs SET status = 'pending', attempts = 0, available_at = ?, updated_at = ?
+               WHERE queue = ? AND status = 'dead' ''', (time.time(), time.time(), self.queue))
+        return cursor.rowcount
+
+    def purge_done(self, items=None):
+        """Drop finished items once their results have been merged"""
+        if items is None:
+            self.conn.execute("DELETE FROM jobs WHERE queue = ? AND status = 'done'", (self.queue,))
+        else:
+            self.conn.executemany("DELETE FROM jobs WHERE queue = ? AND item = ? AND status = 'done'",
+                                  [(self.queue, item) for item in items])
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+
+pytest.importorskip('playwright')
+
+from browser_manager import BrowserManager
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed or self.context.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        assert not self.closed, 'page opened on a closed context'
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self, **kwargs):
+        self.contexts.append(FakeContext())
+        return self.contexts[-1]
+
+
+def make_manager(**kwargs):
+    manager = BrowserManager(**kwargs)
+    manager._browser = FakeBrowser()
+    return manager
+
+
+def test_recycles_while_pages_are_borrowed_back_to_back():
+    async def run():
+        manager = make_manager(recycle_after=2, max_pages=2)
+        held = await manager.acquire_page()
+        # One page stays out the whole time, yet the context still rotates
+        for _ in range(3):
+            async with manager.page():
+                manager.record_navigations(1)
+        old_context = held.context
+        assert manager.recycles >= 1
+        assert not old_context.closed
+        assert manager._context is not old_context
+        await manager.release_page(held)
+        assert old_context.closed
+        assert manager.pages_in_use == 0
+    asyncio.run(run())
+
+
+def test_idle_context_is_closed_immediately():
+    async def run():
+        manager = make_manager(recycle_after=1)
+        async with manager.page() as page:
+            manager.record_navigations(1)
+        first = page.context
+        async with manager.page() as page:
+            pass
+        assert first.closed
+        assert page.context is not first
+        assert manager._retiring is None
+    asyncio.run(run())
+
+
+def test_warm_pages_are_reused():
+    async def run():
+        manager = make_manager(warm_pages=1)
+        async with manager.page() as first:
+            pass
+        async with manager.page() as second:
+            pass
+        assert first is second
+    asyncio.run(run())
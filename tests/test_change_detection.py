@@ -0,0 +1,104 @@
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('aiohttp')
+
+import asyncio
+
+import bounty_api_client
+import state_store
+from bounty_api_client import AsyncBountyApiClient, BountyApiClient, get_async_api_client
+from link_registry import LinkRegistry
+from listing_fingerprint import api_fingerprint
+from state_store import BountyStateStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_store, 'project_root', str(tmp_path))
+    store = BountyStateStore(str(tmp_path / 'state.db'))
+    monkeypatch.setattr(bounty_api_client, 'get_state_store', lambda: store)
+    yield store
+    store.close()
+
+
+def test_processed_listing_without_fingerprint_is_baselined(store):
+    bounty = {'id': '1', 'slug': 'a', 'title': 'T'}
+    store.mark_processed(['1'])
+    store.upsert_descriptions([{'slug': 'a', 'description': 'ok', 'status': 'active'}])
+    assert BountyApiClient().find_changed_bounties([bounty]) == []
+    assert store.api_fingerprints() == {'1': api_fingerprint(bounty)}
+
+
+def test_failed_first_scrape_is_reported_until_it_succeeds(store):
+    bounty = {'id': '1', 'slug': 'a', 'title': 'T'}
+    store.mark_processed(['1'])
+    store.upsert_descriptions([{'slug': 'a', 'description': 'Error: timeout', 'status': 'error'}])
+    client = BountyApiClient()
+    assert client.find_changed_bounties([bounty]) == [bounty]
+    assert client.find_changed_bounties([bounty]) == [bounty]
+
+
+def test_failed_first_scrape_stops_after_max_failed_retries(store):
+    bounty = {'id': '1', 'slug': 'a', 'title': 'T'}
+    store.mark_processed(['1'])
+    store.upsert_descriptions([{'slug': 'a', 'description': 'Error: timeout', 'status': 'error'}])
+    client = BountyApiClient(max_failed_retries=2)
+    store.add_scrape_retries(['a'])
+    assert client.find_changed_bounties([bounty]) == [bounty]
+    store.add_scrape_retries(['a'])
+    assert client.find_changed_bounties([bounty]) == []
+
+
+def test_failed_listing_does_not_block_the_304(store, tmp_path, monkeypatch):
+    registry = LinkRegistry(str(tmp_path / 'links.txt'))
+    monkeypatch.setattr(bounty_api_client, 'get_link_registry', lambda: registry)
+    bounty = {'id': '1', 'slug': 'a', 'title': 'T'}
+    store.mark_processed(['1'])
+    store.upsert_descriptions([{'slug': 'a', 'description': 'Error: timeout', 'status': 'error'}])
+    client = BountyApiClient(state_file=str(tmp_path / 'api_state.json'))
+
+    listings = client.accept_listings({'ETag': '"v1"'}, [bounty])
+    assert client.select_new_bounties(listings) == []
+    assert client.conditional_headers() == {'If-None-Match': '"v1"'}
+
+    # In refresh mode the validators wait until the failed listing is refreshed
+    listings = client.accept_listings({'ETag': '"v2"'}, [bounty])
+    assert client.select_new_bounties(listings, refresh=True) == []
+    assert client.last_changed == [bounty]
+    assert client.conditional_headers() == {'If-None-Match': '"v1"'}
+    client.commit_validators()
+    assert BountyApiClient(state_file=str(tmp_path / 'api_state.json')).validators['etag'] == '"v2"'
+
+
+def test_edited_listing_is_reported(store):
+    bounty = {'id': '1', 'slug': 'a', 'title': 'T'}
+    store.mark_processed(['1'])
+    store.save_fingerprints([('1', 'a', api_fingerprint(bounty), None)])
+    edited = dict(bounty, title='T2')
+    assert BountyApiClient().find_changed_bounties([edited]) == [edited]
+
+
+def test_async_client_closes_only_its_own_sessions():
+    async def poll_and_close():
+        async with AsyncBountyApiClient() as client:
+            session = client.aiohttp_session()
+        return client, session
+
+    client, session = asyncio.run(poll_and_close())
+    assert session.closed
+    assert client._aiohttp_session is None
+    assert get_async_api_client() is not client
+
+
+def test_new_listings_hold_validators_until_committed(store, tmp_path, monkeypatch):
+    registry = LinkRegistry(str(tmp_path / 'links.txt'))
+    monkeypatch.setattr(bounty_api_client, 'get_link_registry', lambda: registry)
+    bounty = {'id': '1', 'slug': 'a', 'title': 'T'}
+    client = BountyApiClient(state_file=str(tmp_path / 'api_state.json'))
+
+    listings = client.accept_listings({'ETag': '"v1"'}, [bounty])
+    assert client.select_new_bounties(listings) == [bounty]
+    assert client.conditional_headers() == {}
+    client.commit_validators()
+    assert client.conditional_headers() == {'If-None-Match': '"v1"'}
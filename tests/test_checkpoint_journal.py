@@ -0,0 +1,64 @@
+from checkpoint_journal import CheckpointJournal
+
+
+def test_replay_keeps_latest_record_per_key(tmp_path):
+    journal = CheckpointJournal(str(tmp_path / 'progress.jsonl'))
+    journal.append({'url': 'a', 'n': 1})
+    journal.append({'url': 'b', 'n': 1})
+    journal.append({'url': 'a', 'n': 2})
+    journal.close()
+    assert journal.replay() == [{'url': 'b', 'n': 1}, {'url': 'a', 'n': 2}]
+
+
+def test_torn_last_line_is_skipped_and_terminated(tmp_path):
+    path = tmp_path / 'progress.jsonl'
+    path.write_text('{"url": "a", "n": 1}\n{"url": "b", "n"', encoding='utf-8')
+    journal = CheckpointJournal(str(path))
+    assert journal.replay() == [{'url': 'a', 'n': 1}]
+
+    # The next append starts on a fresh line instead of extending the torn one
+    journal.append({'url': 'c', 'n': 1})
+    journal.close()
+    assert journal.replay() == [{'url': 'a', 'n': 1}, {'url': 'c', 'n': 1}]
+
+
+def test_compact_rewrites_one_line_per_key(tmp_path):
+    path = tmp_path / 'progress.jsonl'
+    journal = CheckpointJournal(str(path), key='result.url')
+    for n in range(3):
+        journal.append({'result': {'url': 'a', 'n': n}})
+    assert journal.compact() == 1
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 1
+    assert journal.replay() == [{'result': {'url': 'a', 'n': 2}}]
+
+
+def test_clear_removes_the_file(tmp_path):
+    path = tmp_path / 'progress.jsonl'
+    journal = CheckpointJournal(str(path))
+    journal.append({'url': 'a'})
+    journal.clear()
+    assert not path.exists()
+    assert journal.replay() == []
+
+
+def test_journal_compacts_itself_once_stale_lines_pile_up(tmp_path):
+    path = tmp_path / 'progress.jsonl'
+    journal = CheckpointJournal(str(path), compact_ratio=2.0, compact_min_lines=10)
+    for n in range(9):
+        journal.append({'url': f'u{n % 3}', 'n': n})
+    assert journal.compactions == 0
+    journal.append({'url': 'u0', 'n': 9})
+    assert journal.compactions == 1
+    journal.close()
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 3
+    assert {r['url']: r['n'] for r in journal.replay()} == {'u0': 9, 'u1': 7, 'u2': 8}
+
+
+def test_reopened_journal_counts_existing_lines(tmp_path):
+    path = tmp_path / 'progress.jsonl'
+    path.write_text(''.join(f'{{"url": "a", "n": {n}}}\n' for n in range(9)), encoding='utf-8')
+    journal = CheckpointJournal(str(path), compact_min_lines=10)
+    journal.append({'url': 'a', 'n': 9})
+    journal.close()
+    assert journal.compactions == 1
+    assert journal.replay() == [{'url': 'a', 'n': 9}]
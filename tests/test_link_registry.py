@@ -0,0 +1,50 @@
+from link_registry import LinkRegistry
+
+
+def make_registry(tmp_path, **kwargs):
+    return LinkRegistry(str(tmp_path / 'links.txt'), str(tmp_path / 'links.index.jsonl'), **kwargs)
+
+
+def test_record_appends_only_unseen_slugs(tmp_path):
+    registry = make_registry(tmp_path)
+    assert registry.record([{'slug': 'a'}, {'slug': 'b'}], seen_at=100) == ['a', 'b']
+    assert registry.record([{'slug': 'a'}, {'slug': 'c'}, {}], seen_at=200) == ['c']
+    lines = (tmp_path / 'links.txt').read_text(encoding='utf-8').splitlines()
+    assert [line.rsplit('/', 1)[1] for line in lines] == ['a', 'b', 'c']
+    assert registry.urls(since=150) == ['https://earn.superteam.fun/listing/c']
+
+
+def test_index_survives_a_restart(tmp_path):
+    make_registry(tmp_path).record([{'slug': 'a'}], seen_at=100)
+    registry = make_registry(tmp_path)
+    assert 'a' in registry
+    assert registry.get('a')['first_seen'] == 100
+
+
+def test_seeds_from_an_existing_links_file(tmp_path):
+    (tmp_path / 'links.txt').write_text('https://earn.superteam.fun/listing/old\n', encoding='utf-8')
+    registry = make_registry(tmp_path)
+    assert 'old' in registry
+    assert registry.record([{'slug': 'old'}]) == []
+
+
+def test_touches_are_compacted_once_stale_lines_outnumber_live_ones(tmp_path):
+    registry = make_registry(tmp_path, touch_interval=10)
+    registry.record([{'slug': 'a'}], seen_at=1000)
+    index = tmp_path / 'links.index.jsonl'
+    registry.record([{'slug': 'a'}], seen_at=1005)
+    assert len(index.read_text(encoding='utf-8').splitlines()) == 1
+    registry.record([{'slug': 'a'}], seen_at=1020)
+    registry.record([{'slug': 'a'}], seen_at=1040)
+    assert len(index.read_text(encoding='utf-8').splitlines()) == 1
+    assert registry.seen_since(1030) == ['a']
+    assert registry.get('a')['first_seen'] == 1000
+
+
+def test_one_shared_registry_per_path(tmp_path, monkeypatch):
+    from link_registry import get_link_registry
+    monkeypatch.chdir(tmp_path)
+    registry = get_link_registry('links.txt')
+    assert get_link_registry(str(tmp_path / 'links.txt')) is registry
+    assert get_link_registry(str(tmp_path / 'other.txt')) is not registry
+    assert registry.index.path == str(tmp_path / 'links.index.jsonl')
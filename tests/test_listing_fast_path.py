@@ -0,0 +1,47 @@
+import json
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('playwright')
+
+from listing_fast_path import ListingFastPath
+from snapshot_archive import SnapshotArchive
+
+LISTING = {'slug': 'demo', 'title': 'Demo', 'description': '<p>Build a thing for the ecosystem</p>',
+           'rewards': {'1': 300, '2': 200}, 'rewardAmount': 500, 'region': 'GLOBAL', 'token': 'USDC'}
+HTML = ('<html><body><script id="__NEXT_DATA__" type="application/json">'
+        + json.dumps({'props': {'pageProps': {'bounty': LISTING}}}) + '</script></body></html>')
+
+
+class Response:
+    status_code = 200
+    text = HTML
+
+    def raise_for_status(self):
+        pass
+
+
+class Session:
+    def __init__(self):
+        self.headers = {}
+
+    def get(self, url, timeout=None):
+        return Response()
+
+
+def test_hit_is_archived_and_user_agent_is_kept(tmp_path):
+    fast_path = ListingFastPath(session=Session(), user_agent='custom-agent')
+    archive = SnapshotArchive(root=str(tmp_path / 'snapshots'))
+    record, prize_result = fast_path.extract_listing('https://x/listing/demo', 'demo', {}, archive)
+    assert record['description'] == 'Build a thing for the ecosystem'
+    assert prize_result['amounts_match']
+    assert fast_path.session.headers['User-Agent'] == 'custom-agent'
+    entry = archive.latest()['demo']
+    assert archive.load_html(entry) == HTML
+
+
+def test_miss_is_not_archived(tmp_path):
+    fast_path = ListingFastPath(session=Session())
+    archive = SnapshotArchive(root=str(tmp_path / 'snapshots'))
+    assert fast_path.extract_listing('https://x/listing/other', 'other', {}, archive) is None
+    assert archive.entries() == []
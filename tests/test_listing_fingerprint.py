@@ -0,0 +1,18 @@
+from listing_fingerprint import api_fingerprint, content_fingerprint
+
+
+def test_api_fingerprint_ignores_unrelated_fields():
+    bounty = {'id': 1, 'title': 'T', 'rewardAmount': 100, 'slug': 's'}
+    assert api_fingerprint(bounty) == api_fingerprint(dict(bounty, slug='other', views=5))
+
+
+def test_api_fingerprint_changes_with_edits_and_updated_at():
+    bounty = {'id': 1, 'title': 'T', 'rewardAmount': 100}
+    assert api_fingerprint(bounty) != api_fingerprint(dict(bounty, rewardAmount=200))
+    assert api_fingerprint(bounty) != api_fingerprint(dict(bounty, updatedAt='2024-01-02'))
+
+
+def test_content_fingerprint_covers_extracted_fields_only():
+    record = {'description': 'd', 'country_restriction': 'GLOBAL', 'extracted_prize_data': {'total_reward': 1}}
+    assert content_fingerprint(record) == content_fingerprint(dict(record, url='u'))
+    assert content_fingerprint(record) != content_fingerprint(dict(record, description='e'))
@@ -0,0 +1,30 @@
+from offline_page import OfflinePage
+
+HTML = '''<html><head><title> Listing </title><script>var x = "hidden";</script></head>
+<body><main><div class="relative flex gap-3"><p class="ml-auto">500 USDC</p><span>1st</span></div>
+<div data-testid="description-box"><p>First paragraph</p><p>Second<br>line</p></div></main></body></html>'''
+
+
+def test_title_and_selectors():
+    page = OfflinePage(HTML)
+    assert page.title() == 'Listing'
+    assert len(page.query_selector_all('div.relative.flex.gap-3, p.ml-auto')) == 2
+    assert page.query_selector('p.ml-auto').text_content() == '500 USDC'
+    assert page.query_selector('div[data-testid*="description"]') is not None
+    assert page.query_selector('div.missing') is None
+
+
+def test_body_text_skips_scripts_and_breaks_blocks():
+    text = OfflinePage(HTML).body_text()
+    assert 'hidden' not in text
+    assert 'First paragraph\nSecond\nline' in text
+
+
+def test_saved_inner_text_wins():
+    assert OfflinePage(HTML, inner_text='saved').body_text() == 'saved'
+
+
+def test_has_text_selector():
+    page = OfflinePage(HTML)
+    assert [node.text_content() for node in page.query_selector_all('p:has-text("SECOND")')] == ['Secondline']
+    assert page.query_selector('span:has-text("2nd")') is None
@@ -0,0 +1,32 @@
+import asyncio
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('playwright')
+
+from queue_worker import collect_via_queue, wait_for_drain
+from work_queue import SQLiteWorkQueue
+
+
+def test_drain_wait_gives_up_when_no_worker_makes_progress(tmp_path):
+    queue = SQLiteWorkQueue(path=str(tmp_path / 'queue.db'))
+    with pytest.raises(TimeoutError, match='no progress'):
+        asyncio.run(collect_via_queue(queue, ['a'], poll_interval=0.01, stall_timeout=0.05))
+
+
+def test_drain_wait_returns_once_a_remote_worker_finishes(tmp_path):
+    queue = SQLiteWorkQueue(path=str(tmp_path / 'queue.db'))
+    queue.enqueue(['a'])
+
+    async def remote_worker():
+        await asyncio.sleep(0.03)
+        queue.lease('remote')
+        queue.ack('a', {'ok': True}, 'remote')
+
+    async def main():
+        worker = asyncio.create_task(remote_worker())
+        counts = await wait_for_drain(queue, poll_interval=0.01, stall_timeout=1)
+        await worker
+        return counts
+
+    assert asyncio.run(main())['done'] == 1
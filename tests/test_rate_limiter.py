@@ -0,0 +1,54 @@
+from page_pool import AdaptiveRateLimiter
+
+
+def test_successes_raise_the_rate_up_to_max():
+    limiter = AdaptiveRateLimiter(requests_per_second=1.0, max_rps=2.0, increase=1.0)
+    for _ in range(20):
+        limiter.record(status=200)
+    assert limiter.rate == 2.0
+    assert limiter.successes == 20
+
+
+def test_throttling_backs_off_once_per_cooldown():
+    limiter = AdaptiveRateLimiter(requests_per_second=4.0, decrease=0.5, cooldown=60)
+    limiter.record(status=429)
+    limiter.record(status=503)
+    assert limiter.rate == 2.0
+    assert limiter.backoffs == {'http_429': 1}
+
+
+def test_back_off_stops_at_min_rps():
+    limiter = AdaptiveRateLimiter(requests_per_second=1.0, min_rps=0.5, decrease=0.1, cooldown=0)
+    limiter.record(error=TimeoutError('Timeout 30000ms exceeded'))
+    assert limiter.rate == 0.5
+    assert limiter.backoffs == {'timeout': 1}
+
+
+def test_latency_spike_backs_off():
+    limiter = AdaptiveRateLimiter(requests_per_second=2.0, latency_factor=2.0, cooldown=0)
+    for _ in range(5):
+        limiter.record(status=200, latency=0.1)
+    for _ in range(10):
+        limiter.record(status=200, latency=2.0)
+    assert limiter.backoffs.get('latency')
+    assert limiter.low_rate < 2.0
+
+
+def test_disabled_limiter_still_records():
+    limiter = AdaptiveRateLimiter(requests_per_second=0)
+    assert not limiter.enabled
+    limiter.record(status=500)
+    assert limiter.backoffs == {'http_500': 1}
+
+
+def test_latency_baseline_is_relearned_after_a_back_off():
+    limiter = AdaptiveRateLimiter(requests_per_second=4.0, latency_factor=2.0, cooldown=0)
+    for _ in range(5):
+        limiter.record(status=200, latency=0.1)
+    for _ in range(10):
+        limiter.record(status=200, latency=1.0)
+    backoffs = limiter.backoffs['latency']
+    # The site stays at the new, slower latency; that is the new normal, not a reason to keep backing off
+    for _ in range(50):
+        limiter.record(status=200, latency=1.0)
+    assert limiter.backoffs['latency'] == backoffs
@@ -0,0 +1,26 @@
+from request_filter import RequestFilterPolicy, default_request_filter
+
+
+class Response:
+    def __init__(self, url, size):
+        self.url = url
+        self.headers = {'content-length': str(size)}
+
+
+def test_allowed_patterns_win_over_blocked_types():
+    policy = RequestFilterPolicy(blocked_resource_types=['image'], allowed_url_patterns=['*/logo.png'])
+    assert policy.should_block('https://x/a.png', 'image')
+    assert not policy.should_block('https://x/logo.png', 'image')
+    assert default_request_filter().should_block('https://www.google-analytics.com/collect', 'xhr')
+
+
+def test_seen_sizes_are_capped_and_reset():
+    policy = RequestFilterPolicy(max_seen_sizes=2)
+    for i in range(5):
+        policy._record_response(Response(f'https://x/{i}', 100))
+    assert list(policy._seen_sizes) == ['https://x/3', 'https://x/4']
+    assert policy.allowed_bytes == 500
+
+    policy.reset()
+    assert policy._seen_sizes == {}
+    assert policy.allowed_requests == 0
@@ -0,0 +1,35 @@
+import random
+from run_metrics import Histogram, RunMetrics
+
+
+def test_histogram_keeps_a_bounded_reservoir():
+    histogram = Histogram(max_samples=100, rng=random.Random(1))
+    for i in range(10000):
+        histogram.observe(i / 10000)
+    assert len(histogram.samples) == 100
+    assert histogram.count == 10000
+    assert histogram.max == 0.9999
+    assert 0.35 < histogram.quantile(0.5) < 0.65
+    assert histogram.bucket_counts[-1] == 10000
+
+
+def test_timer_counts_errors_and_reraises():
+    metrics = RunMetrics()
+    try:
+        with metrics.timer('goto'):
+            raise ValueError('boom')
+    except ValueError:
+        pass
+    assert metrics.errors == {'goto': 1}
+    assert metrics.stages['goto'].count == 1
+
+
+def test_reset_starts_a_new_window():
+    metrics = RunMetrics()
+    metrics.page('browser')
+    metrics.observe('goto', 0.2)
+    metrics.set_gauge('request_rate', 2.0)
+    metrics.reset()
+    assert metrics.pages == {} and metrics.stages == {} and metrics.gauges == {}
+    metrics.page('fast_path')
+    assert 'bounty_pages_total{source="fast_path"} 1' in metrics.prometheus_text()
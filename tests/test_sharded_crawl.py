@@ -0,0 +1,41 @@
+import json
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('playwright')
+
+import bounty_scraper
+import state_store
+from checkpoint_journal import CheckpointJournal
+from sharded_crawl import ShardedCrawl
+from state_store import BountyStateStore
+from strategy_ranker import StrategyRanker
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(state_store, 'project_root', str(tmp_path))
+    store = BountyStateStore(str(tmp_path / 'state.db'))
+    monkeypatch.setattr(bounty_scraper, 'get_strategy_ranker', lambda: StrategyRanker(state_store=store))
+    scraper = bounty_scraper.ImprovedSuperteamBountyScraper(links_file=str(tmp_path / 'links.txt'),
+                                                            state_store=store)
+    yield scraper
+    store.close()
+
+
+def test_merge_leaves_the_descriptions_view_to_the_store(scraper, tmp_path):
+    urls = ['https://earn.superteam.fun/listing/a', 'https://earn.superteam.fun/listing/b']
+    crawl = ShardedCrawl(shards=1, shard_dir=str(tmp_path / 'shards'), scraper=scraper)
+    journal = CheckpointJournal(str(tmp_path / 'shards' / 'shard-0.jsonl'), key='result.url')
+    for url in reversed(urls):
+        scraper.checkpoint(journal, {'url': url, 'slug': url.rsplit('/', 1)[1], 'description': 'ok',
+                                     'country_restriction': 'GLOBAL'})
+    journal.close()
+
+    crawl.merge(urls)
+
+    # Same plain-list format export_views() writes for every other entry point
+    exported = json.loads((tmp_path / 'output' / 'bounty_descriptions.json').read_text(encoding='utf-8'))
+    assert [r['slug'] for r in exported] == ['a', 'b']
+    assert scraper.state_store.stale_views.isdisjoint({'descriptions'})
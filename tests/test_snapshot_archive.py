@@ -0,0 +1,25 @@
+import asyncio
+
+from offline_page import AsyncOfflinePage, OfflinePage
+from snapshot_archive import SnapshotArchive
+
+HTML = '<html><head><title>Listing</title></head><body><p>Rendered</p></body></html>'
+
+
+def test_capture_round_trips_html_and_text(tmp_path):
+    archive = SnapshotArchive(root=str(tmp_path / 'snapshots'))
+
+    entry = asyncio.run(archive.capture(AsyncOfflinePage(OfflinePage(HTML)), 'slug', 'https://example.com/slug'))
+
+    assert archive.latest()['slug'] == entry
+    assert archive.load_html(entry) == HTML
+    assert archive.load_text(entry) == 'Rendered'
+
+
+def test_identical_pages_share_one_object(tmp_path):
+    archive = SnapshotArchive(root=str(tmp_path / 'snapshots'), store_text=False)
+    first = archive.save('a', 'https://example.com/a', HTML)
+    second = archive.save('b', 'https://example.com/b', HTML)
+
+    assert first['html_sha256'] == second['html_sha256']
+    assert len(list((tmp_path / 'snapshots' / 'objects').rglob('*.gz'))) == 1
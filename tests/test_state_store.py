@@ -0,0 +1,79 @@
+import json
+import pytest
+import state_store
+from state_store import BountyStateStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    # Keep the one-time JSON migration away from the real data/ files
+    monkeypatch.setattr(state_store, 'project_root', str(tmp_path))
+    store = BountyStateStore(str(tmp_path / 'state.db'))
+    yield store
+    store.close()
+
+
+def test_listings_upsert_by_id(store):
+    store.upsert_listings([{'id': '1', 'slug': 'a', 'title': 'old'}, {'id': '2', 'slug': 'b'}])
+    store.upsert_listings([{'id': '1', 'slug': 'a', 'title': 'new'}])
+    assert store.listing_by_slug('a')['title'] == 'new'
+    assert sorted(b['slug'] for b in store.listings_by_slugs(['b', 'a', 'missing'], chunk_size=1)) == ['a', 'b']
+
+
+def test_unprocessed_listings_skip_processed_ids(store):
+    store.upsert_listings([{'id': '1', 'slug': 'a'}, {'id': '2', 'slug': 'b'}])
+    store.mark_processed(['1', '1'])
+    assert [b['id'] for b in store.unprocessed_listings()] == ['2']
+    assert store.processed_ids() == {'1'}
+
+
+def test_fingerprints_keep_stored_values_for_none(store):
+    store.save_fingerprints([('1', 'a', 'api-1', 'content-1')])
+    store.save_fingerprints([('1', 'a', 'api-2', None)])
+    assert store.api_fingerprints() == {'1': 'api-2'}
+    assert store.content_fingerprint('a') == 'content-1'
+
+
+def test_strategy_stats_accumulate(store):
+    store.add_strategy_stats([('x', 'a', 2, 1)])
+    store.add_strategy_stats([('x', 'a', 3, 0)])
+    assert store.strategy_stats() == {('x', 'a'): (5, 1)}
+
+
+def test_export_descriptions_writes_current_rows(store, tmp_path):
+    store.upsert_descriptions([{'slug': 'a', 'description': 'one'}])
+    store.upsert_descriptions([{'slug': 'a', 'description': 'two'}])
+    path = tmp_path / 'out' / 'descriptions.json'
+    store.export_descriptions(str(path))
+    assert json.loads(path.read_text(encoding='utf-8')) == [{'slug': 'a', 'description': 'two'}]
+
+
+def test_migrates_legacy_json_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_store, 'project_root', str(tmp_path))
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'data' / 'processed_bounties.json').write_text('["7"]', encoding='utf-8')
+    store = BountyStateStore(str(tmp_path / 'state.db'))
+    assert store.processed_ids() == {'7'}
+    store.close()
+    (tmp_path / 'data' / 'processed_bounties.json').write_text('["8"]', encoding='utf-8')
+    store = BountyStateStore(str(tmp_path / 'state.db'))
+    assert store.processed_ids() == {'7'}
+    store.close()
+
+
+def test_export_views_writes_only_stale_views(store, tmp_path):
+    paths = {'processed': str(tmp_path / 'processed.json'), 'listings': str(tmp_path / 'listings.json')}
+    assert store.export_views(paths) == []
+    store.mark_processed(['1'])
+    assert store.export_views(paths) == ['processed']
+    assert json.loads((tmp_path / 'processed.json').read_text(encoding='utf-8')) == ['1']
+    assert not (tmp_path / 'listings.json').exists()
+    assert store.export_views(paths) == []
+    assert store.export_views(paths, force=True) == ['descriptions', 'listings', 'processed']
+
+
+def test_description_upserts_mark_the_view_stale(store, tmp_path):
+    store.upsert_descriptions([{'slug': 'a', 'description': 'one'}])
+    path = tmp_path / 'descriptions.json'
+    assert store.export_views({'descriptions': str(path)}) == ['descriptions']
+    assert store.export_views({'descriptions': str(path)}) == []
@@ -0,0 +1,48 @@
+import random
+from strategy_ranker import StrategyRanker
+
+
+class FakeStore:
+    def __init__(self, stats=None):
+        self.stats = dict(stats or {})
+        self.added = []
+
+    def strategy_stats(self):
+        return dict(self.stats)
+
+    def add_strategy_stats(self, rows):
+        self.added.extend(rows)
+
+
+def test_priority_order_is_kept_without_data():
+    ranker = StrategyRanker(state_store=FakeStore(), exploration=0)
+    assert ranker.order('country', ['a', 'b', 'c', 'fallback'], fallbacks=['fallback']) == ['a', 'b', 'c', 'fallback']
+
+
+def test_better_hit_rate_does_not_jump_the_cascade():
+    store = FakeStore({('x', 'a'): (10, 1), ('x', 'b'): (10, 9)})
+    ranker = StrategyRanker(state_store=store, exploration=0)
+    assert ranker.order('x', ['a', 'b']) == ['a', 'b']
+
+
+def test_never_matching_strategy_moves_behind_the_rest_but_before_fallbacks():
+    store = FakeStore({('x', 'a'): (10, 0), ('x', 'b'): (10, 5)})
+    ranker = StrategyRanker(state_store=store, exploration=0)
+    assert ranker.order('x', ['a', 'b', 'c', 'fb'], fallbacks=['fb']) == ['b', 'c', 'a', 'fb']
+
+
+def test_exploration_uses_the_full_priority_order():
+    store = FakeStore({('x', 'a'): (10, 0)})
+    ranker = StrategyRanker(state_store=store, exploration=1, rng=random.Random(0))
+    assert ranker.order('x', ['a', 'b']) == ['a', 'b']
+
+
+def test_record_counts_attempts_and_flushes_increments():
+    store = FakeStore()
+    ranker = StrategyRanker(state_store=store, flush_every=2, min_attempts=1)
+    ranker.record('x', ['a', 'b'], 'b')
+    assert store.added == []
+    ranker.record('x', ['a'], None)
+    assert sorted(store.added) == [('x', 'a', 2, 0), ('x', 'b', 1, 1)]
+    assert ranker.never_matches('x', 'a')
+    assert not ranker.never_matches('x', 'b')
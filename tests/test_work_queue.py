@@ -0,0 +1,68 @@
+import time
+from work_queue import SQLiteWorkQueue
+
+
+def make_queue(tmp_path, **kwargs):
+    return SQLiteWorkQueue(path=str(tmp_path / 'queue.db'), **kwargs)
+
+
+def test_lease_hides_item_until_it_expires(tmp_path):
+    queue = make_queue(tmp_path, visibility_timeout=0.05)
+    queue.enqueue(['a'])
+    assert queue.lease('w1') == ['a']
+    assert queue.lease('w2') == []
+    time.sleep(0.1)
+    assert queue.lease('w2') == ['a']
+    # The first worker lost its lease, so its late ack is rejected
+    assert not queue.ack('a', {'ok': True}, 'w1')
+    assert queue.ack('a', {'ok': True}, 'w2')
+    assert queue.results() == {'a': {'ok': True}}
+
+
+def test_expired_lease_on_last_attempt_is_dead_lettered(tmp_path):
+    queue = make_queue(tmp_path, visibility_timeout=0.05, max_attempts=1)
+    queue.enqueue(['a'])
+    assert queue.lease('w1') == ['a']
+    time.sleep(0.1)
+    assert queue.lease('w2') == []
+    assert queue.dead_letters() == [{'item': 'a', 'attempts': 1, 'error': 'lease expired'}]
+
+
+def test_failures_retry_then_dead_letter(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=2, retry_delay=0)
+    queue.enqueue(['a'])
+    queue.lease('w1')
+    assert queue.fail('a', 'boom', 'w1') == 'pending'
+    assert queue.lease('w1') == ['a']
+    assert queue.fail('a', 'boom again', 'w1') == 'dead'
+    assert queue.counts()['dead'] == 1
+    assert queue.is_drained()
+
+    assert queue.requeue_dead() == 1
+    assert queue.lease('w1') == ['a']
+
+
+def test_enqueue_revives_dead_items_and_reports_done_ones(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=1)
+    queue.enqueue(['dead', 'done', 'pending'])
+    assert queue.lease('w1', batch_size=2) == ['dead', 'done']
+    queue.fail('dead', 'boom', 'w1')
+    queue.ack('done', {'ok': True}, 'w1')
+
+    counts = queue.enqueue(['dead', 'done', 'pending', 'new'])
+    assert counts == {'added': 1, 'requeued': 1, 'done': 1, 'in_progress': 1}
+    assert queue.dead_letters() == []
+    assert queue.results() == {'done': {'ok': True}}
+    assert sorted(queue.lease('w1', batch_size=5)) == ['dead', 'new', 'pending']
+
+
+def test_extend_keeps_a_slow_lease(tmp_path):
+    queue = make_queue(tmp_path, visibility_timeout=0.1)
+    queue.enqueue(['a'])
+    queue.lease('w1')
+    time.sleep(0.06)
+    assert queue.extend('a', 'w1')
+    assert not queue.extend('a', 'w2')
+    time.sleep(0.06)
+    assert queue.lease('w2') == []
+    assert queue.ack('a', {'ok': True}, 'w1')